@@ -446,21 +446,8 @@ class LLMClient:
         }
 
 
-class MockLLMClient:
-    """Mock LLM client for testing and development."""
-    
-    def __init__(self):
-        self.call_count = 0
-    
-    async def generate_completion(self, **kwargs) -> LLMResponse:
-        """Generate a mock response."""
-        self.call_count += 1
-        
-        # Simulate API delay
-        await asyncio.sleep(0.1)
-        
-        # Return a mock scenario response
-        mock_content = """{
+# Canned scenario returned by MockLLMClient for every request.
+MOCK_SCENARIO_CONTENT = """{
   "scenario": {
     "title": "Mock E-commerce Checkout Button Test",
     "narrative": "We want to test a more prominent checkout button on our e-commerce site to improve conversion rates.",
@@ -492,6 +479,23 @@ class MockLLMClient:
     "notes": "These are suggestions only; use your simulator for ground truth."
   }
 }"""
+
+
+class MockLLMClient:
+    """Mock LLM client for testing and development."""
+    
+    def __init__(self):
+        self.call_count = 0
+    
+    async def generate_completion(self, **kwargs) -> LLMResponse:
+        """Generate a mock response."""
+        self.call_count += 1
+        
+        # Simulate API delay
+        await asyncio.sleep(0.1)
+        
+        # Return a mock scenario response
+        mock_content = MOCK_SCENARIO_CONTENT
         
         return LLMResponse(
             content=mock_content,
@@ -381,7 +381,7 @@ Return ONLY valid JSON."""
                         await asyncio.sleep(1.0 * (attempt + 1))  # Exponential backoff
                         continue
                 
-                except (ValueError, TypeError, KeyError) as e:
+                except (ValueError, TypeError, KeyError, AttributeError) as e:
                     result.errors.append(f"Unexpected error on attempt {attempt + 1}: {str(e)}")
                     logger.error(f"Unexpected error on attempt {attempt + 1}: {e}")
 
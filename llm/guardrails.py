@@ -60,6 +60,9 @@ Usage Examples:
         guardrails = LLMGuardrails()
         result = guardrails.validate_scenario(scenario_dto)
     
+    Batch validation:
+        results = guardrails.validate_batch(candidate_dtos)
+    
     Parameter clamping:
         clamped_scenario, clamped_values = guardrails.clamp_parameters(scenario_dto)
     
@@ -76,8 +79,19 @@ Dependencies:
 - logging: Built-in logging support
 """
 
-from typing import Dict, List, Optional, Tuple
+import math
+import sys
+from bisect import bisect_right
+from collections import Counter, deque
+from itertools import compress
+from operator import attrgetter
+from typing import Deque, Dict, List, NamedTuple, Optional, Sequence, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
+from enum import Enum, IntEnum
+from types import MappingProxyType
+
+import numpy as np
 
 from schemas.scenario import ScenarioResponseDTO
 from schemas.shared import (
@@ -89,7 +103,323 @@ from core.logging import get_logger
 logger = get_logger(__name__)
 
 
-@dataclass
+class ValidationErrorCode(IntEnum):
+    """Machine-readable tag recorded alongside each error/warning message."""
+    BOUNDS_OUT_OF_RANGE = 1
+    ALLOCATION_SUM = 2
+    PARAMETER_MISMATCH = 3
+    MATH_INCONSISTENT = 4
+    INVALID_ENUM = 5
+    CONTEXT_MISMATCH = 6
+    UNREALISTIC_VALUE = 7
+    LIFT_AMBITIOUS = 8
+
+
+# Regeneration hint for each code; codes without an entry produce no hint
+HINT_BY_CODE = MappingProxyType({
+    ValidationErrorCode.BOUNDS_OUT_OF_RANGE: "Ensure all parameters are within the specified bounds",
+    ValidationErrorCode.ALLOCATION_SUM: "Ensure allocation proportions sum to exactly 1.0",
+    ValidationErrorCode.PARAMETER_MISMATCH: "Ensure parameter consistency between design and expected outcomes",
+    ValidationErrorCode.MATH_INCONSISTENT: "Ensure parameter consistency between design and expected outcomes",
+    ValidationErrorCode.CONTEXT_MISMATCH: "Ensure scenario content matches the specified company type and user segment",
+    ValidationErrorCode.UNREALISTIC_VALUE: "Use more realistic parameter values for the business context",
+    ValidationErrorCode.LIFT_AMBITIOUS: "Consider more conservative target lift values",
+})
+
+# Substring fallbacks for messages added without a code (e.g. appended
+# directly to ValidationResult.errors/warnings by callers)
+_UNTAGGED_ERROR_PATTERNS = (
+    ("outside valid range", ValidationErrorCode.BOUNDS_OUT_OF_RANGE),
+    ("must sum to 1.0", ValidationErrorCode.ALLOCATION_SUM),
+    ("doesn't match", ValidationErrorCode.PARAMETER_MISMATCH),
+)
+_UNTAGGED_WARNING_PATTERNS = (
+    ("doesn't seem to match", ValidationErrorCode.CONTEXT_MISMATCH),
+    ("seems high", ValidationErrorCode.UNREALISTIC_VALUE),
+    ("seems low", ValidationErrorCode.UNREALISTIC_VALUE),
+    ("seems ambitious", ValidationErrorCode.LIFT_AMBITIOUS),
+)
+
+
+def _classify_untagged(message: str, patterns) -> Optional[ValidationErrorCode]:
+    """Return the code of the first pattern found in message, if any."""
+    for pattern, code in patterns:
+        if pattern in message:
+            return code
+    return None
+
+
+# Allowed deviation of control + treatment allocation from 1.0
+_ALLOCATION_TOLERANCE = 0.001
+
+
+# Bit flags returned by _check_consistency
+FLAG_BASELINE_CONTROL_MISMATCH = 1 << 0
+FLAG_LIFT_MISMATCH = 1 << 1
+FLAG_MATH_INCONSISTENT = 1 << 2
+FLAG_MDE_TOO_LARGE = 1 << 3
+
+
+def _check_consistency(
+    baseline: float,
+    control_rate: float,
+    treatment_rate: float,
+    target_lift: float,
+    mde_absolute: float,
+) -> int:
+    """
+    Run the numeric consistency checks for one scenario.
+
+    Returns a bitmask of FLAG_* values; 0 means every check passed. Callers
+    only build error/warning messages for the bits that are set. Tolerance
+    checks use math.isclose with rel_tol=0, so NaN inputs count as mismatches.
+    """
+    flags = 0
+    if not math.isclose(baseline, control_rate, rel_tol=0.0, abs_tol=0.001):
+        flags |= FLAG_BASELINE_CONTROL_MISMATCH
+    if baseline > 0:
+        # One division shared by the lift and MDE checks
+        inv_baseline = 1.0 / baseline
+        actual_lift = (treatment_rate - baseline) * inv_baseline
+        if not math.isclose(actual_lift, target_lift, rel_tol=0.0, abs_tol=0.05):  # 5% tolerance
+            flags |= FLAG_LIFT_MISMATCH
+        expected_target_lift = mde_absolute * inv_baseline
+    else:
+        expected_target_lift = 0
+    if not math.isclose(target_lift, expected_target_lift, rel_tol=0.0, abs_tol=0.001):  # 0.1% tolerance
+        flags |= FLAG_MATH_INCONSISTENT
+    if mde_absolute > baseline * 0.5:
+        flags |= FLAG_MDE_TOO_LARGE
+    return flags
+
+
+# Traffic tier definitions for different company stages
+_TRAFFIC_TIER_RANGES = MappingProxyType({
+    TrafficTier.EARLY_STAGE: (100, 1_000),
+    TrafficTier.GROWTH: (1_000, 10_000),
+    TrafficTier.SCALE: (10_000, 100_000),
+    TrafficTier.ENTERPRISE: (100_000, 10_000_000)
+})
+
+# Metric-specific baseline ranges for realistic scenarios
+_METRIC_BASELINE_RANGES = MappingProxyType({
+    # Conversion metrics - typically low
+    MetricType.CONVERSION_RATE: (0.001, 0.15),
+    MetricType.SIGNUP_RATE: (0.01, 0.40),
+    MetricType.ACTIVATION_RATE: (0.10, 0.80),
+    MetricType.PURCHASE_RATE: (0.005, 0.20),
+    MetricType.CHECKOUT_COMPLETION: (0.30, 0.85),
+    MetricType.FORM_COMPLETION: (0.10, 0.70),
+
+    # Engagement metrics - varies widely
+    MetricType.CLICK_THROUGH_RATE: (0.005, 0.30),
+    MetricType.ENGAGEMENT_RATE: (0.05, 0.60),
+    MetricType.FEATURE_ADOPTION: (0.01, 0.50),
+    MetricType.CONTENT_COMPLETION: (0.20, 0.80),
+    MetricType.VIDEO_COMPLETION: (0.15, 0.70),
+    MetricType.SHARE_RATE: (0.001, 0.10),
+
+    # Retention metrics - typically moderate to high
+    MetricType.DAY_1_RETENTION: (0.20, 0.70),
+    MetricType.DAY_7_RETENTION: (0.10, 0.50),
+    MetricType.DAY_30_RETENTION: (0.05, 0.35),
+    MetricType.WEEKLY_RETENTION: (0.30, 0.80),
+    MetricType.MONTHLY_RETENTION: (0.20, 0.70),
+    MetricType.CHURN_RATE: (0.01, 0.20),
+
+    # Quality metrics - typically low (errors) or moderate (bounce)
+    MetricType.ERROR_RATE: (0.001, 0.10),
+    MetricType.BOUNCE_RATE: (0.20, 0.70),
+    MetricType.SUPPORT_CONTACT_RATE: (0.01, 0.15),
+    MetricType.REFUND_RATE: (0.01, 0.10),
+    MetricType.NPS_PROMOTER_RATE: (0.20, 0.70),
+})
+
+# Primary KPIs suited to proportion-based testing: the tuple keeps the order
+# shown in the warning, the frozenset serves membership checks
+_PROPORTION_KPIS = ('conversion_rate', 'click_through_rate', 'engagement_rate')
+_PROPORTION_KPI_SET = frozenset(_PROPORTION_KPIS)
+_NON_PROPORTION_KPI_WARNING = (
+    "Primary KPI '{}' may not be appropriate for proportion-based testing. "
+    f"Consider using: {list(_PROPORTION_KPIS)}"
+)
+
+
+def _realism_thresholds(low: float, high: float) -> Tuple[float, float]:
+    """
+    Thresholds for bisect_right that split values into below/within/above.
+
+    The upper threshold is moved up by one ulp so a value exactly equal to
+    `high` still lands in the middle band, matching `value > high`.
+    """
+    return (low, math.nextafter(high, math.inf))
+
+
+# Realism bands: (field_name, thresholds, (below, within, above) messages,
+# (below, within, above) codes, result list). Only informational - extreme
+# values produce warnings or suggestions, never errors.
+_REALISM_BANDS = (
+    (
+        'baseline_conversion_rate',
+        _realism_thresholds(0.001, 0.8),  # 0.1% / 80% - truly extreme
+        (
+            "Baseline conversion rate {:.1%} is very low - ensure this is realistic for the metric type",
+            None,
+            "Baseline conversion rate {:.1%} is very high - ensure this is realistic for the metric type",
+        ),
+        (ValidationErrorCode.UNREALISTIC_VALUE, None, ValidationErrorCode.UNREALISTIC_VALUE),
+        'warnings',
+    ),
+    (
+        'target_lift_pct',
+        _realism_thresholds(-0.5, 2.0),  # -50% / 200% relative lift
+        (
+            "Target lift {:.1%} suggests significant negative impact expected",
+            None,
+            "Target lift {:.1%} is very ambitious - consider if this is achievable",
+        ),
+        (ValidationErrorCode.UNREALISTIC_VALUE, None, ValidationErrorCode.LIFT_AMBITIOUS),
+        'warnings',
+    ),
+    (
+        'expected_daily_traffic',
+        _realism_thresholds(100, 10_000_000),  # Very small / 10M daily
+        (
+            "Daily traffic {:,} is very low - experiment duration may be very long",
+            None,
+            "Daily traffic {:,} is enterprise-scale - ensure experiment can handle this volume",
+        ),
+        (ValidationErrorCode.UNREALISTIC_VALUE, None, ValidationErrorCode.UNREALISTIC_VALUE),
+        'warnings',
+    ),
+    (
+        'power',
+        _realism_thresholds(0.6, 0.95),
+        (
+            "Power {:.1%} is low - results may be directional only, higher risk of false negatives",
+            None,
+            "Power {:.1%} is very high - consider if this precision is needed vs. faster iteration",
+        ),
+        (None, None, None),
+        'suggestions',
+    ),
+)
+
+
+# Design parameters checked against LLMGuardrails.bounds, with the label and
+# any trailing guidance used in their out-of-range error message
+_DESIGN_PARAM_LABELS = (
+    ('baseline_conversion_rate', 'Baseline conversion rate', ''),
+    ('mde_absolute', 'MDE absolute', ' (must be a raw ratio between 0.001-0.1, not absolute time/revenue)'),
+    ('target_lift_pct', 'Target lift', ''),
+    ('alpha', 'Alpha', ''),
+    ('power', 'Power', ''),
+    ('expected_daily_traffic', 'Daily traffic', ''),
+)
+
+# Numeric inputs validate_batch reads from each candidate, in its column order
+_batch_design_values = attrgetter(
+    'baseline_conversion_rate',
+    'mde_absolute',
+    'target_lift_pct',
+    'alpha',
+    'power',
+    'expected_daily_traffic',
+    'allocation.control',
+    'allocation.treatment',
+)
+_batch_hint_values = attrgetter('control_conversion_rate', 'treatment_conversion_rate')
+
+# Fields clamp_parameters clamps, in the order they are reported
+_CLAMPED_DESIGN_PARAMS = (
+    'baseline_conversion_rate',
+    'target_lift_pct',
+    'alpha',
+    'power',
+    'expected_daily_traffic',
+)
+_CLAMPED_SIMULATION_HINTS = ('control_conversion_rate', 'treatment_conversion_rate')
+
+# Reads every checked design parameter, in _DESIGN_PARAM_LABELS order, in one C call
+_design_param_values = attrgetter(*(field_name for field_name, _, _ in _DESIGN_PARAM_LABELS))
+
+
+def _build_canned_scenario_response_dto() -> ScenarioResponseDTO:
+    """Build a small, valid scenario used to exercise the validators at startup."""
+    return ScenarioResponseDTO.model_validate({
+        "scenario": {
+            "title": "Checkout Button Color Change AB Test",
+            "narrative": (
+                "An e-commerce company tests whether a higher-contrast checkout "
+                "button increases purchase conversion for all visitors."
+            ),
+            "company_type": "E-commerce",
+            "user_segment": "all_users",
+            "primary_kpi": "conversion_rate",
+            "unit": "visitor",
+        },
+        "design_params": {
+            "baseline_conversion_rate": 0.025,
+            "mde_absolute": 0.005,
+            "target_lift_pct": 0.20,
+            "alpha": 0.05,
+            "power": 0.80,
+            "allocation": {"control": 0.5, "treatment": 0.5},
+            "expected_daily_traffic": 5000,
+        },
+        "llm_expected": {
+            "simulation_hints": {
+                "control_conversion_rate": 0.025,
+                "treatment_conversion_rate": 0.030,
+            },
+            "narrative_conclusion": "Treatment is expected to lift conversion.",
+            "business_interpretation": "A higher-contrast button reduces checkout friction.",
+            "risk_assessment": "Low risk; the change is cosmetic.",
+            "next_steps": "Roll out if the lift is significant.",
+        },
+        "scenario_id": "warmup",
+        "created_at": "1970-01-01T00:00:00Z",
+    })
+
+
+@lru_cache(maxsize=1024)
+def _quality_score(
+    baseline: float,
+    target_lift: float,
+    control_rate: float,
+    narrative_len: int,
+    title_len: int
+) -> float:
+    """
+    Quality score for the inputs LLMGuardrails.get_quality_score reads.
+
+    Cached because validate -> clamp -> validate cycles score the same
+    parameters repeatedly.
+    """
+    # Each rule contributes its weight when its condition holds (bools
+    # act as 0/1), applied in a fixed order so the result is exact
+    score = (
+        1.0
+        # Deduct for truly extreme/impossible values only
+        - 0.2 * (baseline > 0.95)  # Can't have >95% baseline
+        - 0.2 * (baseline < 0.0001)  # Too small to measure
+        # Deduct for impossible lifts
+        - 0.2 * (target_lift > 5.0)  # 500% lift is unrealistic
+        - 0.2 * (target_lift < -0.9)  # -90% would eliminate the metric
+        # Deduct for internal inconsistency between baseline and simulation hints
+        - 0.1 * (abs(baseline - control_rate) > 0.01)  # Allow 1% tolerance
+        # Bonus for rich narrative content
+        + 0.05 * (narrative_len > 200)
+        + 0.05 * (title_len > 30)
+        # Deduct for missing or minimal content
+        - 0.15 * (narrative_len < 50)
+        - 0.1 * (title_len < 10)
+    )
+
+    return max(0.0, min(1.0, score))
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """
     Comprehensive result dataclass for guardrail validation operations.
@@ -103,6 +433,10 @@ class ValidationResult:
         quality_score (float): Quantitative quality score (0-1)
         errors (List[str]): List of validation errors that must be fixed
         warnings (List[str]): List of warnings about potential issues
+        error_codes (List[Optional[ValidationErrorCode]]): Code for each entry
+            in errors (same order), or None for untagged messages
+        warning_codes (List[Optional[ValidationErrorCode]]): Code for each
+            entry in warnings (same order), or None for untagged messages
         suggestions (List[str]): List of suggestions for improvement
         clamped_values (Dict[str, Tuple[float, float]]): Dictionary mapping
             field names to (original_value, clamped_value) tuples for parameters
@@ -136,6 +470,8 @@ class ValidationResult:
     warnings: List[str] = None
     suggestions: List[str] = None
     clamped_values: Dict[str, Tuple[float, float]] = None  # field_name: (original, clamped)
+    error_codes: List[Optional[ValidationErrorCode]] = None
+    warning_codes: List[Optional[ValidationErrorCode]] = None
     
     def __post_init__(self):
         """Initialize empty lists and dictionaries if None."""
@@ -147,6 +483,36 @@ class ValidationResult:
             self.suggestions = []
         if self.clamped_values is None:
             self.clamped_values = {}
+        if self.error_codes is None:
+            self.error_codes = []
+        if self.warning_codes is None:
+            self.warning_codes = []
+        _pad_codes(self.errors, self.error_codes)
+        _pad_codes(self.warnings, self.warning_codes)
+    
+    def add_error(self, message: str, code: Optional[ValidationErrorCode] = None):
+        """Record an error message together with its code."""
+        _pad_codes(self.errors, self.error_codes)
+        self.errors.append(message)
+        self.error_codes.append(code)
+    
+    def add_warning(self, message: str, code: Optional[ValidationErrorCode] = None):
+        """Record a warning message together with its code."""
+        _pad_codes(self.warnings, self.warning_codes)
+        self.warnings.append(message)
+        self.warning_codes.append(code)
+
+
+def _pad_codes(messages: List[str], codes: List[Optional[ValidationErrorCode]]) -> None:
+    """
+    Give messages appended without add_error/add_warning a None code.
+
+    Keeps codes[i] describing messages[i] when callers mix plain
+    errors.append / warnings.append with the add_* methods.
+    """
+    missing = len(messages) - len(codes)
+    if missing > 0:
+        codes.extend([None] * missing)
 
 
 class GuardrailError(Exception):
@@ -154,6 +520,37 @@ class GuardrailError(Exception):
     pass
 
 
+def _build_bound_tables(bounds) -> Tuple[MappingProxyType, tuple, tuple, tuple, tuple]:
+    """
+    Precompute everything the bounds checks need from LLMGuardrails.bounds.
+
+    Returns, in order: the "[low, high]" display string for every bound; the
+    design-parameter check table, where each entry is (low, high,
+    message_template) in _DESIGN_PARAM_LABELS order with the range already
+    baked into the message; the matching table for the simulated
+    control/treatment rates; and the (field_name, low, high) clamp tables for
+    design parameters and simulation hints used by clamp_parameters.
+    """
+    bounds_repr = MappingProxyType({
+        name: f"[{low}, {high}]" for name, (low, high) in bounds.items()
+    })
+    design_param_checks = tuple(
+        (*bounds[field_name], f"{label} {{}} is outside valid range {bounds_repr[field_name]}{suffix}")
+        for field_name, label, suffix in _DESIGN_PARAM_LABELS
+    )
+    rate_checks = tuple(
+        (*bounds[rate_name], f"{rate_name} {{}} is outside valid range {bounds_repr[rate_name]}")
+        for rate_name in _CLAMPED_SIMULATION_HINTS
+    )
+    design_param_clamps = tuple(
+        (field_name, *bounds[field_name]) for field_name in _CLAMPED_DESIGN_PARAMS
+    )
+    simulation_hint_clamps = tuple(
+        (field_name, *bounds[field_name]) for field_name in _CLAMPED_SIMULATION_HINTS
+    )
+    return bounds_repr, design_param_checks, rate_checks, design_param_clamps, simulation_hint_clamps
+
+
 class LLMGuardrails:
     """
     Comprehensive guardrails for LLM output validation and parameter bounds checking.
@@ -172,22 +569,31 @@ class LLMGuardrails:
         - Regeneration hints for failed validations
         - Comprehensive error reporting and suggestions
     
-    Validation Layers:
+    Validation Layers (cheapest first):
         1. Parameter Bounds: Statistical parameter range validation
-        2. Business Context: Company type and user segment consistency
-        3. Parameter Consistency: Mathematical relationship validation
-        4. Metric Consistency: Proportion-based metric validation
+        2. Parameter Consistency: Mathematical relationship validation
+        3. Metric Consistency: Proportion-based metric validation
+        4. Business Context: Company type and user segment consistency
         5. Realism Checks: Feasibility and business realism assessment
     
+    A scenario that fails the bounds layer will be rejected anyway, so the
+    remaining layers are skipped for it, and the warnings-only realism layer
+    is skipped for any scenario that already has errors, unless
+    collect_all_errors is set.
+    
     Attributes:
-        bounds (Dict[str, Tuple[float, float]]): Parameter bounds for validation
-        business_rules (Dict): Business context validation rules
+        bounds (Mapping[str, Tuple[float, float]]): Read-only parameter bounds
+            for validation, shared by all instances
+        collect_all_errors (bool): Run every layer even after bounds errors
     
     Examples:
         Basic validation:
             guardrails = LLMGuardrails()
             result = guardrails.validate_scenario(scenario_dto)
         
+        Batch validation:
+            results = guardrails.validate_batch(candidate_dtos)
+        
         Parameter clamping:
             clamped_scenario, clamped_values = guardrails.clamp_parameters(scenario_dto)
         
@@ -196,6 +602,9 @@ class LLMGuardrails:
         
         Regeneration hints:
             hints = guardrails.generate_regeneration_hints(validation_result)
+        
+        Startup warmup:
+            guardrails = LLMGuardrails.warmup()
     
     Parameter Bounds:
         - baseline_conversion_rate: 0.001 to 0.5 (0.1% to 50%)
@@ -206,109 +615,104 @@ class LLMGuardrails:
         - expected_daily_traffic: 500 to 5,000
     """
     
-    def __init__(self):
-        """
-        Initialize the guardrails with parameter bounds and business rules.
-
-        Sets up the validation system with:
-        - Statistical parameter bounds for AB testing (expanded for variety)
-        - Metric-specific baseline ranges
-        - Traffic tier definitions
-        - Effect size profiles
-        """
-        # Parameter bounds for statistical validation - EXPANDED for variety
-        self.bounds = {
-            'baseline_conversion_rate': (0.001, 0.8),  # 0.1% to 80% (expanded)
-            'mde_absolute': (0.001, 0.2),  # 0.1% to 20% percentage points (expanded)
-            'target_lift_pct': (-0.5, 1.0),  # -50% to +100% (expanded for transformational)
-            'alpha': (0.001, 0.2),  # 0.1% to 20% (expanded)
-            'power': (0.5, 0.99),  # 50% to 99% (expanded)
-            'expected_daily_traffic': (100, 10_000_000),  # 100 to 10M daily (massively expanded)
-            'treatment_conversion_rate': (0.001, 0.8),  # 0.1% to 80%
-            'control_conversion_rate': (0.001, 0.8)  # 0.1% to 80%
-        }
-
-        # Traffic tier definitions for different company stages
-        self.traffic_tiers = {
-            TrafficTier.EARLY_STAGE: (100, 1_000),
-            TrafficTier.GROWTH: (1_000, 10_000),
-            TrafficTier.SCALE: (10_000, 100_000),
-            TrafficTier.ENTERPRISE: (100_000, 10_000_000)
-        }
-
-        # Metric-specific baseline ranges for realistic scenarios
-        self.metric_baseline_ranges = {
-            # Conversion metrics - typically low
-            MetricType.CONVERSION_RATE: (0.001, 0.15),
-            MetricType.SIGNUP_RATE: (0.01, 0.40),
-            MetricType.ACTIVATION_RATE: (0.10, 0.80),
-            MetricType.PURCHASE_RATE: (0.005, 0.20),
-            MetricType.CHECKOUT_COMPLETION: (0.30, 0.85),
-            MetricType.FORM_COMPLETION: (0.10, 0.70),
-
-            # Engagement metrics - varies widely
-            MetricType.CLICK_THROUGH_RATE: (0.005, 0.30),
-            MetricType.ENGAGEMENT_RATE: (0.05, 0.60),
-            MetricType.FEATURE_ADOPTION: (0.01, 0.50),
-            MetricType.CONTENT_COMPLETION: (0.20, 0.80),
-            MetricType.VIDEO_COMPLETION: (0.15, 0.70),
-            MetricType.SHARE_RATE: (0.001, 0.10),
-
-            # Retention metrics - typically moderate to high
-            MetricType.DAY_1_RETENTION: (0.20, 0.70),
-            MetricType.DAY_7_RETENTION: (0.10, 0.50),
-            MetricType.DAY_30_RETENTION: (0.05, 0.35),
-            MetricType.WEEKLY_RETENTION: (0.30, 0.80),
-            MetricType.MONTHLY_RETENTION: (0.20, 0.70),
-            MetricType.CHURN_RATE: (0.01, 0.20),
-
-            # Quality metrics - typically low (errors) or moderate (bounce)
-            MetricType.ERROR_RATE: (0.001, 0.10),
-            MetricType.BOUNCE_RATE: (0.20, 0.70),
-            MetricType.SUPPORT_CONTACT_RATE: (0.01, 0.15),
-            MetricType.REFUND_RATE: (0.01, 0.10),
-            MetricType.NPS_PROMOTER_RATE: (0.20, 0.70),
-        }
-
-        # Effect size profiles for different experiment types
-        self.effect_size_profiles = {
-            EffectSizeProfile.INCREMENTAL: {
-                'relative_lift_range': (0.02, 0.10),  # 2-10% relative
-                'description': 'Mature product optimization - small iterative improvements'
-            },
-            EffectSizeProfile.SIGNIFICANT: {
-                'relative_lift_range': (0.10, 0.30),  # 10-30% relative
-                'description': 'Major UX overhaul, new feature launch, significant changes'
-            },
-            EffectSizeProfile.TRANSFORMATIONAL: {
-                'relative_lift_range': (0.30, 1.00),  # 30-100% relative
-                'description': 'Completely new approach, radical redesign, high-risk test'
-            },
-            EffectSizeProfile.DEFENSIVE: {
-                'relative_lift_range': (-0.10, 0.05),  # -10% to +5%
-                'description': 'Proving no harm - cost reduction, infrastructure change'
-            }
-        }
-
-        # Alpha/power guidance based on business context
-        self.alpha_guidance = {
-            'high_stakes': 0.01,  # Irreversible changes, brand risk, regulatory
-            'standard': 0.05,  # Standard product decisions
-            'exploratory': 0.10,  # Easy rollback, low stakes
-            'very_exploratory': 0.15,  # Quick directional signal
-        }
-
-        self.power_guidance = {
-            'quick_signal': 0.60,  # Very limited resources, directional only
-            'exploratory': 0.70,  # Quick directional signal
-            'standard': 0.80,  # Balance of speed and confidence
-            'important': 0.90,  # High-value opportunity
-            'critical': 0.95,  # Must not miss true effect
-        }
+    # The tables below never vary, so they live on the class as read-only
+    # mappings shared by every instance; only the option flag is per-instance
+    __slots__ = ('collect_all_errors',)
+    
+    # Parameter bounds for statistical validation - EXPANDED for variety
+    bounds = MappingProxyType({
+        'baseline_conversion_rate': (0.001, 0.8),  # 0.1% to 80% (expanded)
+        'mde_absolute': (0.001, 0.2),  # 0.1% to 20% percentage points (expanded)
+        'target_lift_pct': (-0.5, 1.0),  # -50% to +100% (expanded for transformational)
+        'alpha': (0.001, 0.2),  # 0.1% to 20% (expanded)
+        'power': (0.5, 0.99),  # 50% to 99% (expanded)
+        'expected_daily_traffic': (100, 10_000_000),  # 100 to 10M daily (massively expanded)
+        'treatment_conversion_rate': (0.001, 0.8),  # 0.1% to 80%
+        'control_conversion_rate': (0.001, 0.8)  # 0.1% to 80%
+    })
+    
+    # Traffic tier definitions and metric-specific baseline ranges
+    traffic_tiers = _TRAFFIC_TIER_RANGES
+    metric_baseline_ranges = _METRIC_BASELINE_RANGES
+    
+    # Effect size profiles for different experiment types
+    effect_size_profiles = MappingProxyType({
+        EffectSizeProfile.INCREMENTAL: MappingProxyType({
+            'relative_lift_range': (0.02, 0.10),  # 2-10% relative
+            'description': 'Mature product optimization - small iterative improvements'
+        }),
+        EffectSizeProfile.SIGNIFICANT: MappingProxyType({
+            'relative_lift_range': (0.10, 0.30),  # 10-30% relative
+            'description': 'Major UX overhaul, new feature launch, significant changes'
+        }),
+        EffectSizeProfile.TRANSFORMATIONAL: MappingProxyType({
+            'relative_lift_range': (0.30, 1.00),  # 30-100% relative
+            'description': 'Completely new approach, radical redesign, high-risk test'
+        }),
+        EffectSizeProfile.DEFENSIVE: MappingProxyType({
+            'relative_lift_range': (-0.10, 0.05),  # -10% to +5%
+            'description': 'Proving no harm - cost reduction, infrastructure change'
+        })
+    })
+    
+    # Alpha/power guidance based on business context
+    alpha_guidance = MappingProxyType({
+        'high_stakes': 0.01,  # Irreversible changes, brand risk, regulatory
+        'standard': 0.05,  # Standard product decisions
+        'exploratory': 0.10,  # Easy rollback, low stakes
+        'very_exploratory': 0.15,  # Quick directional signal
+    })
+    
+    power_guidance = MappingProxyType({
+        'quick_signal': 0.60,  # Very limited resources, directional only
+        'exploratory': 0.70,  # Quick directional signal
+        'standard': 0.80,  # Balance of speed and confidence
+        'important': 0.90,  # High-value opportunity
+        'critical': 0.95,  # Must not miss true effect
+    })
+    
+    # Lookup tables derived from bounds, built once at import
+    (
+        _bounds_repr,
+        _design_param_checks,
+        _rate_checks,
+        _design_param_clamps,
+        _simulation_hint_clamps,
+    ) = _build_bound_tables(bounds)
+    
+    # Note: Removed restrictive keyword validation rules
+    # The LLM is now free to generate creative, varied narratives
+    # without being constrained to specific keyword patterns
+    
+    def __init__(self, collect_all_errors: bool = False):
+        """
+        Initialize the guardrails.
 
-        # Note: Removed restrictive keyword validation rules
-        # The LLM is now free to generate creative, varied narratives
-        # without being constrained to specific keyword patterns
+        Args:
+            collect_all_errors: Keep validating after bounds errors, for
+                callers that want the full diagnostics of a rejected scenario
+        """
+        self.collect_all_errors = collect_all_errors
+    
+    @classmethod
+    def warmup(cls) -> "LLMGuardrails":
+        """
+        Run every validation path once on a canned scenario.
+        
+        Call at application startup so the first real validation does not pay
+        for first-call costs (NumPy ufunc setup, Pydantic copy/validation
+        paths, lazily built tables).
+        
+        Returns:
+            The warmed-up instance, ready to be reused
+        """
+        guardrails = cls()
+        dummy = _build_canned_scenario_response_dto()
+        result = guardrails.validate_scenario(dummy)
+        guardrails.validate_batch([dummy])
+        guardrails.clamp_parameters(dummy)
+        guardrails.generate_regeneration_hints(result)
+        return guardrails
     
     def validate_scenario(self, scenario_response_dto: ScenarioResponseDTO) -> ValidationResult:
         """
@@ -319,99 +723,165 @@ class LLMGuardrails:
             
         Returns:
             ValidationResult with validation results and suggestions
+        
+        Raises:
+            AttributeError, TypeError: If the DTO is malformed. Shape is
+                validated when the DTO is built (see LLMOutputParser), so
+                callers holding unvalidated objects should validate them first.
         """
         result = ValidationResult(is_valid=True)
         
-        try:
-            # Validate design parameters
-            self._validate_design_params(scenario_response_dto, result)
+        # Lower-case the primary KPI once for the text checks below
+        primary_kpi_lower = scenario_response_dto.scenario.primary_kpi.lower()
+        
+        # Validate design parameters
+        self._validate_design_params(scenario_response_dto, result)
+        
+        # Out-of-bounds scenarios get regenerated, so skip the later stages
+        if not result.errors or self.collect_all_errors:
+            # Validate parameter and metric consistency (proportion-based metrics only)
+            self._validate_consistency(scenario_response_dto, result, primary_kpi_lower)
             
             # Validate business context consistency
-            self._validate_business_context(scenario_response_dto, result)
-            
-            # Validate parameter consistency
-            self._validate_parameter_consistency(scenario_response_dto, result)
+            self._validate_business_context(scenario_response_dto, result, primary_kpi_lower)
             
-            # Validate metric consistency (proportion-based metrics only)
-            self._validate_metric_consistency(scenario_response_dto, result)
-            
-            # Validate realism
-            self._validate_realism(scenario_response_dto, result)
-            
-            # Calculate quality score
-            result.quality_score = self.get_quality_score(scenario_response_dto)
-            
-            # Determine overall validity
-            result.is_valid = len(result.errors) == 0
-            
-        except (ValueError, TypeError, KeyError, AttributeError) as e:
-            logger.error(f"Error in guardrail validation: {e}")
-            result.is_valid = False
-            result.errors.append(f"Validation error: {str(e)}")
+            # Validate realism - it only adds warnings and suggestions,
+            # which nobody reads for a scenario that is being rejected
+            if not result.errors or self.collect_all_errors:
+                self._validate_realism(scenario_response_dto, result)
+        
+        # Calculate quality score
+        result.quality_score = self.get_quality_score(scenario_response_dto)
+        
+        # Determine overall validity
+        result.is_valid = len(result.errors) == 0
         
         return result
     
-    def _validate_design_params(self, scenario_response_dto: ScenarioResponseDTO, result: ValidationResult):
-        """Validate design parameters against bounds."""
-        design_params = scenario_response_dto.design_params
+    def validate_batch(self, scenario_response_dtos: Sequence[ScenarioResponseDTO]) -> List[ValidationResult]:
+        """
+        Validate many candidate scenarios at once.
         
-        # Check baseline conversion rate
-        baseline = design_params.baseline_conversion_rate
-        if not (self.bounds['baseline_conversion_rate'][0] <= baseline <= self.bounds['baseline_conversion_rate'][1]):
-            result.errors.append(
-                f"Baseline conversion rate {baseline} is outside valid range "
-                f"[{self.bounds['baseline_conversion_rate'][0]}, {self.bounds['baseline_conversion_rate'][1]}]"
-            )
+        The numeric checks (bounds, allocation, consistency, realism) run as
+        NumPy column operations across the whole batch. Candidates that trip
+        any of them are re-run through validate_scenario so their messages are
+        identical to the single-scenario path; the rest only need the
+        text-based checks and a quality score.
         
-        # Check MDE absolute (must be in percentage points)
-        mde_absolute = design_params.mde_absolute
-        if not (self.bounds['mde_absolute'][0] <= mde_absolute <= self.bounds['mde_absolute'][1]):
-            result.errors.append(
-                f"MDE absolute {mde_absolute} is outside valid range "
-                f"[{self.bounds['mde_absolute'][0]}, {self.bounds['mde_absolute'][1]}] "
-                f"(must be a raw ratio between 0.001-0.1, not absolute time/revenue)"
-            )
+        Args:
+            scenario_response_dtos: Candidate scenarios to validate
+            
+        Returns:
+            One ValidationResult per candidate, in input order
+        """
+        n = len(scenario_response_dtos)
+        if n == 0:
+            return []
         
-        # Check target lift
-        target_lift = design_params.target_lift_pct
-        if not (self.bounds['target_lift_pct'][0] <= target_lift <= self.bounds['target_lift_pct'][1]):
-            result.errors.append(
-                f"Target lift {target_lift} is outside valid range "
-                f"[{self.bounds['target_lift_pct'][0]}, {self.bounds['target_lift_pct'][1]}]"
-            )
+        # One pass over the candidates builds an (n x 10) table; its
+        # transposed rows are the per-field columns
+        table = np.array(
+            [
+                _batch_design_values(dto.design_params)
+                + _batch_hint_values(dto.llm_expected.simulation_hints)
+                for dto in scenario_response_dtos
+            ],
+            dtype=np.float64,
+        )
+        (
+            baseline,
+            mde_absolute,
+            target_lift,
+            alpha,
+            power,
+            traffic,
+            control_alloc,
+            treatment_alloc,
+            control_rate,
+            treatment_rate,
+        ) = table.T
         
-        # Check alpha
-        alpha = design_params.alpha
-        if not (self.bounds['alpha'][0] <= alpha <= self.bounds['alpha'][1]):
-            result.errors.append(
-                f"Alpha {alpha} is outside valid range "
-                f"[{self.bounds['alpha'][0]}, {self.bounds['alpha'][1]}]"
-            )
+        # Checks are written as "not within" so NaN is flagged, matching
+        # the scalar range checks and math.isclose in validate_scenario
+        def out_of_bounds(values, name):
+            lo, hi = self.bounds[name]
+            return ~((values >= lo) & (values <= hi))
         
-        # Check power
-        power = design_params.power
-        if not (self.bounds['power'][0] <= power <= self.bounds['power'][1]):
-            result.errors.append(
-                f"Power {power} is outside valid range "
-                f"[{self.bounds['power'][0]}, {self.bounds['power'][1]}]"
-            )
+        def not_close(a, b, tolerance):
+            return ~(np.abs(a - b) <= tolerance)
         
-        # Check daily traffic
-        traffic = design_params.expected_daily_traffic
-        if not (self.bounds['expected_daily_traffic'][0] <= traffic <= self.bounds['expected_daily_traffic'][1]):
-            result.errors.append(
-                f"Daily traffic {traffic} is outside valid range "
-                f"[{self.bounds['expected_daily_traffic'][0]}, {self.bounds['expected_daily_traffic'][1]}]"
-            )
+        alloc_bad = not_close(control_alloc + treatment_alloc, 1.0, _ALLOCATION_TOLERANCE)
+        
+        flagged = (
+            alloc_bad
+            | out_of_bounds(baseline, 'baseline_conversion_rate')
+            | out_of_bounds(mde_absolute, 'mde_absolute')
+            | out_of_bounds(target_lift, 'target_lift_pct')
+            | out_of_bounds(alpha, 'alpha')
+            | out_of_bounds(power, 'power')
+            | out_of_bounds(traffic, 'expected_daily_traffic')
+            | out_of_bounds(control_rate, 'control_conversion_rate')
+            | out_of_bounds(treatment_rate, 'treatment_conversion_rate')
+        )
+        
+        # Consistency checks (mirrors _check_consistency)
+        positive = baseline > 0
+        inv_baseline = 1.0 / np.where(positive, baseline, 1.0)
+        actual_lift = (treatment_rate - baseline) * inv_baseline
+        expected_target_lift = np.where(positive, mde_absolute * inv_baseline, 0.0)
+        flagged |= not_close(baseline, control_rate, 0.001)
+        flagged |= positive & not_close(actual_lift, target_lift, 0.05)
+        flagged |= not_close(target_lift, expected_target_lift, 0.001)
+        flagged |= mde_absolute > baseline * 0.5
+        
+        # Realism checks (mirrors _validate_realism)
+        realism_columns = {
+            'baseline_conversion_rate': baseline,
+            'target_lift_pct': target_lift,
+            'expected_daily_traffic': traffic,
+            'power': power,
+        }
+        for field_name, thresholds, _, _, _ in _REALISM_BANDS:
+            flagged |= np.searchsorted(thresholds, realism_columns[field_name], side='right') != 1
+        
+        results = []
+        for dto, needs_full_check in zip(scenario_response_dtos, flagged.tolist()):
+            if needs_full_check:
+                results.append(self.validate_scenario(dto))
+                continue
+            result = ValidationResult(is_valid=True)
+            primary_kpi_lower = dto.scenario.primary_kpi.lower()
+            self._validate_primary_kpi(dto, result, primary_kpi_lower)
+            self._validate_business_context(dto, result, primary_kpi_lower)
+            result.quality_score = self.get_quality_score(dto)
+            result.is_valid = len(result.errors) == 0
+            results.append(result)
+        
+        return results
+    
+    def _validate_design_params(self, scenario_response_dto: ScenarioResponseDTO, result: ValidationResult):
+        """Validate design parameters against bounds."""
+        design_params = scenario_response_dto.design_params
+        
+        for value, (low, high, message) in zip(_design_param_values(design_params), self._design_param_checks):
+            if not (low <= value <= high):
+                result.add_error(message.format(value), ValidationErrorCode.BOUNDS_OUT_OF_RANGE)
         
         # Check allocation
         allocation = design_params.allocation
-        if abs(allocation.control + allocation.treatment - 1.0) > 0.001:
-            result.errors.append(
-                f"Allocation must sum to 1.0, got {allocation.control + allocation.treatment}"
+        allocation_total = allocation.control + allocation.treatment
+        if not math.isclose(allocation_total, 1.0, rel_tol=0.0, abs_tol=_ALLOCATION_TOLERANCE):
+            result.add_error(
+                f"Allocation must sum to 1.0, got {allocation_total}",
+                ValidationErrorCode.ALLOCATION_SUM
             )
     
-    def _validate_business_context(self, scenario_response_dto: ScenarioResponseDTO, result: ValidationResult):
+    def _validate_business_context(
+        self,
+        scenario_response_dto: ScenarioResponseDTO,
+        result: ValidationResult,
+        primary_kpi_lower: Optional[str] = None
+    ):
         """
         Validate business context consistency.
 
@@ -420,101 +890,141 @@ class LLMGuardrails:
         scenarios without being constrained to specific keyword patterns.
         """
         scenario = scenario_response_dto.scenario
+        title = scenario.title
+        narrative = scenario.narrative
+        company_type = scenario.company_type
+        user_segment = scenario.user_segment
 
         # Basic validation - ensure required fields are present and non-empty
-        if not scenario.title or len(scenario.title.strip()) < 10:
-            result.warnings.append("Scenario title seems too short - consider more descriptive title")
+        if not title or len(title.strip()) < 10:
+            result.add_warning("Scenario title seems too short - consider more descriptive title")
 
-        if not scenario.narrative or len(scenario.narrative.strip()) < 50:
-            result.warnings.append("Scenario narrative seems too short - consider more detailed context")
+        if not narrative or len(narrative.strip()) < 50:
+            result.add_warning("Scenario narrative seems too short - consider more detailed context")
 
         # Check that company_type and user_segment are valid enum values
         # (Pydantic should handle this, but double-check)
         try:
-            _ = scenario.company_type.value
+            _ = company_type.value
         except (AttributeError, ValueError):
-            result.errors.append(f"Invalid company type: {scenario.company_type}")
+            result.add_error(f"Invalid company type: {company_type}", ValidationErrorCode.INVALID_ENUM)
 
         try:
-            _ = scenario.user_segment.value
+            _ = user_segment.value
         except (AttributeError, ValueError):
-            result.errors.append(f"Invalid user segment: {scenario.user_segment}")
+            result.add_error(f"Invalid user segment: {user_segment}", ValidationErrorCode.INVALID_ENUM)
 
         # Light validation for primary KPI format
-        primary_kpi = scenario.primary_kpi.lower()
+        primary_kpi = primary_kpi_lower if primary_kpi_lower is not None else scenario.primary_kpi.lower()
         if not primary_kpi or len(primary_kpi) < 3:
-            result.warnings.append("Primary KPI should be clearly specified")
+            result.add_warning("Primary KPI should be clearly specified")
+    
+    def _validate_consistency(
+        self,
+        scenario_response_dto: ScenarioResponseDTO,
+        result: ValidationResult,
+        primary_kpi_lower: Optional[str] = None
+    ):
+        """
+        Run parameter and metric consistency validation in one pass.
+        
+        Reads the design/simulation inputs and runs _check_consistency once,
+        then reports the parameter and metric findings in the same order as
+        calling the two validators separately.
+        """
+        values = self._consistency_inputs(scenario_response_dto)
+        flags = _check_consistency(*values)
+        self._report_parameter_consistency(result, values, flags)
+        self._report_metric_consistency(result, values, flags)
+        self._validate_primary_kpi(scenario_response_dto, result, primary_kpi_lower)
     
     def _validate_parameter_consistency(self, scenario_response_dto: ScenarioResponseDTO, result: ValidationResult):
         """Validate parameter consistency."""
+        values = self._consistency_inputs(scenario_response_dto)
+        self._report_parameter_consistency(result, values, _check_consistency(*values))
+    
+    def _validate_metric_consistency(
+        self,
+        scenario_response_dto: ScenarioResponseDTO,
+        result: ValidationResult,
+        primary_kpi_lower: Optional[str] = None
+    ):
+        """Validate that metrics are proportion-based and consistent with statistical tests."""
+        values = self._consistency_inputs(scenario_response_dto)
+        self._report_metric_consistency(result, values, _check_consistency(*values))
+        self._validate_primary_kpi(scenario_response_dto, result, primary_kpi_lower)
+    
+    @staticmethod
+    def _consistency_inputs(scenario_response_dto: ScenarioResponseDTO) -> Tuple[float, float, float, float, float]:
+        """Inputs to _check_consistency, in its argument order."""
         design_params = scenario_response_dto.design_params
-        llm_expected = scenario_response_dto.llm_expected
-        simulation_hints = llm_expected.simulation_hints
+        simulation_hints = scenario_response_dto.llm_expected.simulation_hints
+        return (
+            design_params.baseline_conversion_rate,
+            simulation_hints.control_conversion_rate,
+            simulation_hints.treatment_conversion_rate,
+            design_params.target_lift_pct,
+            design_params.mde_absolute,
+        )
+    
+    def _report_parameter_consistency(self, result: ValidationResult, values: Tuple[float, float, float, float, float], flags: int):
+        """Add parameter consistency warnings and rate bound errors."""
+        baseline, control_rate, treatment_rate, target_lift, _ = values
         
         # Check baseline vs control rate consistency
-        baseline = design_params.baseline_conversion_rate
-        control_rate = simulation_hints.control_conversion_rate
-        if abs(baseline - control_rate) > 0.001:
-            result.warnings.append(
-                f"Baseline rate ({baseline:.3f}) doesn't match control rate ({control_rate:.3f})"
+        if flags & FLAG_BASELINE_CONTROL_MISMATCH:
+            result.add_warning(
+                f"Baseline rate ({baseline:.3f}) doesn't match control rate ({control_rate:.3f})",
+                ValidationErrorCode.PARAMETER_MISMATCH
             )
         
         # Check target lift vs actual lift consistency
-        target_lift = design_params.target_lift_pct
-        treatment_rate = simulation_hints.treatment_conversion_rate
-        if baseline > 0:
+        if flags & FLAG_LIFT_MISMATCH:
             actual_lift = (treatment_rate - baseline) / baseline
-            if abs(actual_lift - target_lift) > 0.05:  # 5% tolerance
-                result.warnings.append(
-                    f"Target lift ({target_lift:.1%}) doesn't match actual lift ({actual_lift:.1%})"
-                )
+            result.add_warning(
+                f"Target lift ({target_lift:.1%}) doesn't match actual lift ({actual_lift:.1%})",
+                ValidationErrorCode.PARAMETER_MISMATCH
+            )
         
         # Check conversion rate bounds
-        for rate_name, rate_value in [
-            ('control_conversion_rate', control_rate),
-            ('treatment_conversion_rate', treatment_rate)
-        ]:
-            bounds = self.bounds.get(rate_name)
-            if bounds and not (bounds[0] <= rate_value <= bounds[1]):
-                result.errors.append(
-                    f"{rate_name} {rate_value} is outside valid range [{bounds[0]}, {bounds[1]}]"
-                )
-    
-    def _validate_metric_consistency(self, scenario_response_dto: ScenarioResponseDTO, result: ValidationResult):
-        """Validate that metrics are proportion-based and consistent with statistical tests."""
-        scenario = scenario_response_dto.scenario
-        design_params = scenario_response_dto.design_params
-        
-        # Check that MDE is reasonable for proportion-based metrics
-        mde_absolute = design_params.mde_absolute
-        baseline = design_params.baseline_conversion_rate
-        target_lift = design_params.target_lift_pct
+        for rate_value, (low, high, message) in zip((control_rate, treatment_rate), self._rate_checks):
+            if not (low <= rate_value <= high):
+                result.add_error(message.format(rate_value), ValidationErrorCode.BOUNDS_OUT_OF_RANGE)
+    
+    @staticmethod
+    def _report_metric_consistency(result: ValidationResult, values: Tuple[float, float, float, float, float], flags: int):
+        """Add the MDE / target lift consistency error and MDE size warning."""
+        baseline, _, _, target_lift, mde_absolute = values
         
         # CRITICAL: Check mathematical consistency between mde_absolute and target_lift_pct
-        expected_target_lift = mde_absolute / baseline if baseline > 0 else 0
-        if abs(target_lift - expected_target_lift) > 0.001:  # 0.1% tolerance
-            result.errors.append(
+        if flags & FLAG_MATH_INCONSISTENT:
+            expected_target_lift = mde_absolute / baseline if baseline > 0 else 0
+            result.add_error(
                 f"Mathematical inconsistency: mde_absolute ({mde_absolute:.3f}) and target_lift_pct ({target_lift:.3f}) are not consistent. "
                 f"Expected target_lift_pct = mde_absolute / baseline = {expected_target_lift:.3f}. "
-                f"Please ensure: mde_absolute = baseline × target_lift_pct"
+                f"Please ensure: mde_absolute = baseline × target_lift_pct",
+                ValidationErrorCode.MATH_INCONSISTENT
             )
         
         # MDE should be a reasonable percentage of baseline (not more than 50% of baseline)
-        if mde_absolute > baseline * 0.5:
-            result.warnings.append(
+        if flags & FLAG_MDE_TOO_LARGE:
+            result.add_warning(
                 f"MDE ({mde_absolute:.1%}) is very large relative to baseline ({baseline:.1%}). "
-                f"Consider if this is realistic for a proportion-based metric."
+                f"Consider if this is realistic for a proportion-based metric.",
+                ValidationErrorCode.UNREALISTIC_VALUE
             )
+    
+    def _validate_primary_kpi(
+        self,
+        scenario_response_dto: ScenarioResponseDTO,
+        result: ValidationResult,
+        primary_kpi_lower: Optional[str] = None
+    ):
+        """Check that the primary KPI is appropriate for proportion-based testing."""
+        primary_kpi = primary_kpi_lower if primary_kpi_lower is not None else scenario_response_dto.scenario.primary_kpi.lower()
         
-        # Check that primary KPI is appropriate for proportion-based testing
-        primary_kpi = scenario.primary_kpi.lower()
-        valid_proportion_kpis = ['conversion_rate', 'click_through_rate', 'engagement_rate']
-        
-        if primary_kpi not in valid_proportion_kpis:
-            result.warnings.append(
-                f"Primary KPI '{primary_kpi}' may not be appropriate for proportion-based testing. "
-                f"Consider using: {valid_proportion_kpis}"
-            )
+        if primary_kpi not in _PROPORTION_KPI_SET:
+            result.add_warning(_NON_PROPORTION_KPI_WARNING.format(primary_kpi))
     
     def _validate_realism(self, scenario_response_dto: ScenarioResponseDTO, result: ValidationResult):
         """
@@ -525,49 +1035,16 @@ class LLMGuardrails:
         """
         design_params = scenario_response_dto.design_params
 
-        # Check conversion rates against expanded bounds only
-        baseline = design_params.baseline_conversion_rate
-        if baseline > 0.8:  # 80% - truly extreme
-            result.warnings.append(
-                f"Baseline conversion rate {baseline:.1%} is very high - ensure this is realistic for the metric type"
-            )
-        elif baseline < 0.001:  # 0.1% - truly extreme
-            result.warnings.append(
-                f"Baseline conversion rate {baseline:.1%} is very low - ensure this is realistic for the metric type"
-            )
-
-        # Check target lift - only warn for truly extreme values
-        target_lift = design_params.target_lift_pct
-        if target_lift > 2.0:  # 200% relative lift
-            result.warnings.append(
-                f"Target lift {target_lift:.1%} is very ambitious - consider if this is achievable"
-            )
-        elif target_lift < -0.5:  # -50% relative lift
-            result.warnings.append(
-                f"Target lift {target_lift:.1%} suggests significant negative impact expected"
-            )
-
-        # Traffic validation is now informational, not restrictive
-        traffic = design_params.expected_daily_traffic
-        if traffic > 10_000_000:  # 10M daily - truly massive
-            result.warnings.append(
-                f"Daily traffic {traffic:,} is enterprise-scale - ensure experiment can handle this volume"
-            )
-        elif traffic < 100:  # Very small
-            result.warnings.append(
-                f"Daily traffic {traffic:,} is very low - experiment duration may be very long"
-            )
-
-        # Power validation - informational only
-        power = design_params.power
-        if power > 0.95:
-            result.suggestions.append(
-                f"Power {power:.1%} is very high - consider if this precision is needed vs. faster iteration"
-            )
-        elif power < 0.6:
-            result.suggestions.append(
-                f"Power {power:.1%} is low - results may be directional only, higher risk of false negatives"
-            )
+        for field_name, thresholds, messages, codes, kind in _REALISM_BANDS:
+            value = getattr(design_params, field_name)
+            band = bisect_right(thresholds, value)
+            message = messages[band]
+            if message is None:
+                continue
+            if kind == 'warnings':
+                result.add_warning(message.format(value), codes[band])
+            else:
+                result.suggestions.append(message.format(value))
     
     def clamp_parameters(self, scenario_response_dto: ScenarioResponseDTO) -> Tuple[ScenarioResponseDTO, Dict[str, Tuple[float, float]]]:
         """
@@ -581,98 +1058,66 @@ class LLMGuardrails:
         """
         clamped_values = {}
         
-        # Create a copy to modify
-        import copy
-        clamped_scenario = copy.deepcopy(scenario_response_dto)
-        
-        # Clamp design parameters
-        design_params = clamped_scenario.design_params
-        
-        # Clamp baseline conversion rate
-        original = design_params.baseline_conversion_rate
-        clamped = max(self.bounds['baseline_conversion_rate'][0], 
-                     min(self.bounds['baseline_conversion_rate'][1], original))
-        if abs(original - clamped) > 0.001:
-            design_params.baseline_conversion_rate = clamped
-            clamped_values['baseline_conversion_rate'] = (original, clamped)
-        
-        # Clamp target lift
-        original = design_params.target_lift_pct
-        clamped = max(self.bounds['target_lift_pct'][0], 
-                     min(self.bounds['target_lift_pct'][1], original))
-        if abs(original - clamped) > 0.001:
-            design_params.target_lift_pct = clamped
-            clamped_values['target_lift_pct'] = (original, clamped)
-        
-        # Clamp alpha
-        original = design_params.alpha
-        clamped = max(self.bounds['alpha'][0], 
-                     min(self.bounds['alpha'][1], original))
-        if abs(original - clamped) > 0.001:
-            design_params.alpha = clamped
-            clamped_values['alpha'] = (original, clamped)
-        
-        # Clamp power
-        original = design_params.power
-        clamped = max(self.bounds['power'][0], 
-                     min(self.bounds['power'][1], original))
-        if abs(original - clamped) > 0.001:
-            design_params.power = clamped
-            clamped_values['power'] = (original, clamped)
-        
-        # Clamp daily traffic
-        original = design_params.expected_daily_traffic
-        clamped = max(self.bounds['expected_daily_traffic'][0], 
-                     min(self.bounds['expected_daily_traffic'][1], original))
-        if abs(original - clamped) > 0.001:
-            design_params.expected_daily_traffic = clamped
-            clamped_values['expected_daily_traffic'] = (original, clamped)
-        
-        # Clamp simulation hints
-        simulation_hints = clamped_scenario.llm_expected.simulation_hints
-        
-        # Clamp control rate
-        original = simulation_hints.control_conversion_rate
-        clamped = max(self.bounds['control_conversion_rate'][0], 
-                     min(self.bounds['control_conversion_rate'][1], original))
-        if abs(original - clamped) > 0.001:
-            simulation_hints.control_conversion_rate = clamped
-            clamped_values['control_conversion_rate'] = (original, clamped)
-        
-        # Clamp treatment rate
-        original = simulation_hints.treatment_conversion_rate
-        clamped = max(self.bounds['treatment_conversion_rate'][0], 
-                     min(self.bounds['treatment_conversion_rate'][1], original))
-        if abs(original - clamped) > 0.001:
-            simulation_hints.treatment_conversion_rate = clamped
-            clamped_values['treatment_conversion_rate'] = (original, clamped)
+        # Read originals from the input and write clamped values to copies,
+        # leaving the caller's DTO untouched. Only the two nested models that
+        # get written are copied; scenario text and the rest are shared.
+        design_params = scenario_response_dto.design_params
+        llm_expected = scenario_response_dto.llm_expected
+        simulation_hints = llm_expected.simulation_hints
+        clamped_design_params = design_params.model_copy()
+        clamped_simulation_hints = simulation_hints.model_copy()
+        clamped_llm_expected = llm_expected.model_copy()
+        clamped_llm_expected.simulation_hints = clamped_simulation_hints
+        clamped_scenario = scenario_response_dto.model_copy()
+        clamped_scenario.design_params = clamped_design_params
+        clamped_scenario.llm_expected = clamped_llm_expected
+        
+        # Clamp design parameters, then simulation hints
+        for source, target, clamps in (
+            (design_params, clamped_design_params, self._design_param_clamps),
+            (simulation_hints, clamped_simulation_hints, self._simulation_hint_clamps),
+        ):
+            for field_name, low, high in clamps:
+                original = getattr(source, field_name)
+                if original < low:
+                    clamped = low
+                elif original > high:
+                    clamped = high
+                else:
+                    continue
+                if not math.isclose(original, clamped, rel_tol=0.0, abs_tol=0.001):
+                    setattr(target, field_name, clamped)
+                    clamped_values[field_name] = (original, clamped)
         
         return clamped_scenario, clamped_values
     
     def generate_regeneration_hints(self, validation_result: ValidationResult) -> List[str]:
-        """Generate hints for regenerating the scenario."""
-        hints = []
-        
-        for error in validation_result.errors:
-            if "outside valid range" in error:
-                hints.append("Ensure all parameters are within the specified bounds")
-            elif "must sum to 1.0" in error:
-                hints.append("Ensure allocation proportions sum to exactly 1.0")
-            elif "doesn't match" in error:
-                hints.append("Ensure parameter consistency between design and expected outcomes")
-        
-        for warning in validation_result.warnings:
-            if "doesn't seem to match" in warning:
-                hints.append("Ensure scenario content matches the specified company type and user segment")
-            elif "seems high" in warning or "seems low" in warning:
-                hints.append("Use more realistic parameter values for the business context")
-            elif "seems ambitious" in warning:
-                hints.append("Consider more conservative target lift values")
+        """
+        Generate hints for regenerating the scenario.
+        
+        Hints are looked up by the code recorded with each error/warning.
+        Messages without a code fall back to substring matching. Each hint
+        appears once, in the order it was first triggered.
+        """
+        # dict keys act as an insertion-ordered set of hints
+        hints: Dict[str, None] = {}
+        
+        for messages, codes, patterns in (
+            (validation_result.errors, validation_result.error_codes, _UNTAGGED_ERROR_PATTERNS),
+            (validation_result.warnings, validation_result.warning_codes, _UNTAGGED_WARNING_PATTERNS),
+        ):
+            for index, message in enumerate(messages):
+                code = codes[index] if index < len(codes) else None
+                if code is None:
+                    code = _classify_untagged(message, patterns)
+                hint = HINT_BY_CODE.get(code)
+                if hint is not None:
+                    hints[hint] = None
         
         if not hints:
-            hints.append("Review the scenario for overall realism and business context consistency")
+            return ["Review the scenario for overall realism and business context consistency"]
         
-        return hints
+        return list(hints)
     
     def get_quality_score(self, scenario_response_dto: ScenarioResponseDTO) -> float:
         """
@@ -687,48 +1132,45 @@ class LLMGuardrails:
         Returns:
             Quality score between 0 and 1
         """
-        score = 1.0
-
         design_params = scenario_response_dto.design_params
         scenario = scenario_response_dto.scenario
-
-        # Deduct for truly extreme/impossible values only
-        if design_params.baseline_conversion_rate > 0.95:  # Can't have >95% baseline
-            score -= 0.2
-        if design_params.baseline_conversion_rate < 0.0001:  # Too small to measure
-            score -= 0.2
-
-        # Deduct for impossible lifts
-        if design_params.target_lift_pct > 5.0:  # 500% lift is unrealistic
-            score -= 0.2
-        if design_params.target_lift_pct < -0.9:  # -90% would eliminate the metric
-            score -= 0.2
-
-        # Deduct for internal inconsistency between baseline and simulation hints
         baseline = design_params.baseline_conversion_rate
+        target_lift = design_params.target_lift_pct
         control_rate = scenario_response_dto.llm_expected.simulation_hints.control_conversion_rate
-        if abs(baseline - control_rate) > 0.01:  # Allow 1% tolerance
-            score -= 0.1
+        narrative_len = len(scenario.narrative)
+        title_len = len(scenario.title)
 
-        # Bonus for rich narrative content
-        if len(scenario.narrative) > 200:
-            score += 0.05
-        if len(scenario.title) > 30:
-            score += 0.05
-
-        # Deduct for missing or minimal content
-        if len(scenario.narrative) < 50:
-            score -= 0.15
-        if len(scenario.title) < 10:
-            score -= 0.1
-
-        return max(0.0, min(1.0, score))
+        if baseline != baseline or target_lift != target_lift or control_rate != control_rate:
+            # NaN never equals itself, so it would only ever miss the cache
+            return _quality_score.__wrapped__(baseline, target_lift, control_rate, narrative_len, title_len)
+        return _quality_score(baseline, target_lift, control_rate, narrative_len, title_len)
 
 
 # =============================================================================
 # NOVELTY SCORING SYSTEM
 # =============================================================================
 
+class Features(NamedTuple):
+    """Comparable features of one scenario, in NoveltyScorer._WEIGHTS order."""
+    company_type: str
+    user_segment: str
+    primary_kpi: str
+    traffic_tier: str
+    baseline_tier: str
+    effect_tier: str
+    alpha: float
+    power: float
+
+
+def _enum_value(value) -> str:
+    """String value of an enum field, tolerating enum-like objects and plain strings."""
+    # Validated DTOs always hold the enum, so the isinstance check is the
+    # common path; the hasattr probe only runs for duck-typed inputs
+    if isinstance(value, Enum):
+        return value.value
+    return value.value if hasattr(value, 'value') else str(value)
+
+
 class NoveltyScorer:
     """
     Scores how different a new scenario is from recently generated ones.
@@ -749,6 +1191,19 @@ class NoveltyScorer:
         scorer.record_scenario(new_scenario)  # Add to history after generation
     """
 
+    # Scoring reads these on every call; slots make them fixed-offset loads
+    __slots__ = (
+        "history_size",
+        "recent_scenarios",
+        "_vocab",
+        "_codes",
+        "_head",
+        "_count",
+        "_feature_counts",
+        "_cached_dto",
+        "_cached_features",
+    )
+
     def __init__(self, history_size: int = 20):
         """
         Initialize the novelty scorer.
@@ -757,81 +1212,113 @@ class NoveltyScorer:
             history_size: Number of recent scenarios to track for comparison
         """
         self.history_size = history_size
-        self.recent_scenarios: List[Dict] = []
-
-    # Tier classification thresholds (threshold, tier_name)
-    _TRAFFIC_TIERS = [
-        (1000, "early_stage"),
-        (10000, "growth"),
-        (100000, "scale"),
-        (None, "enterprise"),
-    ]
-
-    _BASELINE_TIERS = [
-        (0.01, "very_low"),
-        (0.05, "low"),
-        (0.15, "medium"),
-        (0.30, "high"),
-        (None, "very_high"),
-    ]
-
-    _EFFECT_TIERS = [
-        (0.05, "incremental"),
-        (0.20, "moderate"),
-        (0.50, "significant"),
-        (None, "transformational"),
-    ]
-
-    # Feature weights for similarity scoring
-    _SIMILARITY_WEIGHTS = {
-        "company_type": 0.25,
-        "user_segment": 0.15,
-        "primary_kpi": 0.10,
-        "traffic_tier": 0.10,
-        "baseline_tier": 0.10,
-        "effect_tier": 0.10,
-        "alpha": 0.10,
-        "power": 0.10,
+        self.recent_scenarios: Deque[Features] = deque(maxlen=history_size)
+        # Struct-of-arrays copy of the history for vectorized scoring: one
+        # row of int32 value codes per feature, filled as a ring buffer
+        # (_head is the next slot to write, i.e. the oldest entry once full)
+        self._vocab: Tuple[Dict, ...] = tuple({} for _ in self._FEATURE_NAMES)
+        self._codes = np.empty((len(self._FEATURE_NAMES), history_size), dtype=np.int32)
+        self._head = 0
+        self._count = 0
+        # Per-feature value counts over the history, kept in step with
+        # recent_scenarios on append/evict
+        self._feature_counts: Dict[str, Counter] = {feature: Counter() for feature in self._SUMMARY_KEYS}
+        # One-slot cache so a score -> suggest -> record cycle on the same
+        # DTO extracts its features once
+        self._cached_dto: Optional[ScenarioResponseDTO] = None
+        self._cached_features: Optional[Features] = None
+
+    # Tier classification: a value is in tier names[bisect_right(thresholds, value)],
+    # i.e. the first tier whose threshold it is below
+    _TRAFFIC_THRESHOLDS = (1000, 10000, 100000)
+    _TRAFFIC_NAMES = ("early_stage", "growth", "scale", "enterprise")
+
+    _BASELINE_THRESHOLDS = (0.01, 0.05, 0.15, 0.30)
+    _BASELINE_NAMES = ("very_low", "low", "medium", "high", "very_high")
+
+    _EFFECT_THRESHOLDS = (0.05, 0.20, 0.50)
+    _EFFECT_NAMES = ("incremental", "moderate", "significant", "transformational")
+
+    # Feature weights for similarity scoring: (feature, average weight,
+    # recency weight). The recency term deliberately only looks at what a
+    # scenario is about (company type, segment, KPI), so back-to-back
+    # repeats of the same story are penalised more than repeated numbers.
+    _WEIGHTS = (
+        ("company_type", 0.25, 0.25),
+        ("user_segment", 0.15, 0.15),
+        ("primary_kpi", 0.10, 0.10),
+        ("traffic_tier", 0.10, 0.0),
+        ("baseline_tier", 0.10, 0.0),
+        ("effect_tier", 0.10, 0.0),
+        ("alpha", 0.10, 0.0),
+        ("power", 0.10, 0.0),
+    )
+
+    # History length above which score_novelty samples the average similarity
+    _SAMPLE_THRESHOLD = 32
+
+    # Alternatives offered when a feature value is overused
+    _CANDIDATE_COMPANY_TYPES = ("Telehealth", "EdTech", "PropTech", "Gaming", "Logistics")
+    _CANDIDATE_SEGMENTS = ("power users (top 10%)", "churned users (win-back)", "enterprise accounts")
+    _CANDIDATE_TRAFFIC_TIERS = ("early_stage", "enterprise")
+
+    # Features counted for suggestions/summaries, with their summary key
+    _SUMMARY_KEYS = {
+        "company_type": "company_types",
+        "user_segment": "user_segments",
+        "primary_kpi": "kpis",
+        "traffic_tier": "traffic_tiers",
+        "effect_tier": "effect_tiers",
     }
 
-    @staticmethod
-    def _classify_tier(value: float, thresholds: list) -> str:
-        """Classify a numeric value into a tier based on thresholds."""
-        for threshold, tier_name in thresholds:
-            if threshold is None or value < threshold:
-                return tier_name
-        return thresholds[-1][1]
-
-    def _extract_features(self, scenario_dto: ScenarioResponseDTO) -> Dict:
-        """Extract features from a scenario for comparison."""
-        scenario = scenario_dto.scenario
-        design_params = scenario_dto.design_params
+    # Columns of _WEIGHTS; _WEIGHT_MATRIX is (features x 2) with the
+    # average weights in column 0 and the recency weights in column 1
+    _FEATURE_NAMES, _FEATURE_WEIGHTS, _RECENCY_WEIGHTS = zip(*_WEIGHTS)
+    _WEIGHT_MATRIX = np.column_stack((_FEATURE_WEIGHTS, _RECENCY_WEIGHTS))
+    # Pulls the counted feature values, in _SUMMARY_KEYS order, in one C call
+    _counted_values = attrgetter(*_SUMMARY_KEYS)
 
-        return {
-            "company_type": scenario.company_type.value if hasattr(scenario.company_type, 'value') else str(scenario.company_type),
-            "user_segment": scenario.user_segment.value if hasattr(scenario.user_segment, 'value') else str(scenario.user_segment),
-            "primary_kpi": scenario.primary_kpi,
-            "traffic_tier": self._classify_tier(design_params.expected_daily_traffic, self._TRAFFIC_TIERS),
-            "baseline_tier": self._classify_tier(design_params.baseline_conversion_rate, self._BASELINE_TIERS),
-            "effect_tier": self._classify_tier(design_params.target_lift_pct, self._EFFECT_TIERS),
-            "alpha": design_params.alpha,
-            "power": design_params.power,
-        }
+    def _extract_features(self, scenario_dto: ScenarioResponseDTO) -> Features:
+        """
+        Extract features from a scenario for comparison.
 
-    def _calculate_similarity(self, features_a: Dict, features_b: Dict) -> float:
-        """Calculate weighted similarity between two feature sets (0.0 to 1.0)."""
-        similarity = 0.0
-        for feature, weight in self._SIMILARITY_WEIGHTS.items():
-            if features_a.get(feature) == features_b.get(feature):
-                similarity += weight
-        return similarity
+        The result for the most recent DTO is cached by identity, so repeated
+        calls for the same object reuse it. DTOs are treated as immutable once
+        scored.
+        """
+        if scenario_dto is self._cached_dto:
+            return self._cached_features
 
-    def score_novelty(self, scenario_dto: ScenarioResponseDTO) -> float:
+        scenario = scenario_dto.scenario
+        design_params = scenario_dto.design_params
+
+        # Interned so the history vocab/count lookups on these strings hit
+        # the identity fast path (tier names are literals, already interned)
+        features = Features(
+            company_type=sys.intern(_enum_value(scenario.company_type)),
+            user_segment=sys.intern(_enum_value(scenario.user_segment)),
+            primary_kpi=sys.intern(scenario.primary_kpi),
+            traffic_tier=self._TRAFFIC_NAMES[bisect_right(self._TRAFFIC_THRESHOLDS, design_params.expected_daily_traffic)],
+            baseline_tier=self._BASELINE_NAMES[bisect_right(self._BASELINE_THRESHOLDS, design_params.baseline_conversion_rate)],
+            effect_tier=self._EFFECT_NAMES[bisect_right(self._EFFECT_THRESHOLDS, design_params.target_lift_pct)],
+            alpha=design_params.alpha,
+            power=design_params.power,
+        )
+        self._cached_dto = scenario_dto
+        self._cached_features = features
+        return features
+
+    def score_novelty(self, scenario_dto: ScenarioResponseDTO, exact: bool = False) -> float:
         """
         Calculate a novelty score for a scenario compared to recent history.
 
+        For histories longer than _SAMPLE_THRESHOLD, the average similarity
+        is estimated from an evenly spaced sample of about sqrt(n) entries;
+        the recency-weighted term always uses the full history.
+
         Args:
             scenario_dto: The scenario to score
+            exact: Compare against every history entry, even for long histories
 
         Returns:
             Novelty score from 0 (highly repetitive) to 1 (highly novel)
@@ -839,32 +1326,92 @@ class NoveltyScorer:
         if not self.recent_scenarios:
             return 1.0  # First scenario is always novel
 
-        new_features = self._extract_features(scenario_dto)
+        return self._score_from_features(self._extract_features(scenario_dto), exact)
+
+    def _score_from_features(self, new_features: Features, exact: bool = False) -> float:
+        """Novelty score for already-extracted features (non-empty history)."""
+        n = self._count
+        if n == 0:
+            return 1.0
+        if n == 1:
+            # One entry: both scenario weights are 1, so skip the matrix setup
+            matches = [
+                new_value == recent_value
+                for new_value, recent_value in zip(new_features, self.recent_scenarios[0])
+            ]
+            similarity = sum(compress(self._FEATURE_WEIGHTS, matches))
+            recency_sim = sum(compress(self._RECENCY_WEIGHTS, matches))
+            return max(0.0, 1.0 - (similarity + recency_sim) / 2)
+
+        # Values never recorded get code -1, which matches nothing
+        new_codes = np.array(
+            [vocab.get(value, -1) for value, vocab in zip(new_features, self._vocab)],
+            dtype=np.int32,
+        )
+
+        # Only compare features whose value has been seen before; a scenario
+        # that is new on every feature is fully novel
+        weight_matrix = self._WEIGHT_MATRIX
+        codes = self._codes[:, :n]
+        seen = new_codes >= 0
+        if not seen.all():
+            if not seen.any():
+                return 1.0
+            new_codes = new_codes[seen]
+            weight_matrix = weight_matrix[seen]
+            codes = codes[seen]
+
+        # History codes in chronological order (oldest first)
+        if n == self.history_size and self._head:
+            codes = np.concatenate((codes[:, self._head:], codes[:, :self._head]), axis=1)
+
+        if not exact and n > self._SAMPLE_THRESHOLD:
+            return self._sampled_score(codes, new_codes, weight_matrix)
+
+        # (scenarios x 2) per-scenario weights: 1/n for the average and
+        # (i + 1)/n for the recency term (more recent scenarios weigh more)
+        scenario_weights = np.empty((n, 2))
+        scenario_weights[:, 0] = 1.0 / n
+        scenario_weights[:, 1] = np.arange(1, n + 1) / n
+
+        # Reduce the (features x scenarios) match matrix over scenarios with
+        # one matmul, then over features with the weight matrix; both
+        # similarity terms come out of the same pass
+        matches = codes == new_codes[:, None]
+        avg_similarity, recency_weighted_similarity = (
+            weight_matrix * (matches @ scenario_weights)
+        ).sum(axis=0).tolist()
 
-        # Calculate similarity to each recent scenario in a single pass
-        total_similarity = 0.0
-        recency_weighted_similarity = 0.0
+        # Combine average and recency-weighted similarity
+        combined_similarity = (avg_similarity + recency_weighted_similarity) / 2
 
-        for i, recent in enumerate(self.recent_scenarios):
-            total_similarity += self._calculate_similarity(new_features, recent)
+        # Convert to novelty score
+        return max(0.0, 1.0 - combined_similarity)
 
-            # Recency weight: more recent scenarios have higher weight
-            recency_weight = (i + 1) / len(self.recent_scenarios)
-            recency_sim = 0.0
-            if new_features["company_type"] == recent["company_type"]:
-                recency_sim += 0.25
-            if new_features["user_segment"] == recent["user_segment"]:
-                recency_sim += 0.15
-            if new_features["primary_kpi"] == recent["primary_kpi"]:
-                recency_sim += 0.10
-            recency_weighted_similarity += recency_sim * recency_weight
+    def _sampled_score(self, codes: np.ndarray, new_codes: np.ndarray, weight_matrix: np.ndarray) -> float:
+        """
+        Novelty score with the average similarity taken over a sample.
 
-        avg_similarity = total_similarity / len(self.recent_scenarios)
+        Args:
+            codes: (features x n) history codes, oldest first
+            new_codes: Codes of the scenario being scored, one per row of codes
+            weight_matrix: (features x 2) weights matching the rows of codes
+        """
+        n = codes.shape[1]
+        k = math.isqrt(n)
 
-        # Combine average and recency-weighted similarity
-        combined_similarity = (avg_similarity + recency_weighted_similarity) / 2
+        # Deterministic, evenly spaced sample so scores are reproducible
+        sample = codes[:, ::n // k][:, :k]
+        avg_similarity = float(weight_matrix[:, 0] @ (sample == new_codes[:, None]).sum(axis=1)) / k
 
-        # Convert to novelty score
+        # Recency term over the full history, only for the features it weighs
+        recency_rows = weight_matrix[:, 1] > 0
+        recency_matches = codes[recency_rows] == new_codes[recency_rows, None]
+        recency_weighted_similarity = float(
+            weight_matrix[recency_rows, 1] @ (recency_matches @ (np.arange(1, n + 1) / n))
+        )
+
+        combined_similarity = (avg_similarity + recency_weighted_similarity) / 2
         return max(0.0, 1.0 - combined_similarity)
 
     def record_scenario(self, scenario_dto: ScenarioResponseDTO) -> None:
@@ -875,11 +1422,45 @@ class NoveltyScorer:
             scenario_dto: The scenario to record
         """
         features = self._extract_features(scenario_dto)
-        self.recent_scenarios.append(features)
-
-        # Maintain history size
-        if len(self.recent_scenarios) > self.history_size:
-            self.recent_scenarios = self.recent_scenarios[-self.history_size:]
+        if self.history_size <= 0:
+            return
+
+        if len(self.recent_scenarios) == self.history_size:
+            self._update_counts(self.recent_scenarios[0], -1)
+        self.recent_scenarios.append(features)  # deque drops the oldest when full
+        self._update_counts(features, 1)
+
+        # Encode into the ring buffer, assigning new codes on first sight
+        self._codes[:, self._head] = [
+            vocab.setdefault(value, len(vocab))
+            for value, vocab in zip(features, self._vocab)
+        ]
+        self._head = (self._head + 1) % self.history_size
+        self._count = min(self._count + 1, self.history_size)
+
+        # Evicted values keep their codes until a vocab outgrows the window,
+        # then that feature is re-encoded from the live codes (amortized O(1))
+        for row, vocab in enumerate(self._vocab):
+            if len(vocab) > 2 * self.history_size:
+                self._compact_vocab(row)
+
+    def _compact_vocab(self, row: int) -> None:
+        """Drop values no longer in the history from one feature's vocab and renumber its codes."""
+        live = self._codes[row, :self._count]
+        live_codes, new_codes = np.unique(live, return_inverse=True)
+        remap = dict(zip(live_codes.tolist(), range(len(live_codes))))
+        vocab = self._vocab[row]
+        entries = [(value, remap[code]) for value, code in vocab.items() if code in remap]
+        vocab.clear()
+        vocab.update(entries)
+        live[:] = new_codes
+
+    def _update_counts(self, features: Features, delta: int) -> None:
+        """Add (delta=1) or remove (delta=-1) one scenario from the feature counts."""
+        for value, counts in zip(self._counted_values(features), self._feature_counts.values()):
+            counts[value] += delta
+            if not counts[value]:
+                del counts[value]
 
     def get_diversity_suggestions(self, scenario_dto: ScenarioResponseDTO) -> List[str]:
         """
@@ -894,39 +1475,33 @@ class NoveltyScorer:
         if not self.recent_scenarios:
             return []
 
-        new_features = self._extract_features(scenario_dto)
-        suggestions = []
+        return self._suggest_from_features(self._extract_features(scenario_dto))
 
-        # Count occurrences of each feature in history
-        company_counts = {}
-        segment_counts = {}
-        kpi_counts = {}
-        traffic_counts = {}
+    def _suggest_from_features(self, new_features: Features) -> List[str]:
+        """Diversity suggestions for already-extracted features (non-empty history)."""
+        suggestions = []
 
-        for recent in self.recent_scenarios:
-            company_counts[recent["company_type"]] = company_counts.get(recent["company_type"], 0) + 1
-            segment_counts[recent["user_segment"]] = segment_counts.get(recent["user_segment"], 0) + 1
-            kpi_counts[recent["primary_kpi"]] = kpi_counts.get(recent["primary_kpi"], 0) + 1
-            traffic_counts[recent["traffic_tier"]] = traffic_counts.get(recent["traffic_tier"], 0) + 1
+        # Occurrences of each feature value in history; zero counts are
+        # removed, so "in" means "used at least once"
+        company_counts = self._feature_counts["company_type"]
+        segment_counts = self._feature_counts["user_segment"]
+        traffic_counts = self._feature_counts["traffic_tier"]
 
         # Suggest alternatives for overused features
-        if company_counts.get(new_features["company_type"], 0) >= 3:
-            underused = [ct for ct in ["Telehealth", "EdTech", "PropTech", "Gaming", "Logistics"]
-                        if company_counts.get(ct, 0) == 0]
+        if company_counts[new_features.company_type] >= 3:
+            underused = [ct for ct in self._CANDIDATE_COMPANY_TYPES if ct not in company_counts]
             if underused:
-                suggestions.append(f"Company type '{new_features['company_type']}' used frequently. Consider: {', '.join(underused[:3])}")
+                suggestions.append(f"Company type '{new_features.company_type}' used frequently. Consider: {', '.join(underused[:3])}")
 
-        if segment_counts.get(new_features["user_segment"], 0) >= 3:
-            underused = [seg for seg in ["power users (top 10%)", "churned users (win-back)", "enterprise accounts"]
-                        if segment_counts.get(seg, 0) == 0]
+        if segment_counts[new_features.user_segment] >= 3:
+            underused = [seg for seg in self._CANDIDATE_SEGMENTS if seg not in segment_counts]
             if underused:
                 suggestions.append(f"User segment used frequently. Consider: {', '.join(underused[:3])}")
 
-        if traffic_counts.get(new_features["traffic_tier"], 0) >= 4:
-            underused = [tier for tier in ["early_stage", "enterprise"]
-                        if traffic_counts.get(tier, 0) <= 1]
+        if traffic_counts[new_features.traffic_tier] >= 4:
+            underused = [tier for tier in self._CANDIDATE_TRAFFIC_TIERS if traffic_counts[tier] <= 1]
             if underused:
-                suggestions.append(f"Traffic tier '{new_features['traffic_tier']}' common. Consider: {', '.join(underused)}")
+                suggestions.append(f"Traffic tier '{new_features.traffic_tier}' common. Consider: {', '.join(underused)}")
 
         return suggestions
 
@@ -940,54 +1515,45 @@ class NoveltyScorer:
         if not self.recent_scenarios:
             return {"total": 0}
 
-        summary = {
-            "total": len(self.recent_scenarios),
-            "company_types": {},
-            "user_segments": {},
-            "kpis": {},
-            "traffic_tiers": {},
-            "effect_tiers": {}
-        }
-
-        # Map feature keys to summary keys
-        key_mapping = {
-            "company_type": "company_types",
-            "user_segment": "user_segments",
-            "primary_kpi": "kpis",
-            "traffic_tier": "traffic_tiers",
-            "effect_tier": "effect_tiers"
-        }
-
-        for scenario in self.recent_scenarios:
-            for feature_key, summary_key in key_mapping.items():
-                value = scenario.get(feature_key, "unknown")
-                summary[summary_key][value] = summary[summary_key].get(value, 0) + 1
+        summary = {"total": len(self.recent_scenarios)}
+        for feature, summary_key in self._SUMMARY_KEYS.items():
+            summary[summary_key] = dict(self._feature_counts[feature])
 
         return summary
 
     def clear_history(self) -> None:
         """Clear the scenario history."""
-        self.recent_scenarios = []
+        self.recent_scenarios.clear()
+        self._vocab = tuple({} for _ in self._FEATURE_NAMES)
+        self._head = 0
+        self._count = 0
+        for counts in self._feature_counts.values():
+            counts.clear()
+        self._cached_dto = None
+        self._cached_features = None
 
 
-# Global novelty scorer instance for use across the application
-_novelty_scorer: Optional[NoveltyScorer] = None
+@lru_cache(maxsize=None)
+def _shared_novelty_scorer(history_size: int) -> NoveltyScorer:
+    """Create the shared NoveltyScorer for a history size (cached)."""
+    return NoveltyScorer(history_size=history_size)
 
 
 def get_novelty_scorer(history_size: int = 20) -> NoveltyScorer:
     """
     Get the global novelty scorer instance (singleton pattern).
 
+    There is one shared instance per history size: calls with the same
+    history_size (however it is passed) return the same scorer, while a
+    different history_size gets its own scorer and history.
+
     Args:
         history_size: Number of recent scenarios to track
 
     Returns:
         The global NoveltyScorer instance
     """
-    global _novelty_scorer
-    if _novelty_scorer is None:
-        _novelty_scorer = NoveltyScorer(history_size=history_size)
-    return _novelty_scorer
+    return _shared_novelty_scorer(history_size)
 
 
 def score_scenario_novelty(scenario_dto: ScenarioResponseDTO) -> Tuple[float, List[str]]:
@@ -1001,9 +1567,10 @@ def score_scenario_novelty(scenario_dto: ScenarioResponseDTO) -> Tuple[float, Li
         Tuple of (novelty_score, list_of_suggestions)
     """
     scorer = get_novelty_scorer()
-    novelty = scorer.score_novelty(scenario_dto)
-    suggestions = scorer.get_diversity_suggestions(scenario_dto)
-    return novelty, suggestions
+    if not scorer.recent_scenarios:
+        return 1.0, []
+    features = scorer._extract_features(scenario_dto)
+    return scorer._score_from_features(features), scorer._suggest_from_features(features)
 
 
 def record_generated_scenario(scenario_dto: ScenarioResponseDTO) -> None:
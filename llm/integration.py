@@ -66,12 +66,28 @@ Dependencies:
 - core.analyze: Statistical analysis engine
 - schemas: DTOs for API boundaries
 - asyncio: Async support for concurrent operations
+- orjson (optional): Faster JSON serialization of pipeline summaries
 """
 
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+import asyncio
+import json
+import logging
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import AbstractSet, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+from dataclasses import asdict, dataclass, field, replace
 
-from .generator import LLMScenarioGenerator
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # Optional: faster summary serialization
+    orjson = None
+
+from .client import MOCK_SCENARIO_CONTENT
+from .generator import GenerationResult, LLMScenarioGenerator, create_scenario_generator
 from .parser import LLMOutputParser
 
 from core.types import DesignParams, SimResult, AnalysisResult
@@ -85,8 +101,172 @@ from core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Steps reported by LLMIntegration.stream_pipeline, in order.
+PIPELINE_STEPS = ("scenario", "design", "sample_size", "simulation", "analysis", "comparison")
 
-@dataclass
+# Sections LLMIntegration.get_pipeline_summary can include.
+SUMMARY_SECTIONS = frozenset(
+    ("scenario", "design", "sample_size", "simulation", "analysis", "comparison")
+)
+
+# simulate_trial seeds the process-wide ``random`` module, so simulations must
+# not interleave across threads; one worker keeps them off the event loop
+# while still running them one at a time. Separate processes do not share that
+# state, which is why LLMIntegration accepts a process pool instead.
+_SIMULATION_EXECUTOR = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="pipeline-simulation"
+)
+
+
+def _relative_lift(control_rate: float, treatment_rate: float) -> float:
+    """Relative lift of treatment over control; NaN when control is zero."""
+    if not control_rate:
+        return float("nan")
+    return (treatment_rate - control_rate) / control_rate
+
+
+def _conversion_rates(simulation_result: SimResult) -> Tuple[float, float, float]:
+    """Return the (control, treatment, lift) rates observed in a simulation."""
+    control_rate = simulation_result.control_conversions / simulation_result.control_n
+    treatment_rate = simulation_result.treatment_conversions / simulation_result.treatment_n
+    return control_rate, treatment_rate, _relative_lift(control_rate, treatment_rate)
+
+
+def _log_pipeline_failure(step: str, error: Exception) -> None:
+    """Log an expected step failure; the traceback is only formatted at DEBUG."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.exception("Pipeline failed in %s step: %s", step, error)
+    else:
+        logger.error("Pipeline failed in %s step: %s", step, error)
+
+
+def _copy_generation_result(generation_result: GenerationResult) -> GenerationResult:
+    """Copy a shared GenerationResult so callers cannot mutate each other's scenario."""
+    scenario_dto = generation_result.scenario_dto
+    return replace(
+        generation_result,
+        scenario_dto=scenario_dto.model_copy(deep=True) if scenario_dto is not None else None,
+        errors=list(generation_result.errors),
+        warnings=list(generation_result.warnings),
+        diversity_suggestions=list(generation_result.diversity_suggestions)
+    )
+
+
+def _numpy_scalar_to_python(value):
+    """json.dumps default hook for numpy scalars such as np.bool_ and np.int64."""
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# Not memoized: each SimResult carries one row per simulated visitor (tens of
+# MB per design) and LLM scenarios rarely repeat a DesignParams, so a cache
+# would mostly hold entries that are never hit.
+def _simulate_and_analyze(
+    design_params: DesignParams,
+    seed: int = 42
+) -> Tuple[SimResult, AnalysisResult]:
+    """Run the CPU-bound simulation and analysis steps for one design."""
+    simulation_result = simulate_trial(design_params, seed=seed)
+    return simulation_result, _analyze(simulation_result, design_params.alpha)
+
+
+def _simulated_p_value(design_params: DesignParams, seed: int) -> float:
+    """P-value of one simulated trial; the per-user rows stay in the worker."""
+    return _simulate_and_analyze(design_params, seed)[1].p_value
+
+
+def _simulated_summary(design_params: DesignParams, seed: int) -> Tuple[float, float, float, float]:
+    """(p-value, control rate, treatment rate, lift) of one simulated trial."""
+    simulation_result, analysis_result = _simulate_and_analyze(design_params, seed)
+    return (analysis_result.p_value, *_conversion_rates(simulation_result))
+
+
+def _analyze(simulation_result: SimResult, alpha: float) -> AnalysisResult:
+    """Run the analysis step on an existing simulation."""
+    return analyze_results(
+        sim_result=simulation_result,
+        alpha=alpha,
+        test_type="auto",
+        test_direction="two_tailed"
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class RateTriple:
+    """Control rate, treatment rate and relative lift (or their differences)."""
+    control: float
+    treatment: float
+    lift: float
+
+
+@dataclass(frozen=True, slots=True)
+class Comparison:
+    """
+    Simulated results compared against the LLM's expectations.
+    
+    Attributes:
+        actual (RateTriple): Rates observed in the simulation
+        expected (RateTriple): Rates the LLM expected from its simulation hints
+        differences (RateTriple): actual minus expected, field by field
+        p_value (float): P-value of the analysis
+        significant (bool): Whether p_value is below the design alpha
+        confidence_interval (Tuple[float, float]): Analysis confidence interval
+        effect_size (float): Analysis effect size
+        narrative_conclusion (str): LLM's expected conclusion
+        business_interpretation (str): LLM's business interpretation
+        risk_assessment (str): LLM's risk assessment
+        next_steps (str): LLM's recommended next steps
+    """
+    actual: RateTriple
+    expected: RateTriple
+    differences: RateTriple
+    p_value: float
+    significant: bool
+    confidence_interval: Tuple[float, float]
+    effect_size: float
+    narrative_conclusion: str
+    business_interpretation: str
+    risk_assessment: str
+    next_steps: str
+    
+    def to_dict(self) -> Dict:
+        """Nested dict form for JSON/API boundaries."""
+        actual, expected, differences = self.actual, self.expected, self.differences
+        return {
+            "conversion_rates": {
+                "actual": {
+                    "control": actual.control,
+                    "treatment": actual.treatment,
+                    "lift": actual.lift
+                },
+                "expected": {
+                    "control": expected.control,
+                    "treatment": expected.treatment,
+                    "lift": expected.lift
+                },
+                "differences": {
+                    "control_diff": differences.control,
+                    "treatment_diff": differences.treatment,
+                    "lift_diff": differences.lift
+                }
+            },
+            "statistical_results": {
+                "p_value": self.p_value,
+                "significant": self.significant,
+                "confidence_interval": self.confidence_interval,
+                "effect_size": self.effect_size
+            },
+            "llm_expectations": {
+                "narrative_conclusion": self.narrative_conclusion,
+                "business_interpretation": self.business_interpretation,
+                "risk_assessment": self.risk_assessment,
+                "next_steps": self.next_steps
+            }
+        }
+
+
+@dataclass(slots=True)
 class SimulationPipelineResult:
     """
     Comprehensive result dataclass for the complete simulation pipeline.
@@ -102,7 +282,7 @@ class SimulationPipelineResult:
         sample_size (Optional[Dict]): Sample size calculation results
         simulation_result (Optional[SimResult]): Data simulation results
         analysis_result (Optional[AnalysisResult]): Statistical analysis results
-        comparison (Optional[Dict]): LLM vs actual results comparison
+        comparison (Optional[Comparison]): LLM vs actual results comparison
         errors (List[str]): List of errors encountered during pipeline execution
         warnings (List[str]): List of warnings about the pipeline results
     
@@ -142,16 +322,66 @@ class SimulationPipelineResult:
     sample_size: Optional[Dict] = None
     simulation_result: Optional[SimResult] = None
     analysis_result: Optional[AnalysisResult] = None
-    comparison: Optional[Dict] = None
-    errors: List[str] = None
-    warnings: List[str] = None
+    comparison: Optional[Comparison] = None
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+
+@dataclass
+class PipelineResultsBatch:
+    """
+    Column-wise view of a batch of pipeline results for aggregate statistics.
+    
+    Each array has one entry per pipeline run, in batch order. Runs that did
+    not succeed hold NaN in the float columns and False in success_mask.
     
-    def __post_init__(self):
-        """Initialize empty lists for errors and warnings if None."""
-        if self.errors is None:
-            self.errors = []
-        if self.warnings is None:
-            self.warnings = []
+    Attributes:
+        p_values (np.ndarray): Analysis p-value per run
+        control_rates (np.ndarray): Observed control conversion rate per run
+        treatment_rates (np.ndarray): Observed treatment conversion rate per run
+        lifts (np.ndarray): Observed relative lift per run
+        sample_sizes (np.ndarray): Total required sample size per run
+        success_mask (np.ndarray): Whether each run succeeded
+    
+    Examples:
+        results = await integration.run_pipelines_batch(requests)
+        batch = PipelineResultsBatch.from_results(results)
+        share_significant = (batch.p_values[batch.success_mask] < 0.05).mean()
+    """
+    p_values: np.ndarray
+    control_rates: np.ndarray
+    treatment_rates: np.ndarray
+    lifts: np.ndarray
+    sample_sizes: np.ndarray
+    success_mask: np.ndarray
+    
+    @classmethod
+    def from_results(cls, results: List[SimulationPipelineResult]) -> "PipelineResultsBatch":
+        """Build the column arrays in a single pass over the results."""
+        n = len(results)
+        p_values = np.full(n, np.nan)
+        control_rates = np.full(n, np.nan)
+        treatment_rates = np.full(n, np.nan)
+        lifts = np.full(n, np.nan)
+        sample_sizes = np.full(n, np.nan)
+        success_mask = np.zeros(n, dtype=bool)
+        
+        for i, result in enumerate(results):
+            if not result.success:
+                continue
+            success_mask[i] = True
+            p_values[i] = result.analysis_result.p_value
+            control_rates[i], treatment_rates[i], lifts[i] = _conversion_rates(result.simulation_result)
+            sample_sizes[i] = result.sample_size["total"]
+        
+        return cls(
+            p_values=p_values,
+            control_rates=control_rates,
+            treatment_rates=treatment_rates,
+            lifts=lifts,
+            sample_sizes=sample_sizes,
+            success_mask=success_mask
+        )
 
 
 class LLMIntegrationError(Exception):
@@ -159,6 +389,11 @@ class LLMIntegrationError(Exception):
     pass
 
 
+# Errors a pipeline step records on its result instead of propagating; anything
+# else (TypeError, AttributeError, ...) is a bug and is left to surface.
+_PIPELINE_ERRORS = (LLMIntegrationError, ValueError, KeyError, asyncio.TimeoutError)
+
+
 class LLMIntegration:
     """
     Integration layer between LLM outputs and core simulation engine.
@@ -187,6 +422,10 @@ class LLMIntegration:
     Attributes:
         generator (LLMScenarioGenerator): Scenario generator for LLM interactions
         parser (LLMOutputParser): Parser for LLM JSON responses
+        executor (Optional[Executor]): Executor for simulation and analysis;
+            None uses a shared single-thread executor
+        generation_cache_size (int): Number of generated scenarios kept per
+            request; 0 (the default) disables the cache
     
     Examples:
         Basic pipeline:
@@ -201,6 +440,14 @@ class LLMIntegration:
         
         Pipeline summary:
             summary = integration.get_pipeline_summary(result)
+        
+        Parallel simulations across cores:
+            with ProcessPoolExecutor() as pool:
+                integration = LLMIntegration(generator, executor=pool)
+                results = await integration.run_pipelines_batch(requests)
+        
+        Reuse scenarios for repeated requests:
+            integration = LLMIntegration(generator, generation_cache_size=64)
     
     Core Integration:
         - Seamless conversion between LLM DTOs and core domain types
@@ -210,13 +457,29 @@ class LLMIntegration:
         - Comprehensive error handling and recovery
     """
     
-    def __init__(self, generator: LLMScenarioGenerator):
+    executor: Optional[Executor] = None
+    generation_cache_size: int = 0
+    
+    def __init__(
+        self,
+        generator: LLMScenarioGenerator,
+        executor: Optional[Executor] = None,
+        generation_cache_size: int = 0
+    ):
         """
         Initialize the integration layer with the provided scenario generator.
         
         Args:
             generator (LLMScenarioGenerator): The scenario generator to use for
                 LLM interactions and scenario generation
+            executor (Optional[Executor]): Executor that runs simulation and
+                analysis. Pass a ProcessPoolExecutor to spread batched
+                pipelines across cores; the caller owns its lifetime.
+            generation_cache_size (int): When positive, successful LLM
+                generations are cached per (request, max_attempts,
+                min_quality_score), and identical requests in flight share
+                one LLM call. Off by default because repeating a request is
+                usually a request for a new scenario.
         
         Note:
             The integration automatically initializes its parser for JSON
@@ -224,6 +487,10 @@ class LLMIntegration:
         """
         self.generator = generator
         self.parser = LLMOutputParser()
+        self.executor = executor
+        self.generation_cache_size = generation_cache_size
+        self._generation_cache: "OrderedDict[Tuple, GenerationResult]" = OrderedDict()
+        self._pending_generations: Dict[Tuple, asyncio.Future] = {}
     
     async def run_complete_pipeline(
         self,
@@ -243,78 +510,384 @@ class LLMIntegration:
             SimulationPipelineResult with complete pipeline results
         """
         result = SimulationPipelineResult(success=False)
+        async for _, result in self.stream_pipeline(request, max_attempts, min_quality_score):
+            pass
+        return result
+    
+    async def stream_pipeline(
+        self,
+        request: Optional[Dict] = None,
+        max_attempts: int = 3,
+        min_quality_score: float = 0.7
+    ) -> AsyncIterator[Tuple[str, SimulationPipelineResult]]:
+        """
+        Run the complete pipeline, yielding the partial result after each step.
+        
+        The same SimulationPipelineResult is yielded every time, filled in a
+        little further at each step, so a UI can show the scenario as soon as
+        it is generated instead of waiting for simulation and analysis.
+        
+        Args:
+            request: Optional scenario generation request
+            max_attempts: Maximum LLM generation attempts
+            min_quality_score: Minimum quality score for LLM output
+            
+        Yields:
+            (step, result) pairs where step is one of PIPELINE_STEPS, or
+            "failed" as the final pair when the pipeline stops early
+        """
+        result = SimulationPipelineResult(success=False)
         
         try:
             logger.info("🚀 Starting complete simulation pipeline...")
             
             # Step 1: Generate scenario with LLM
             logger.info("Step 1: Generating scenario with LLM...")
-            generation_result = await self.generator.generate_scenario(
+            generation_result = await self._generate_scenario(
                 request, max_attempts, min_quality_score
             )
+            if generation_result.success:
+                result.scenario_dto = generation_result.scenario_dto
+                result.warnings.extend(generation_result.warnings)
+                logger.info("✅ Scenario generated: %s", generation_result.scenario_dto.scenario.title)
+        except _PIPELINE_ERRORS as e:
+            _log_pipeline_failure("scenario", e)
+            result.errors.append(f"Pipeline error in scenario step: {str(e)}")
+            yield "failed", result
+            return
+        
+        if not generation_result.success:
+            result.errors.extend(generation_result.errors)
+            logger.error("LLM generation failed: %s", generation_result.errors)
+            yield "failed", result
+            return
+        
+        yield "scenario", result
+        
+        # Close the inner generator with this one, so its cleanup runs as
+        # soon as a consumer stops iterating
+        steps = self._stream_steps(result, "design")
+        try:
+            async for step_and_result in steps:
+                yield step_and_result
+        finally:
+            await steps.aclose()
+    
+    async def _generate_scenario(
+        self,
+        request: Optional[Dict],
+        max_attempts: int,
+        min_quality_score: float
+    ) -> GenerationResult:
+        """Step 1: generate a validated scenario with the LLM."""
+        if not self.generation_cache_size:
+            return await self.generator.generate_scenario(
+                request, max_attempts, min_quality_score
+            )
+        
+        key = (json.dumps(request, sort_keys=True, default=str), max_attempts, min_quality_score)
+        cached = self._generation_cache.get(key)
+        if cached is not None:
+            self._generation_cache.move_to_end(key)
+            return _copy_generation_result(cached)
+        
+        # Identical requests already in flight wait for the same LLM call
+        pending = self._pending_generations.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self.generator.generate_scenario(
+                request, max_attempts, min_quality_score
+            ))
+            self._pending_generations[key] = pending
+            # Bookkeeping runs on completion even if every caller was cancelled
+            pending.add_done_callback(
+                lambda future: self._finish_generation(key, future)
+            )
+        
+        return _copy_generation_result(await asyncio.shield(pending))
+    
+    def _finish_generation(self, key: Tuple, future: asyncio.Future) -> None:
+        """Done-callback for a shared generation: unregister it and cache a success."""
+        del self._pending_generations[key]
+        if future.cancelled() or future.exception() is not None:
+            return
+        
+        generation_result = future.result()
+        if generation_result.success and not generation_result.used_fallback:
+            self._generation_cache[key] = generation_result
+            if len(self._generation_cache) > self.generation_cache_size:
+                self._generation_cache.popitem(last=False)
+    
+    async def resume_pipeline(
+        self,
+        result: SimulationPipelineResult,
+        from_step: str = "simulation"
+    ) -> SimulationPipelineResult:
+        """
+        Re-run a pipeline from a given step, reusing the generated scenario.
+        
+        A run that failed after the LLM step keeps its scenario (and any later
+        results), so retrying only costs the CPU steps, not another LLM call.
+        Errors from the previous attempt are cleared.
+        
+        Args:
+            result: Result of an earlier run that has a scenario_dto
+            from_step: First step to re-run; any of PIPELINE_STEPS after
+                "scenario". Resuming from "analysis" reuses simulation_result
+                when the result has one and re-simulates otherwise.
             
-            if not generation_result.success:
-                result.errors.extend(generation_result.errors)
-                logger.error(f"LLM generation failed: {generation_result.errors}")
-                return result
-            
-            result.scenario_dto = generation_result.scenario_dto
-            logger.info(f"✅ Scenario generated: {generation_result.scenario_dto.scenario.title}")
+        Returns:
+            The same SimulationPipelineResult, updated in place
             
+        Raises:
+            ValueError: If from_step is unknown or its inputs are missing
+        """
+        if from_step not in PIPELINE_STEPS[1:]:
+            raise ValueError(
+                f"from_step must be one of {PIPELINE_STEPS[1:]}, got {from_step!r}"
+            )
+        if result.scenario_dto is None:
+            raise ValueError("Cannot resume a pipeline without a generated scenario")
+        if from_step != "design" and result.design_params is None:
+            raise ValueError(f"Cannot resume from {from_step!r} without design_params")
+        if from_step == "comparison" and result.analysis_result is None:
+            raise ValueError("Cannot resume from 'comparison' without analysis results")
+        
+        result.success = False
+        result.errors.clear()
+        async for _ in self._stream_steps(result, from_step):
+            pass
+        return result
+    
+    async def _stream_steps(
+        self,
+        result: SimulationPipelineResult,
+        from_step: str
+    ) -> AsyncIterator[Tuple[str, SimulationPipelineResult]]:
+        """Run steps 2-6 starting at from_step, recording which step failed."""
+        start = PIPELINE_STEPS.index(from_step)
+        step = from_step
+        log_details = logger.isEnabledFor(logging.INFO)
+        simulation_future = None
+        
+        try:
             # Step 2: Convert to core types
-            logger.info("Step 2: Converting to core domain types...")
-            design_params = self._convert_to_core_types(generation_result.scenario_dto)
-            result.design_params = design_params
-            logger.info("✅ Converted to core types")
+            if start <= 1:
+                step = "design"
+                logger.info("Step 2: Converting to core domain types...")
+                result.design_params = self._convert_to_core_types(result.scenario_dto)
+                logger.info("✅ Converted to core types")
+                yield "design", result
+            design_params = result.design_params
+            
+            # Step 4 needs only design_params: start it on the executor now so
+            # the sample size below is computed while the simulation runs.
+            # Resuming from "analysis" reuses the existing simulation.
+            executor = self.executor or _SIMULATION_EXECUTOR
+            loop = asyncio.get_running_loop()
+            run_simulation = start <= 3 or (start == 4 and result.simulation_result is None)
+            if run_simulation:
+                logger.info("Step 4: Simulating trial data...")
+                simulation_future = loop.run_in_executor(
+                    executor, simulate_trial, design_params, 42
+                )
             
             # Step 3: Calculate sample size
-            logger.info("Step 3: Calculating sample size...")
-            sample_size_result = compute_sample_size(design_params)
-            result.sample_size = {
-                "per_arm": sample_size_result.per_arm,
-                "total": sample_size_result.total,
-                "days_required": sample_size_result.days_required,
-                "power_achieved": sample_size_result.power_achieved
-            }
-            logger.info(f"✅ Sample size calculated: {sample_size_result.total} total users")
+            if start <= 2:
+                step = "sample_size"
+                logger.info("Step 3: Calculating sample size...")
+                sample_size_result = compute_sample_size(design_params)
+                result.sample_size = asdict(sample_size_result)
+                if log_details:
+                    logger.info("✅ Sample size calculated: %s total users", sample_size_result.total)
+                yield "sample_size", result
             
-            # Step 4: Simulate data
-            logger.info("Step 4: Simulating trial data...")
-            simulation_result = simulate_trial(design_params, seed=42)
-            result.simulation_result = simulation_result
-            logger.info(f"✅ Simulation completed: {simulation_result.control_conversions}/{simulation_result.control_n} vs {simulation_result.treatment_conversions}/{simulation_result.treatment_n}")
+            # Step 4: Collect the simulation
+            if run_simulation:
+                step = "simulation"
+                simulation_result = await simulation_future
+                result.simulation_result = simulation_result
+                if log_details:
+                    logger.info(
+                        "✅ Simulation completed: %s/%s vs %s/%s",
+                        simulation_result.control_conversions, simulation_result.control_n,
+                        simulation_result.treatment_conversions, simulation_result.treatment_n
+                    )
+                yield "simulation", result
             
             # Step 5: Analyze results
-            logger.info("Step 5: Analyzing results...")
-            analysis_result = analyze_results(
-                sim_result=simulation_result,
-                alpha=design_params.alpha,
-                test_type="auto",
-                test_direction="two_tailed"
-            )
-            result.analysis_result = analysis_result
-            logger.info(f"✅ Analysis completed: p-value = {analysis_result.p_value:.4f}")
+            if start <= 4:
+                step = "analysis"
+                logger.info("Step 5: Analyzing results...")
+                analysis_result = await loop.run_in_executor(
+                    executor, _analyze, result.simulation_result, design_params.alpha
+                )
+                result.analysis_result = analysis_result
+                if log_details:
+                    logger.info("✅ Analysis completed: p-value = %.4f", analysis_result.p_value)
+                yield "analysis", result
             
             # Step 6: Compare with LLM expectations
+            step = "comparison"
             logger.info("Step 6: Comparing with LLM expectations...")
-            comparison = self._compare_with_llm_expectations(
-                generation_result.scenario_dto,
-                analysis_result,
-                simulation_result
+            result.comparison = self._compare_with_llm_expectations(
+                result.scenario_dto,
+                result.analysis_result,
+                result.simulation_result
             )
-            result.comparison = comparison
             logger.info("✅ Comparison completed")
             
             result.success = True
-            result.warnings.extend(generation_result.warnings)
             
             logger.info("🎉 Complete pipeline finished successfully!")
-            return result
+            yield "comparison", result
+            
+        except _PIPELINE_ERRORS as e:
+            _log_pipeline_failure(step, e)
+            result.errors.append(f"Pipeline error in {step} step: {str(e)}")
+            yield "failed", result
+        finally:
+            # Also reached on unexpected exceptions and when the consumer stops
+            # iterating early. cancel() only stops a simulation still queued on
+            # the executor; one already running finishes and is discarded.
+            if simulation_future is not None and not simulation_future.done():
+                simulation_future.cancel()
+    
+    async def run_pipelines_batch(
+        self,
+        requests: List[Optional[Dict]],
+        max_concurrent: int = 8,
+        **kwargs
+    ) -> List[SimulationPipelineResult]:
+        """
+        Run several complete pipelines concurrently.
+        
+        Each pipeline spends most of its wall time awaiting the LLM, so up to
+        ``max_concurrent`` workers pull requests from a shared queue; a worker
+        that finishes a fast scenario picks up the next one instead of
+        waiting on slower runs.
+        
+        Args:
+            requests: Scenario generation requests, one per pipeline run
+            max_concurrent: Maximum number of pipelines in flight at once
+            **kwargs: Additional parameters for run_complete_pipeline
+            
+        Returns:
+            List of SimulationPipelineResult objects in request order; see
+            PipelineResultsBatch.from_results for aggregate statistics
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        for item in enumerate(requests):
+            queue.put_nowait(item)
+        results: List[Optional[SimulationPipelineResult]] = [None] * len(requests)
+        
+        async def _worker() -> None:
+            while True:
+                try:
+                    index, request = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    results[index] = await self.run_complete_pipeline(request, **kwargs)
+                except Exception as e:
+                    results[index] = SimulationPipelineResult(
+                        success=False,
+                        errors=[f"Pipeline error: {str(e)}"]
+                    )
+        
+        await asyncio.gather(
+            *[_worker() for _ in range(min(max_concurrent, len(requests)))]
+        )
+        return results
+    
+    def run_monte_carlo(
+        self,
+        design_params: DesignParams,
+        n_sims: int = 1000,
+        base_seed: int = 42
+    ) -> np.ndarray:
+        """
+        Simulate and analyze one design across consecutive seeds.
+        
+        Trials run on the same executor as the pipeline simulations and this
+        call blocks until they finish; a process pool runs them in parallel.
+        
+        Args:
+            design_params: Core design parameters to simulate
+            n_sims: Number of simulated trials
+            base_seed: Seed of the first trial; trial i uses base_seed + i
             
-        except (ValueError, TypeError, KeyError, ZeroDivisionError, AttributeError) as e:
-            logger.error(f"Pipeline failed: {e}")
-            result.errors.append(f"Pipeline error: {str(e)}")
-            return result
+        Returns:
+            Array of shape (n_sims,) with each trial's p-value; the share
+            below design_params.alpha estimates the achieved power
+        """
+        # Each trial is one executor job, so its seeding of the global random
+        # module cannot interleave with a pipeline's simulation
+        executor = self.executor or _SIMULATION_EXECUTOR
+        return np.fromiter(
+            executor.map(
+                _simulated_p_value,
+                repeat(design_params, n_sims),
+                range(base_seed, base_seed + n_sims)
+            ),
+            dtype=np.float64,
+            count=n_sims
+        )
+    
+    def run_sweep(
+        self,
+        design_params_list: Sequence[DesignParams],
+        simulate: bool = True,
+        seed: int = 42
+    ) -> Dict[str, np.ndarray]:
+        """
+        Size (and optionally simulate) many designs without the LLM steps.
+        
+        Simulations run on the same executor as the pipeline simulations,
+        one job per design, while the sample sizes are computed here.
+        
+        Args:
+            design_params_list: Designs to evaluate, e.g. a grid over
+                baseline_conversion_rate and target_lift_pct
+            simulate: Also simulate and analyze each design
+            seed: Simulation seed shared by every design
+            
+        Returns:
+            Dict of arrays with one entry per design: per_arm, total,
+            days_required and power_achieved, plus p_values, control_rates,
+            treatment_rates and lifts when simulate is True
+        """
+        n = len(design_params_list)
+        if simulate:
+            # Submitted up front (Executor.map queues every job immediately);
+            # one job per design keeps each seeding of the global random
+            # module from interleaving with a pipeline's simulation
+            simulations = (self.executor or _SIMULATION_EXECUTOR).map(
+                _simulated_summary, design_params_list, repeat(seed, n)
+            )
+        columns = {
+            "per_arm": np.empty(n, dtype=np.int64),
+            "total": np.empty(n, dtype=np.int64),
+            "days_required": np.empty(n, dtype=np.int64),
+            "power_achieved": np.empty(n, dtype=np.float64),
+        }
+        per_arm, total = columns["per_arm"], columns["total"]
+        days_required, power_achieved = columns["days_required"], columns["power_achieved"]
+        for i, design_params in enumerate(design_params_list):
+            sample_size = compute_sample_size(design_params)
+            per_arm[i] = sample_size.per_arm
+            total[i] = sample_size.total
+            days_required[i] = sample_size.days_required
+            power_achieved[i] = sample_size.power_achieved
+        
+        if simulate:
+            p_values = columns["p_values"] = np.empty(n, dtype=np.float64)
+            control_rates = columns["control_rates"] = np.empty(n, dtype=np.float64)
+            treatment_rates = columns["treatment_rates"] = np.empty(n, dtype=np.float64)
+            lifts = columns["lifts"] = np.empty(n, dtype=np.float64)
+            for i, summary in enumerate(simulations):
+                p_values[i], control_rates[i], treatment_rates[i], lifts[i] = summary
+        
+        return columns
     
     def _convert_to_core_types(self, scenario_dto: ScenarioResponseDTO) -> DesignParams:
         """Convert LLM DTOs to core domain types."""
@@ -325,99 +898,160 @@ class LLMIntegration:
         scenario_dto: ScenarioResponseDTO,
         analysis_result: AnalysisResult,
         simulation_result: SimResult
-    ) -> Dict:
+    ) -> Comparison:
         """Compare actual results with LLM expectations."""
         llm_expected = scenario_dto.llm_expected
         simulation_hints = llm_expected.simulation_hints
+        p_value = analysis_result.p_value
         
         # Calculate actual conversion rates
-        actual_control_rate = simulation_result.control_conversions / simulation_result.control_n
-        actual_treatment_rate = simulation_result.treatment_conversions / simulation_result.treatment_n
-        actual_lift = (actual_treatment_rate - actual_control_rate) / actual_control_rate
+        actual_control_rate, actual_treatment_rate, actual_lift = _conversion_rates(simulation_result)
         
         # LLM expected rates
         expected_control_rate = simulation_hints.control_conversion_rate
         expected_treatment_rate = simulation_hints.treatment_conversion_rate
-        expected_lift = (expected_treatment_rate - expected_control_rate) / expected_control_rate
-        
-        comparison = {
-            "conversion_rates": {
-                "actual": {
-                    "control": actual_control_rate,
-                    "treatment": actual_treatment_rate,
-                    "lift": actual_lift
-                },
-                "expected": {
-                    "control": expected_control_rate,
-                    "treatment": expected_treatment_rate,
-                    "lift": expected_lift
-                },
-                "differences": {
-                    "control_diff": actual_control_rate - expected_control_rate,
-                    "treatment_diff": actual_treatment_rate - expected_treatment_rate,
-                    "lift_diff": actual_lift - expected_lift
-                }
-            },
-            "statistical_results": {
-                "p_value": analysis_result.p_value,
-                "significant": analysis_result.p_value < scenario_dto.design_params.alpha,
-                "confidence_interval": analysis_result.confidence_interval,
-                "effect_size": analysis_result.effect_size
-            },
-            "llm_expectations": {
-                "narrative_conclusion": llm_expected.narrative_conclusion,
-                "business_interpretation": llm_expected.business_interpretation,
-                "risk_assessment": llm_expected.risk_assessment,
-                "next_steps": llm_expected.next_steps
-            }
-        }
+        expected_lift = _relative_lift(expected_control_rate, expected_treatment_rate)
         
-        return comparison
+        return Comparison(
+            actual=RateTriple(actual_control_rate, actual_treatment_rate, actual_lift),
+            expected=RateTriple(expected_control_rate, expected_treatment_rate, expected_lift),
+            differences=RateTriple(
+                actual_control_rate - expected_control_rate,
+                actual_treatment_rate - expected_treatment_rate,
+                actual_lift - expected_lift
+            ),
+            p_value=p_value,
+            significant=p_value < scenario_dto.design_params.alpha,
+            confidence_interval=analysis_result.confidence_interval,
+            effect_size=analysis_result.effect_size,
+            narrative_conclusion=llm_expected.narrative_conclusion,
+            business_interpretation=llm_expected.business_interpretation,
+            risk_assessment=llm_expected.risk_assessment,
+            next_steps=llm_expected.next_steps
+        )
     
-    def get_pipeline_summary(self, result: SimulationPipelineResult) -> Dict:
-        """Get a summary of the pipeline results."""
+    def get_pipeline_summary(
+        self,
+        result: SimulationPipelineResult,
+        fields: Optional[AbstractSet[str]] = None
+    ) -> Dict:
+        """
+        Get a summary of the pipeline results.
+        
+        Args:
+            result: Pipeline result to summarize
+            fields: Sections to include, from SUMMARY_SECTIONS; None includes
+                all of them. "status" (and "errors" for failed runs) is always
+                present.
+            
+        Returns:
+            Dict summary with one nested dict per included section
+        """
         if not result.success:
             return {"status": "failed", "errors": result.errors}
         
-        summary = {
-            "status": "success",
-            "scenario": {
-                "title": result.scenario_dto.scenario.title,
-                "company_type": result.scenario_dto.scenario.company_type,
-                "primary_kpi": result.scenario_dto.scenario.primary_kpi
-            },
-            "design": {
-                "baseline_rate": result.design_params.baseline_conversion_rate,
-                "target_lift": result.design_params.target_lift_pct,
-                "alpha": result.design_params.alpha,
-                "power": result.design_params.power,
-                "daily_traffic": result.design_params.expected_daily_traffic
-            },
-            "sample_size": result.sample_size,
-            "simulation": {
-                "control_rate": result.simulation_result.control_conversions / result.simulation_result.control_n,
-                "treatment_rate": result.simulation_result.treatment_conversions / result.simulation_result.treatment_n,
-                "actual_lift": (result.simulation_result.treatment_conversions / result.simulation_result.treatment_n - 
-                              result.simulation_result.control_conversions / result.simulation_result.control_n) / 
-                              (result.simulation_result.control_conversions / result.simulation_result.control_n)
-            },
-            "analysis": {
-                "p_value": result.analysis_result.p_value,
-                "significant": result.analysis_result.p_value < result.design_params.alpha,
-                "confidence_interval": result.analysis_result.confidence_interval
+        summary = {"status": "success"}
+        design_params = result.design_params
+        
+        if fields is None or "scenario" in fields:
+            scenario = result.scenario_dto.scenario
+            summary["scenario"] = {
+                "title": scenario.title,
+                "company_type": scenario.company_type,
+                "primary_kpi": scenario.primary_kpi
+            }
+        
+        if fields is None or "design" in fields:
+            summary["design"] = {
+                "baseline_rate": design_params.baseline_conversion_rate,
+                "target_lift": design_params.target_lift_pct,
+                "alpha": design_params.alpha,
+                "power": design_params.power,
+                "daily_traffic": design_params.expected_daily_traffic
+            }
+        
+        if fields is None or "sample_size" in fields:
+            summary["sample_size"] = result.sample_size
+        
+        if fields is None or "simulation" in fields:
+            control_rate, treatment_rate, actual_lift = _conversion_rates(result.simulation_result)
+            summary["simulation"] = {
+                "control_rate": control_rate,
+                "treatment_rate": treatment_rate,
+                "actual_lift": actual_lift
             }
-        }
         
-        if result.comparison:
+        if fields is None or "analysis" in fields:
+            analysis_result = result.analysis_result
+            p_value = analysis_result.p_value
+            summary["analysis"] = {
+                "p_value": p_value,
+                "significant": p_value < design_params.alpha,
+                "confidence_interval": analysis_result.confidence_interval
+            }
+        
+        comparison = result.comparison
+        if comparison and (fields is None or "comparison" in fields):
+            differences = comparison.differences
             summary["comparison"] = {
                 "rate_accuracy": {
-                    "control_diff": result.comparison["conversion_rates"]["differences"]["control_diff"],
-                    "treatment_diff": result.comparison["conversion_rates"]["differences"]["treatment_diff"],
-                    "lift_diff": result.comparison["conversion_rates"]["differences"]["lift_diff"]
+                    "control_diff": differences.control,
+                    "treatment_diff": differences.treatment,
+                    "lift_diff": differences.lift
                 }
             }
         
         return summary
+    
+    def get_pipeline_summary_json(
+        self,
+        result: SimulationPipelineResult,
+        fields: Optional[AbstractSet[str]] = None
+    ) -> bytes:
+        """
+        Get the pipeline summary serialized as UTF-8 JSON.
+        
+        Uses orjson when it is installed and the standard library otherwise.
+        Numpy scalars from the analysis are written as plain numbers. A NaN
+        lift is written as null by orjson and as NaN by the json fallback.
+        fields selects sections as in get_pipeline_summary.
+        """
+        summary = self.get_pipeline_summary(result, fields)
+        if orjson is not None:
+            return orjson.dumps(summary, option=orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(summary, default=_numpy_scalar_to_python).encode("utf-8")
+
+
+@lru_cache(maxsize=1)
+def _mock_scenario_dto() -> ScenarioResponseDTO:
+    """Parse the mock provider's canned scenario once."""
+    return LLMOutputParser().parse_llm_response(MOCK_SCENARIO_CONTENT).scenario_dto
+
+
+class MockLLMIntegration(LLMIntegration):
+    """
+    Integration for the mock provider that skips the LLM round-trip.
+    
+    The mock client always returns the same canned scenario, so step 1 hands
+    out a copy of that scenario parsed once, instead of paying the simulated
+    API delay, parsing, guardrail and novelty checks on every run. Pipelines
+    are then dominated by the numerical steps, which is what tests and local
+    profiling exercise.
+    """
+    
+    async def _generate_scenario(
+        self,
+        request: Optional[Dict],
+        max_attempts: int,
+        min_quality_score: float
+    ) -> GenerationResult:
+        """Step 1: return a copy of the canned mock scenario."""
+        return GenerationResult(
+            success=True,
+            scenario_dto=_mock_scenario_dto().model_copy(deep=True),
+            attempts=1,
+            quality_score=1.0
+        )
 
 
 def create_llm_integration(
@@ -438,7 +1072,7 @@ def create_llm_integration(
     Returns:
         Configured LLMIntegration instance
     """
-    from .generator import create_scenario_generator
-    
     generator = create_scenario_generator(provider, api_key, model, **kwargs)
+    if provider == "mock":
+        return MockLLMIntegration(generator)
     return LLMIntegration(generator)
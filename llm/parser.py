@@ -67,6 +67,7 @@ Usage Examples:
 
 Dependencies:
 - json: Standard JSON parsing
+- orjson (optional): Faster decoding of well-formed responses
 - re: Regular expressions for JSON extraction
 - pydantic: Schema validation and data modeling
 - schemas.scenario: Scenario DTOs for validation
@@ -76,11 +77,17 @@ Dependencies:
 import json
 import re
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 from pydantic import ValidationError
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON decoding
+    orjson = None
+
 from schemas.scenario import ScenarioResponseDTO, ScenarioDTO, LlmExpectedDTO
 from schemas.design import DesignParamsDTO
 
@@ -88,6 +95,96 @@ from core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Markdown fences the LLM may wrap its JSON in, tried in order. A bare object
+# is handled by the first-'{'/last-'}' fallback in _extract_json, which is what
+# a greedy DOTALL \{.*\} pattern matched anyway.
+_JSON_BLOCK_PATTERNS = (
+    re.compile(r'```json\s*(.*?)\s*```', re.DOTALL),  # ```json ... ```
+    re.compile(r'```\s*(.*?)\s*```', re.DOTALL),      # ``` ... ```
+)
+_TRAILING_COMMA_PATTERN = re.compile(r',(\s*[}\]])')
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _decode_json_object(content: str) -> Tuple[Optional[Dict], Optional[str]]:
+    """
+    Decode the JSON object at the start of content in a single C-level pass.
+    
+    Returns (object, None) on success or (None, error message) otherwise.
+    Anything after the object's closing brace is ignored. Uses orjson
+    when it is installed, with error messages from the standard library.
+    """
+    parsed = None
+    if orjson is not None:
+        # Fast path for the common case of content that is exactly one
+        # document; anything else falls through to the tolerant decoder
+        try:
+            parsed = orjson.loads(content)
+        except (orjson.JSONDecodeError, TypeError):
+            parsed = None
+    try:
+        if parsed is None:
+            parsed, _ = _JSON_DECODER.raw_decode(content.lstrip())
+    except json.JSONDecodeError as e:
+        return None, f"JSON parsing error: {str(e)}"
+    except (ValueError, TypeError, AttributeError) as e:
+        return None, f"Unexpected JSON error: {str(e)}"
+    if not isinstance(parsed, dict):
+        return None, "JSON root must be an object"
+    return parsed, None
+
+
+@lru_cache(maxsize=1)
+def _fallback_scenario() -> ScenarioResponseDTO:
+    """
+    Validate the hardcoded fallback scenario once per process.
+    
+    Callers get a deep copy from create_fallback_scenario, so the cached
+    instance is never handed out or mutated.
+    """
+    from schemas.shared import CompanyType, UserSegment
+    
+    fallback_data = {
+        "scenario": {
+            "title": "Fallback E-commerce Checkout Test",
+            "narrative": "A simple checkout button test for e-commerce conversion optimization.",
+            "company_type": CompanyType.ECOMMERCE,
+            "user_segment": UserSegment.ALL_USERS,
+            "primary_kpi": "conversion_rate",
+            "secondary_kpis": ["revenue_per_visitor", "cart_abandonment_rate"],
+            "unit": "visitor",
+            "assumptions": ["traffic is steady", "no seasonality", "users behave independently"]
+        },
+        "design_params": {
+            "baseline_conversion_rate": 0.025,
+            "mde_absolute": 0.005,
+            "target_lift_pct": 0.20,
+            "alpha": 0.10,
+            "power": 0.70,
+            "allocation": {"control": 0.5, "treatment": 0.5},
+            "expected_daily_traffic": 1500
+        },
+        "llm_expected": {
+            "simulation_hints": {
+                "treatment_conversion_rate": 0.030,
+                "control_conversion_rate": 0.025
+            },
+            "narrative_conclusion": "Expected 20% lift in checkout conversion with sufficient power.",
+            "business_interpretation": "Significant revenue impact from improved checkout flow.",
+            "risk_assessment": "Low risk - simple UI change with easy rollback.",
+            "next_steps": "Monitor for 2 weeks, then analyze and decide on rollout.",
+            "notes": "Fallback scenario - LLM generation failed."
+        }
+    }
+    
+    return ScenarioResponseDTO.model_validate({
+        **fallback_data,
+        "generation_metadata": {"parser": "llm_parser", "version": "1.0"},
+        "scenario_id": "scenario_fallback",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    })
+
 
 @dataclass
 class ParsingResult:
@@ -213,6 +310,9 @@ class LLMOutputParser:
         """
         self.validation_errors = []
         self.parsing_errors = []
+        # (json_content, parsed) from the last successful _extract_json, so
+        # _parse_json does not decode the same string twice
+        self._decoded: Optional[Tuple[str, Dict]] = None
     
     def parse_llm_response(self, content: str) -> ParsingResult:
         """
@@ -231,13 +331,14 @@ class LLMOutputParser:
             success=False,
             raw_content=content
         )
+        self.parsing_errors = []
         
         try:
             # Step 1: Clean and extract JSON
             json_content = self._extract_json(content)
             if not json_content:
-                logger.error("No valid JSON found in LLM response")
-                result.errors.append("No valid JSON found in LLM response")
+                logger.error(f"No valid JSON found in LLM response: {self.parsing_errors}")
+                result.errors.extend(self.parsing_errors or ["No valid JSON found in LLM response"])
                 return result
             
             logger.info(f"Extracted JSON content - Length: {len(json_content)} characters")
@@ -278,20 +379,17 @@ class LLMOutputParser:
     
     def _extract_json(self, content: str) -> Optional[str]:
         """Extract JSON from LLM response content."""
-        # Try to extract JSON from markdown code blocks first
-        json_patterns = [
-            r'```json\s*(.*?)\s*```',  # ```json ... ```
-            r'```\s*(.*?)\s*```',      # ``` ... ```
-            r'\{.*\}',                 # Raw JSON object
-        ]
+        self._decoded = None
         
-        for pattern in json_patterns:
-            matches = re.findall(pattern, content, re.DOTALL)
-            if matches:
-                json_content = matches[0].strip()
+        # Try to extract JSON from markdown code blocks first
+        for pattern in _JSON_BLOCK_PATTERNS:
+            match = pattern.search(content)
+            if match:
                 # Clean up common JSON issues
-                json_content = self._clean_json(json_content)
-                if self._is_valid_json_structure(json_content):
+                json_content = self._clean_json(match.group(1))
+                parsed, _ = _decode_json_object(json_content)
+                if parsed is not None:
+                    self._decoded = (json_content, parsed)
                     return json_content
         
         # Fallback: try to find JSON object boundaries
@@ -302,22 +400,21 @@ class LLMOutputParser:
             self.parsing_errors.append("No valid JSON found in LLM response")
             return None
         
-        json_content = content[start_idx:end_idx + 1]
-        
         # Clean up common JSON issues
-        json_content = self._clean_json(json_content)
+        json_content = self._clean_json(content[start_idx:end_idx + 1])
         
-        # Basic JSON structure validation
-        if not self._is_valid_json_structure(json_content):
-            self.parsing_errors.append("Invalid JSON structure")
+        parsed, error = _decode_json_object(json_content)
+        if parsed is None:
+            self.parsing_errors.append(error)
             return None
         
+        self._decoded = (json_content, parsed)
         return json_content
     
     def _clean_json(self, content: str) -> str:
         """Clean up common JSON formatting issues."""
         # Remove trailing commas before closing braces/brackets
-        content = re.sub(r',(\s*[}\]])', r'\1', content)
+        content = _TRAILING_COMMA_PATTERN.sub(r'\1', content)
         
         # Remove any non-printable characters
         content = ''.join(char for char in content if char.isprintable() or char.isspace())
@@ -325,57 +422,20 @@ class LLMOutputParser:
         return content.strip()
     
     def _is_valid_json_structure(self, content: str) -> bool:
-        """Check if content has valid JSON structure."""
-        try:
-            # Quick structure check without full parsing
-            if not content.strip().startswith('{') or not content.strip().endswith('}'):
-                return False
-            
-            # Check for balanced braces
-            brace_count = 0
-            in_string = False
-            escape_next = False
-            
-            for char in content:
-                if escape_next:
-                    escape_next = False
-                    continue
-                
-                if char == '\\':
-                    escape_next = True
-                    continue
-                
-                if char == '"' and not escape_next:
-                    in_string = not in_string
-                    continue
-                
-                if not in_string:
-                    if char == '{':
-                        brace_count += 1
-                    elif char == '}':
-                        brace_count -= 1
-                        if brace_count < 0:
-                            return False
-            
-            return brace_count == 0
-            
-        except (ValueError, TypeError, IndexError):
-            return False
+        """Check if content starts with a well-formed JSON object."""
+        return _decode_json_object(content)[0] is not None
 
     def _parse_json(self, json_content: str) -> Optional[Dict]:
         """Parse JSON content with error handling."""
-        try:
-            parsed = json.loads(json_content)
-            if not isinstance(parsed, dict):
-                self.parsing_errors.append("JSON root must be an object")
-                return None
-            return parsed
-        except json.JSONDecodeError as e:
-            self.parsing_errors.append(f"JSON parsing error: {str(e)}")
-            return None
-        except (ValueError, TypeError) as e:
-            self.parsing_errors.append(f"Unexpected JSON error: {str(e)}")
-            return None
+        decoded = self._decoded
+        if decoded is not None and decoded[0] is json_content:
+            self._decoded = None
+            return decoded[1]
+        
+        parsed, error = _decode_json_object(json_content)
+        if parsed is None:
+            self.parsing_errors.append(error)
+        return parsed
     
     def _validate_schema(self, data: Dict) -> Optional[ScenarioResponseDTO]:
         """Validate data against Pydantic schemas."""
@@ -391,27 +451,28 @@ class LLMOutputParser:
             
             # Validate scenario
             try:
-                scenario_dto = ScenarioDTO(**data['scenario'])
+                scenario_dto = ScenarioDTO.model_validate(data['scenario'])
             except ValidationError as e:
                 self.validation_errors.append(f"Scenario validation error: {str(e)}")
                 return None
             
             # Validate design_params
             try:
-                design_dto = DesignParamsDTO(**data['design_params'])
+                design_dto = DesignParamsDTO.model_validate(data['design_params'])
             except ValidationError as e:
                 self.validation_errors.append(f"Design params validation error: {str(e)}")
                 return None
             
             # Validate llm_expected
             try:
-                llm_expected_dto = LlmExpectedDTO(**data['llm_expected'])
+                llm_expected_dto = LlmExpectedDTO.model_validate(data['llm_expected'])
             except ValidationError as e:
                 self.validation_errors.append(f"LLM expected validation error: {str(e)}")
                 return None
             
-            # Create response DTO
-            response_dto = ScenarioResponseDTO(
+            # Children are validated above and the remaining fields are
+            # built here, so the composite skips a second validation pass
+            response_dto = ScenarioResponseDTO.model_construct(
                 scenario=scenario_dto,
                 design_params=design_dto,
                 llm_expected=llm_expected_dto,
@@ -494,39 +555,7 @@ class LLMOutputParser:
     
     def create_fallback_scenario(self) -> ScenarioResponseDTO:
         """Create a fallback scenario when LLM generation fails."""
-        from schemas.shared import CompanyType, UserSegment
-        
-        fallback_data = {
-            "scenario": {
-                "title": "Fallback E-commerce Checkout Test",
-                "narrative": "A simple checkout button test for e-commerce conversion optimization.",
-                "company_type": CompanyType.ECOMMERCE,
-                "user_segment": UserSegment.ALL_USERS,
-                "primary_kpi": "conversion_rate",
-                "secondary_kpis": ["revenue_per_visitor", "cart_abandonment_rate"],
-                "unit": "visitor",
-                "assumptions": ["traffic is steady", "no seasonality", "users behave independently"]
-            },
-            "design_params": {
-                "baseline_conversion_rate": 0.025,
-                "mde_absolute": 0.005,
-                "target_lift_pct": 0.20,
-                "alpha": 0.10,
-                "power": 0.70,
-                "allocation": {"control": 0.5, "treatment": 0.5},
-                "expected_daily_traffic": 1500
-            },
-            "llm_expected": {
-                "simulation_hints": {
-                    "treatment_conversion_rate": 0.030,
-                    "control_conversion_rate": 0.025
-                },
-                "narrative_conclusion": "Expected 20% lift in checkout conversion with sufficient power.",
-                "business_interpretation": "Significant revenue impact from improved checkout flow.",
-                "risk_assessment": "Low risk - simple UI change with easy rollback.",
-                "next_steps": "Monitor for 2 weeks, then analyze and decide on rollout.",
-                "notes": "Fallback scenario - LLM generation failed."
-            }
-        }
-        
-        return self.parse_llm_response(json.dumps(fallback_data)).scenario_dto
+        return _fallback_scenario().model_copy(
+            deep=True,
+            update={"created_at": datetime.now(timezone.utc).isoformat()}
+        )
@@ -5,6 +5,7 @@ This module contains schemas for design parameters, sample size calculations,
 and related statistical design information.
 """
 
+from functools import lru_cache
 from typing import Optional
 from pydantic import BaseModel, Field, field_validator
 
@@ -65,21 +66,40 @@ class DesignParamsDTO(BaseModel):
 
     def to_design_params(self) -> "DesignParams":
         """Convert this DTO to core DesignParams for calculations."""
-        from core.types import DesignParams, Allocation
-
-        return DesignParams(
-            baseline_conversion_rate=self.baseline_conversion_rate,
-            target_lift_pct=self.target_lift_pct,
-            alpha=self.alpha,
-            power=self.power,
-            allocation=Allocation(
-                control=self.allocation.control,
-                treatment=self.allocation.treatment,
-            ),
-            expected_daily_traffic=self.expected_daily_traffic,
+        return _core_design_params(
+            self.baseline_conversion_rate,
+            self.target_lift_pct,
+            self.alpha,
+            self.power,
+            self.allocation.control,
+            self.allocation.treatment,
+            self.expected_daily_traffic,
         )
 
 
+@lru_cache(maxsize=256)
+def _core_design_params(
+    baseline_conversion_rate: float,
+    target_lift_pct: float,
+    alpha: float,
+    power: float,
+    control: float,
+    treatment: float,
+    expected_daily_traffic: int,
+) -> "DesignParams":
+    """Build (and validate) core DesignParams once per distinct set of values."""
+    from core.types import DesignParams, Allocation
+
+    return DesignParams(
+        baseline_conversion_rate=baseline_conversion_rate,
+        target_lift_pct=target_lift_pct,
+        alpha=alpha,
+        power=power,
+        allocation=Allocation(control=control, treatment=treatment),
+        expected_daily_traffic=expected_daily_traffic,
+    )
+
+
 class SampleSizeRequestDTO(BaseModel):
     """Request to calculate sample size for a test design."""
     design_params: DesignParamsDTO = Field(description="Design parameters for the test")
@@ -1,16 +1,26 @@
 """Tests for llm.guardrails module - Parameter validation and novelty scoring."""
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
+from schemas.shared import CompanyType
 from llm.guardrails import (
     ValidationResult,
+    ValidationErrorCode,
     GuardrailError,
     LLMGuardrails,
     NoveltyScorer,
     get_novelty_scorer,
     score_scenario_novelty,
     record_generated_scenario,
+    FLAG_BASELINE_CONTROL_MISMATCH,
+    FLAG_LIFT_MISMATCH,
+    FLAG_MATH_INCONSISTENT,
+    FLAG_MDE_TOO_LARGE,
+    _build_canned_scenario_response_dto,
+    _check_consistency,
+    _quality_score,
+    _shared_novelty_scorer,
 )
 
 
@@ -87,6 +97,16 @@ class TestValidationResult:
         assert result.suggestions == []
         assert result.clamped_values == {}
 
+    def test_codes_stay_aligned_with_plain_appends(self):
+        result = ValidationResult(is_valid=False, errors=["Preset error"])
+        assert result.error_codes == [None]
+        result.errors.append("Alpha out of range")
+        result.add_error("Mathematical inconsistency: x", ValidationErrorCode.MATH_INCONSISTENT)
+        result.warnings.append("Plain warning")
+        result.add_warning("Reworded lift message", ValidationErrorCode.LIFT_AMBITIOUS)
+        assert result.error_codes == [None, None, ValidationErrorCode.MATH_INCONSISTENT]
+        assert result.warning_codes == [None, ValidationErrorCode.LIFT_AMBITIOUS]
+
     def test_provided_values_preserved(self):
         result = ValidationResult(
             is_valid=False,
@@ -100,6 +120,12 @@ class TestValidationResult:
         assert result.errors == ["err1"]
         assert result.clamped_values == {"alpha": (0.5, 0.2)}
 
+    def test_uses_slots(self):
+        result = ValidationResult(is_valid=True)
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.unexpected = True
+
 
 class TestGuardrailError:
     def test_is_exception(self):
@@ -114,6 +140,11 @@ class TestGuardrailError:
 
 
 class TestLLMGuardrailsInit:
+    def test_warmup_returns_ready_instance(self):
+        g = LLMGuardrails.warmup()
+        assert isinstance(g, LLMGuardrails)
+        assert g.validate_scenario(_build_canned_scenario_response_dto()).is_valid
+
     def test_bounds_initialized(self):
         g = LLMGuardrails()
         assert "baseline_conversion_rate" in g.bounds
@@ -140,6 +171,13 @@ class TestLLMGuardrailsInit:
         g = LLMGuardrails()
         assert len(g.effect_size_profiles) > 0
 
+    def test_tables_shared_and_read_only(self):
+        g = LLMGuardrails()
+        assert g.bounds is LLMGuardrails().bounds
+        with pytest.raises(TypeError):
+            g.bounds['alpha'] = (0.001, 0.5)
+        assert not hasattr(g, "__dict__")
+
 
 # ---------------------------------------------------------------------------
 # _validate_design_params
@@ -242,6 +280,28 @@ class TestValidateDesignParams:
         alloc_errors = [e for e in result.errors if "Allocation" in e]
         assert len(alloc_errors) == 0
 
+    def test_nan_allocation_errors(self):
+        dto = _make_scenario_dto(control_alloc=float("nan"))
+        result = ValidationResult(is_valid=True)
+        self.g._validate_design_params(dto, result)
+        assert result.error_codes == [ValidationErrorCode.ALLOCATION_SUM]
+
+    def test_error_message_includes_bounds(self):
+        dto = _make_scenario_dto(alpha=0.3)
+        result = ValidationResult(is_valid=True)
+        self.g._validate_design_params(dto, result)
+        assert "Alpha 0.3 is outside valid range [0.001, 0.2]" in result.errors
+
+    def test_errors_are_tagged_with_codes(self):
+        dto = _make_scenario_dto(alpha=0.3, control_alloc=0.6, treatment_alloc=0.6)
+        result = ValidationResult(is_valid=True)
+        self.g._validate_design_params(dto, result)
+        assert result.error_codes == [
+            ValidationErrorCode.BOUNDS_OUT_OF_RANGE,
+            ValidationErrorCode.ALLOCATION_SUM,
+        ]
+
+
 
 # ---------------------------------------------------------------------------
 # _validate_business_context
@@ -317,6 +377,15 @@ class TestValidateParameterConsistency:
         self.g._validate_parameter_consistency(dto, result)
         assert any("lift" in w.lower() for w in result.warnings)
 
+    def test_out_of_range_rates_error(self):
+        dto = _make_scenario_dto(control_rate=0.9, treatment_rate=0.0005)
+        result = ValidationResult(is_valid=True)
+        self.g._validate_parameter_consistency(dto, result)
+        assert result.errors == [
+            "control_conversion_rate 0.9 is outside valid range [0.001, 0.8]",
+            "treatment_conversion_rate 0.0005 is outside valid range [0.001, 0.8]",
+        ]
+
     def test_consistent_lift_no_warning(self):
         """Target lift matches actual lift (within tolerance)."""
         dto = _make_scenario_dto(
@@ -337,6 +406,36 @@ class TestValidateParameterConsistency:
         assert any("treatment_conversion_rate" in e for e in result.errors)
 
 
+# ---------------------------------------------------------------------------
+# _check_consistency
+# ---------------------------------------------------------------------------
+
+
+class TestCheckConsistency:
+    def test_consistent_inputs_no_flags(self):
+        assert _check_consistency(0.025, 0.025, 0.030, 0.20, 0.005) == 0
+
+    def test_baseline_control_mismatch_flag(self):
+        flags = _check_consistency(0.025, 0.050, 0.030, 0.20, 0.005)
+        assert flags & FLAG_BASELINE_CONTROL_MISMATCH
+
+    def test_lift_mismatch_flag(self):
+        flags = _check_consistency(0.025, 0.025, 0.050, 0.20, 0.005)
+        assert flags == FLAG_LIFT_MISMATCH
+
+    def test_math_inconsistent_flag(self):
+        flags = _check_consistency(0.025, 0.025, 0.0375, 0.50, 0.005)
+        assert flags == FLAG_MATH_INCONSISTENT
+
+    def test_mde_too_large_flag(self):
+        flags = _check_consistency(0.01, 0.01, 0.018, 0.80, 0.008)
+        assert flags == FLAG_MDE_TOO_LARGE
+
+    def test_zero_baseline_skips_lift_check(self):
+        flags = _check_consistency(0.0, 0.0, 0.03, 0.0, 0.005)
+        assert not flags & FLAG_LIFT_MISMATCH
+
+
 # ---------------------------------------------------------------------------
 # _validate_metric_consistency
 # ---------------------------------------------------------------------------
@@ -383,6 +482,38 @@ class TestValidateMetricConsistency:
         kpi_warnings = [w for w in result.warnings if "may not be appropriate" in w]
         assert len(kpi_warnings) == 0
 
+    def test_non_proportion_kpi_warning_text(self):
+        dto = _make_scenario_dto(primary_kpi="Revenue_Per_User")
+        result = ValidationResult(is_valid=True)
+        self.g._validate_metric_consistency(dto, result)
+        assert result.warnings[-1] == (
+            "Primary KPI 'revenue_per_user' may not be appropriate for proportion-based testing. "
+            "Consider using: ['conversion_rate', 'click_through_rate', 'engagement_rate']"
+        )
+
+
+class TestValidateConsistency:
+    def setup_method(self):
+        self.g = LLMGuardrails()
+
+    @pytest.mark.parametrize("kwargs", [
+        {},
+        {"control_rate": 0.050, "treatment_rate": 0.9, "target_lift_pct": 0.50},
+        {"baseline": 0.01, "mde_absolute": 0.008, "target_lift_pct": 0.80, "primary_kpi": "revenue"},
+        {"baseline": 0.0, "control_rate": -0.1},
+    ])
+    def test_matches_separate_validators(self, kwargs):
+        dto = _make_scenario_dto(**kwargs)
+        fused = ValidationResult(is_valid=True)
+        self.g._validate_consistency(dto, fused)
+        separate = ValidationResult(is_valid=True)
+        self.g._validate_parameter_consistency(dto, separate)
+        self.g._validate_metric_consistency(dto, separate)
+        assert fused.errors == separate.errors
+        assert fused.warnings == separate.warnings
+        assert fused.error_codes == separate.error_codes
+        assert fused.warning_codes == separate.warning_codes
+
 
 # ---------------------------------------------------------------------------
 # _validate_realism
@@ -447,6 +578,19 @@ class TestValidateRealism:
         self.g._validate_realism(dto, result)
         assert any("low" in s.lower() for s in result.suggestions)
 
+    def test_boundary_values_are_not_flagged(self):
+        dto = _make_scenario_dto(baseline=0.8, target_lift_pct=2.0, traffic=100, power=0.95)
+        result = ValidationResult(is_valid=True)
+        self.g._validate_realism(dto, result)
+        assert result.warnings == []
+        assert result.suggestions == []
+
+        dto = _make_scenario_dto(baseline=0.001, target_lift_pct=-0.5, traffic=10_000_000, power=0.6)
+        result = ValidationResult(is_valid=True)
+        self.g._validate_realism(dto, result)
+        assert result.warnings == []
+        assert result.suggestions == []
+
 
 # ---------------------------------------------------------------------------
 # validate_scenario (full pipeline)
@@ -469,15 +613,74 @@ class TestValidateScenario:
         assert result.is_valid is False
         assert len(result.errors) > 0
 
-    def test_exception_sets_invalid(self):
-        """If a validation sub-method raises, result is invalid."""
-        dto = _make_scenario_dto()
-        # Make an attribute access raise to trigger the except clause
-        dto.design_params.baseline_conversion_rate = property(lambda self: 1 / 0)
-        type(dto.design_params).baseline_conversion_rate = property(lambda self: (_ for _ in ()).throw(ValueError("boom")))
+    def test_bounds_errors_skip_later_stages(self):
+        dto = _make_scenario_dto(alpha=0.5, title="Short", primary_kpi="revenue")
+        result = self.g.validate_scenario(dto)
+        assert result.is_valid is False
+        assert result.error_codes == [ValidationErrorCode.BOUNDS_OUT_OF_RANGE]
+        assert result.warnings == []
+        assert result.quality_score > 0
+
+    def test_errors_skip_realism_warnings(self):
+        # In bounds, but mde/lift are inconsistent and power is low
+        dto = _make_scenario_dto(mde_absolute=0.02, power=0.55)
         result = self.g.validate_scenario(dto)
+        assert ValidationErrorCode.MATH_INCONSISTENT in result.error_codes
+        assert not any("Power" in s for s in result.suggestions)
+        full = LLMGuardrails(collect_all_errors=True).validate_scenario(dto)
+        assert full.errors == result.errors
+        assert any("Power" in s for s in full.suggestions)
+
+    def test_collect_all_errors_runs_every_stage(self):
+        dto = _make_scenario_dto(alpha=0.5, title="Short", primary_kpi="revenue")
+        result = LLMGuardrails(collect_all_errors=True).validate_scenario(dto)
         assert result.is_valid is False
-        assert any("Validation error" in e for e in result.errors)
+        assert any("title" in w for w in result.warnings)
+        assert any("Primary KPI" in w for w in result.warnings)
+
+    def test_malformed_dto_raises(self):
+        """Malformed DTOs are not swallowed - the error reaches the caller."""
+        dto = _make_scenario_dto()
+        type(dto.design_params).baseline_conversion_rate = property(lambda self: (_ for _ in ()).throw(ValueError("boom")))
+        with pytest.raises(ValueError, match="boom"):
+            self.g.validate_scenario(dto)
+
+
+# ---------------------------------------------------------------------------
+# validate_batch
+# ---------------------------------------------------------------------------
+
+
+class TestValidateBatch:
+    def setup_method(self):
+        self.g = LLMGuardrails()
+
+    def test_empty_batch(self):
+        assert self.g.validate_batch([]) == []
+
+    def test_matches_single_scenario_validation(self):
+        dtos = [
+            _make_scenario_dto(),
+            _make_scenario_dto(baseline=0.0001, alpha=0.5),
+            _make_scenario_dto(control_alloc=0.6, treatment_alloc=0.6),
+            _make_scenario_dto(baseline=0.025, control_rate=0.050),
+            _make_scenario_dto(target_lift_pct=0.50),
+            _make_scenario_dto(power=0.96, traffic=50),
+            _make_scenario_dto(primary_kpi="revenue_per_user", title="Short"),
+            _make_scenario_dto(mde_absolute=float("nan")),
+            _make_scenario_dto(control_alloc=float("nan")),
+        ]
+        batch = self.g.validate_batch(dtos)
+        assert len(batch) == len(dtos)
+        for dto, result in zip(dtos, batch):
+            expected = self.g.validate_scenario(dto)
+            assert result.is_valid == expected.is_valid
+            assert result.errors == expected.errors
+            assert result.error_codes == expected.error_codes
+            assert result.warnings == expected.warnings
+            assert result.warning_codes == expected.warning_codes
+            assert result.suggestions == expected.suggestions
+            assert result.quality_score == expected.quality_score
 
 
 # ---------------------------------------------------------------------------
@@ -520,6 +723,22 @@ class TestClampParameters:
         _, clamped_values = self.g.clamp_parameters(dto)
         assert "expected_daily_traffic" in clamped_values
 
+    def test_input_dto_not_modified(self):
+        dto = _make_scenario_dto(alpha=0.5)
+        clamped_dto, _ = self.g.clamp_parameters(dto)
+        assert dto.design_params.alpha == 0.5
+        assert clamped_dto.design_params.alpha == self.g.bounds["alpha"][1]
+
+    def test_copies_only_clamped_models(self):
+        base = _build_canned_scenario_response_dto()
+        dto = base.model_copy(update={"design_params": base.design_params.model_copy(update={"alpha": 0.5})})
+        clamped_dto, clamped_values = self.g.clamp_parameters(dto)
+        assert clamped_values["alpha"] == (0.5, self.g.bounds["alpha"][1])
+        assert dto.design_params.alpha == 0.5
+        assert clamped_dto.design_params is not dto.design_params
+        assert clamped_dto.llm_expected.simulation_hints is not dto.llm_expected.simulation_hints
+        assert clamped_dto.scenario is dto.scenario
+
     def test_simulation_hints_clamped(self):
         # Values must differ from bounds by more than 0.001 tolerance
         dto = _make_scenario_dto(control_rate=-0.1, treatment_rate=0.9)
@@ -527,6 +746,11 @@ class TestClampParameters:
         assert "control_conversion_rate" in clamped_values
         assert "treatment_conversion_rate" in clamped_values
 
+    def test_nan_not_reported_as_clamped(self):
+        dto = _make_scenario_dto(alpha=float("nan"))
+        _, clamped_values = self.g.clamp_parameters(dto)
+        assert "alpha" not in clamped_values
+
 
 # ---------------------------------------------------------------------------
 # generate_regeneration_hints
@@ -552,6 +776,102 @@ class TestGenerateRegenerationHints:
         hints = self.g.generate_regeneration_hints(result)
         assert any("consistency" in h.lower() for h in hints)
 
+    def test_repeated_errors_give_one_hint(self):
+        result = ValidationResult(is_valid=False, errors=[
+            "Alpha 0.5 is outside valid range [0.001, 0.2]",
+            "Power 1.0 is outside valid range [0.5, 0.99]",
+            "Allocation must sum to 1.0, got 1.2",
+            "Daily traffic 50 is outside valid range [100, 10000000]",
+        ])
+        hints = self.g.generate_regeneration_hints(result)
+        assert hints == [
+            "Ensure all parameters are within the specified bounds",
+            "Ensure allocation proportions sum to exactly 1.0",
+        ]
+
+    def test_hints_dispatch_on_codes(self):
+        result = ValidationResult(is_valid=False)
+        result.add_error("Reworded bounds message", ValidationErrorCode.BOUNDS_OUT_OF_RANGE)
+        result.add_warning("Reworded lift message", ValidationErrorCode.LIFT_AMBITIOUS)
+        hints = self.g.generate_regeneration_hints(result)
+        assert hints == [
+            "Ensure all parameters are within the specified bounds",
+            "Consider more conservative target lift values",
+        ]
+
+    def test_hints_follow_codes_after_plain_appends(self):
+        result = ValidationResult(is_valid=False)
+        result.errors.append("Allocation must sum to 1.0, got 1.2")
+        result.add_error("Reworded bounds message", ValidationErrorCode.BOUNDS_OUT_OF_RANGE)
+        hints = self.g.generate_regeneration_hints(result)
+        assert hints == [
+            "Ensure allocation proportions sum to exactly 1.0",
+            "Ensure all parameters are within the specified bounds",
+        ]
+
+    def test_hints_from_validated_scenario(self):
+        g = LLMGuardrails(collect_all_errors=True)
+        dto = _make_scenario_dto(alpha=0.3, target_lift_pct=2.5, mde_absolute=0.0625)
+        result = g.validate_scenario(dto)
+        hints = g.generate_regeneration_hints(result)
+        assert "Ensure all parameters are within the specified bounds" in hints
+        assert "Consider more conservative target lift values" in hints
+
+    # Hints before codes were recorded (substring matching on the message
+    # text) vs now. The substrings had drifted from the messages the
+    # validator emits, so mismatch, MDE-size and lift warnings only ever got
+    # the generic review hint; with codes they get their specific hint.
+    _BOUNDS = "Ensure all parameters are within the specified bounds"
+    _ALLOCATION = "Ensure allocation proportions sum to exactly 1.0"
+    _CONSISTENCY = "Ensure parameter consistency between design and expected outcomes"
+    _REALISTIC = "Use more realistic parameter values for the business context"
+    _LIFT = "Consider more conservative target lift values"
+    _REVIEW = "Review the scenario for overall realism and business context consistency"
+
+    @staticmethod
+    def _substring_hints(result):
+        """The pre-code hint logic, kept to pin the difference."""
+        hints = []
+        for error in result.errors:
+            if "outside valid range" in error:
+                hints.append("Ensure all parameters are within the specified bounds")
+            elif "must sum to 1.0" in error:
+                hints.append("Ensure allocation proportions sum to exactly 1.0")
+            elif "doesn't match" in error:
+                hints.append("Ensure parameter consistency between design and expected outcomes")
+        for warning in result.warnings:
+            if "doesn't seem to match" in warning:
+                hints.append("Ensure scenario content matches the specified company type and user segment")
+            elif "seems high" in warning or "seems low" in warning:
+                hints.append("Use more realistic parameter values for the business context")
+            elif "seems ambitious" in warning:
+                hints.append("Consider more conservative target lift values")
+        return hints or ["Review the scenario for overall realism and business context consistency"]
+
+    @pytest.mark.parametrize("kwargs, substring_hints, hints", [
+        ({}, [_REVIEW], [_REVIEW]),
+        ({"alpha": 0.3}, [_BOUNDS], [_BOUNDS]),
+        ({"control_alloc": 0.6}, [_ALLOCATION], [_ALLOCATION]),
+        ({"mde_absolute": 0.02}, [_REVIEW], [_CONSISTENCY, _REALISTIC]),
+        ({"control_rate": 0.04}, [_REVIEW], [_CONSISTENCY]),
+        ({"treatment_rate": 0.05}, [_REVIEW], [_CONSISTENCY]),
+        (
+            {"baseline": 0.02, "mde_absolute": 0.012, "target_lift_pct": 0.6,
+             "control_rate": 0.02, "treatment_rate": 0.032},
+            [_REVIEW], [_REALISTIC],
+        ),
+        (
+            {"target_lift_pct": 2.5, "mde_absolute": 0.0625, "treatment_rate": 0.0875},
+            [_BOUNDS], [_BOUNDS, _REALISTIC, _LIFT],
+        ),
+    ], ids=["valid", "bounds", "allocation", "mde_lift_inconsistent", "control_mismatch",
+            "treatment_mismatch", "mde_too_large", "ambitious_lift"])
+    def test_hints_vs_substring_matching(self, kwargs, substring_hints, hints):
+        g = LLMGuardrails(collect_all_errors=True)
+        result = g.validate_scenario(_make_scenario_dto(**kwargs))
+        assert self._substring_hints(result) == substring_hints
+        assert g.generate_regeneration_hints(result) == hints
+
     def test_no_matching_patterns_gives_default_hint(self):
         result = ValidationResult(is_valid=False, errors=["Some unknown error"])
         hints = self.g.generate_regeneration_hints(result)
@@ -611,6 +931,19 @@ class TestGetQualityScore:
         score = self.g.get_quality_score(dto)
         assert 0.0 <= score <= 1.0
 
+    def test_repeat_scores_served_from_cache(self):
+        _quality_score.cache_clear()
+        dto = _make_scenario_dto()
+        first = self.g.get_quality_score(dto)
+        assert self.g.get_quality_score(dto) == first
+        assert _quality_score.cache_info().hits == 1
+
+    def test_nan_inputs_bypass_cache(self):
+        _quality_score.cache_clear()
+        dto = _make_scenario_dto(baseline=float("nan"))
+        assert 0.0 <= self.g.get_quality_score(dto) <= 1.0
+        assert _quality_score.cache_info().currsize == 0
+
 
 # ---------------------------------------------------------------------------
 # NoveltyScorer
@@ -621,26 +954,32 @@ class TestNoveltyScorer:
     def test_init_defaults(self):
         scorer = NoveltyScorer()
         assert scorer.history_size == 20
-        assert scorer.recent_scenarios == []
+        assert list(scorer.recent_scenarios) == []
 
     def test_init_custom_history(self):
         scorer = NoveltyScorer(history_size=5)
         assert scorer.history_size == 5
 
+    def test_uses_slots(self):
+        scorer = NoveltyScorer()
+        assert not hasattr(scorer, "__dict__")
+        with pytest.raises(AttributeError):
+            scorer.unexpected = True
+
 
 class TestExtractFeatures:
     def test_extracts_all_keys(self):
         scorer = NoveltyScorer()
         dto = _make_scenario_dto()
         features = scorer._extract_features(dto)
-        assert "company_type" in features
-        assert "user_segment" in features
-        assert "primary_kpi" in features
-        assert "traffic_tier" in features
-        assert "baseline_tier" in features
-        assert "effect_tier" in features
-        assert "alpha" in features
-        assert "power" in features
+        assert "company_type" in features._fields
+        assert "user_segment" in features._fields
+        assert "primary_kpi" in features._fields
+        assert "traffic_tier" in features._fields
+        assert "baseline_tier" in features._fields
+        assert "effect_tier" in features._fields
+        assert "alpha" in features._fields
+        assert "power" in features._fields
 
     def test_traffic_tiers(self):
         scorer = NoveltyScorer()
@@ -653,7 +992,7 @@ class TestExtractFeatures:
         for traffic, expected_tier in cases:
             dto = _make_scenario_dto(traffic=traffic)
             features = scorer._extract_features(dto)
-            assert features["traffic_tier"] == expected_tier, f"traffic={traffic}"
+            assert features.traffic_tier == expected_tier, f"traffic={traffic}"
 
     def test_baseline_tiers(self):
         scorer = NoveltyScorer()
@@ -667,7 +1006,7 @@ class TestExtractFeatures:
         for baseline, expected_tier in cases:
             dto = _make_scenario_dto(baseline=baseline)
             features = scorer._extract_features(dto)
-            assert features["baseline_tier"] == expected_tier, f"baseline={baseline}"
+            assert features.baseline_tier == expected_tier, f"baseline={baseline}"
 
     def test_effect_tiers(self):
         scorer = NoveltyScorer()
@@ -680,7 +1019,35 @@ class TestExtractFeatures:
         for lift, expected_tier in cases:
             dto = _make_scenario_dto(target_lift_pct=lift)
             features = scorer._extract_features(dto)
-            assert features["effect_tier"] == expected_tier, f"lift={lift}"
+            assert features.effect_tier == expected_tier, f"lift={lift}"
+
+
+    def test_enum_and_plain_string_values(self):
+        scorer = NoveltyScorer()
+        dto = _make_scenario_dto()
+        dto.scenario.company_type = CompanyType.SAAS_B2B
+        dto.scenario.user_segment = "first-time visitors"
+        features = scorer._extract_features(dto)
+        assert features.company_type == "B2B SaaS"
+        assert features.user_segment == "first-time visitors"
+
+    def test_tier_thresholds_belong_to_upper_tier(self):
+        scorer = NoveltyScorer()
+        features = scorer._extract_features(
+            _make_scenario_dto(traffic=1000, baseline=0.05, target_lift_pct=0.50)
+        )
+        assert features.traffic_tier == "growth"
+        assert features.baseline_tier == "medium"
+        assert features.effect_tier == "transformational"
+
+    def test_features_cached_for_same_dto(self):
+        scorer = NoveltyScorer()
+        dto = _make_scenario_dto()
+        features = scorer._extract_features(dto)
+        assert scorer._extract_features(dto) is features
+        other = scorer._extract_features(_make_scenario_dto(traffic=500))
+        assert other is not features
+        assert other.traffic_tier == "early_stage"
 
 
 class TestScoreNovelty:
@@ -712,6 +1079,48 @@ class TestScoreNovelty:
         score = scorer.score_novelty(dto2)
         assert score > 0.5
 
+    def test_single_entry_history(self):
+        scorer = NoveltyScorer()
+        scorer.record_scenario(_make_scenario_dto(company_type_value="E-commerce"))
+        # Full similarity 0.75, recency term 0.25
+        score = scorer.score_novelty(_make_scenario_dto(company_type_value="SaaS"))
+        assert score == pytest.approx(0.5)
+
+    def test_entirely_unseen_scenario_is_fully_novel(self):
+        scorer = NoveltyScorer()
+        for _ in range(3):
+            scorer.record_scenario(_make_scenario_dto())
+        dto = _make_scenario_dto(
+            company_type_value="SaaS", user_segment_value="premium_users",
+            primary_kpi="engagement_rate", traffic=500000, baseline=0.40,
+            target_lift_pct=0.60, alpha=0.01, power=0.90,
+        )
+        assert scorer.score_novelty(dto) == 1.0
+
+    def test_recency_order_survives_history_wraparound(self):
+        scorer = NoveltyScorer(history_size=2)
+        for company in ("E-commerce", "SaaS", "Fintech"):
+            scorer.record_scenario(_make_scenario_dto(company_type_value=company))
+        # History is [SaaS, Fintech]: avg similarity 0.875, recency term
+        # 0.25 * 1/2 + 0.5 * 2/2 = 0.625
+        score = scorer.score_novelty(_make_scenario_dto(company_type_value="Fintech"))
+        assert score == pytest.approx(0.25)
+
+    def test_long_history_sampling(self):
+        scorer = NoveltyScorer(history_size=50)
+        for i in range(50):
+            scorer.record_scenario(_make_scenario_dto(traffic=5000 if i % 2 else 500))
+        # New company/segment/KPI, so only the sampled average term differs
+        dto = _make_scenario_dto(
+            company_type_value="SaaS", user_segment_value="premium_users",
+            primary_kpi="engagement_rate", traffic=5000,
+        )
+        exact = scorer.score_novelty(dto, exact=True)
+        sampled = scorer.score_novelty(dto)
+        assert exact == pytest.approx(1 - 0.45 / 2)
+        assert sampled == pytest.approx(exact, abs=0.01)
+        assert sampled != exact
+
     def test_novelty_score_between_0_and_1(self):
         scorer = NoveltyScorer()
         dto = _make_scenario_dto()
@@ -736,6 +1145,22 @@ class TestRecordScenario:
             scorer.record_scenario(dto)
         assert len(scorer.recent_scenarios) == 3
 
+    def test_vocab_bounded_by_history(self):
+        def make(i):
+            return _make_scenario_dto(primary_kpi=f"kpi_{i}", alpha=0.01 + i / 1000)
+
+        scorer = NoveltyScorer(history_size=3)
+        for i in range(100):
+            scorer.record_scenario(make(i))
+
+        assert all(len(vocab) <= 6 for vocab in scorer._vocab)
+        # Scores match a scorer that only ever saw the live window
+        fresh = NoveltyScorer(history_size=3)
+        for i in range(97, 100):
+            fresh.record_scenario(make(i))
+        for i in (98, 99, 100):
+            assert scorer.score_novelty(make(i)) == pytest.approx(fresh.score_novelty(make(i)))
+
 
 class TestGetDiversitySuggestions:
     def test_no_history_no_suggestions(self):
@@ -769,13 +1194,22 @@ class TestGetHistorySummary:
         assert len(summary["company_types"]) == 2
 
 
+    def test_counts_follow_evictions(self):
+        scorer = NoveltyScorer(history_size=2)
+        for company in ("E-commerce", "SaaS", "SaaS"):
+            scorer.record_scenario(_make_scenario_dto(company_type_value=company))
+        summary = scorer.get_history_summary()
+        assert summary["total"] == 2
+        assert summary["company_types"] == {"SaaS": 2}
+
+
 class TestClearHistory:
     def test_clears_all(self):
         scorer = NoveltyScorer()
         scorer.record_scenario(_make_scenario_dto())
         scorer.record_scenario(_make_scenario_dto())
         scorer.clear_history()
-        assert scorer.recent_scenarios == []
+        assert list(scorer.recent_scenarios) == []
 
 
 # ---------------------------------------------------------------------------
@@ -784,24 +1218,31 @@ class TestClearHistory:
 
 
 class TestModuleLevelFunctions:
+    def setup_method(self):
+        _shared_novelty_scorer.cache_clear()
+
+    def teardown_method(self):
+        _shared_novelty_scorer.cache_clear()
+
     def test_get_novelty_scorer_singleton(self):
         """get_novelty_scorer returns the same instance on repeated calls."""
-        with patch("llm.guardrails._novelty_scorer", None):
-            scorer1 = get_novelty_scorer()
-            scorer2 = get_novelty_scorer()
-            assert scorer1 is scorer2
+        scorer1 = get_novelty_scorer()
+        scorer2 = get_novelty_scorer(history_size=20)
+        assert scorer1 is scorer2
+
+    def test_get_novelty_scorer_per_history_size(self):
+        scorer = get_novelty_scorer(history_size=5)
+        assert scorer.history_size == 5
+        assert scorer is not get_novelty_scorer()
 
     def test_score_scenario_novelty_returns_tuple(self):
-        with patch("llm.guardrails._novelty_scorer", None):
-            dto = _make_scenario_dto()
-            novelty, suggestions = score_scenario_novelty(dto)
-            assert isinstance(novelty, float)
-            assert isinstance(suggestions, list)
+        dto = _make_scenario_dto()
+        novelty, suggestions = score_scenario_novelty(dto)
+        assert isinstance(novelty, float)
+        assert isinstance(suggestions, list)
 
     def test_record_generated_scenario_adds_to_history(self):
-        with patch("llm.guardrails._novelty_scorer", None):
-            scorer = get_novelty_scorer()
-            scorer.clear_history()
-            dto = _make_scenario_dto()
-            record_generated_scenario(dto)
-            assert len(scorer.recent_scenarios) == 1
+        scorer = get_novelty_scorer()
+        dto = _make_scenario_dto()
+        record_generated_scenario(dto)
+        assert len(scorer.recent_scenarios) == 1
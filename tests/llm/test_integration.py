@@ -1,14 +1,32 @@
 """Tests for llm.integration module - LLM pipeline integration."""
 
+import asyncio
+import json
+import math
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 
+from core.types import SampleSize
 from llm.integration import (
+    PIPELINE_STEPS,
+    SUMMARY_SECTIONS,
+    Comparison,
     LLMIntegration,
     LLMIntegrationError,
+    MockLLMIntegration,
+    PipelineResultsBatch,
+    RateTriple,
     SimulationPipelineResult,
     create_llm_integration,
+    _mock_scenario_dto,
+    _simulate_and_analyze,
 )
+from llm.generator import GenerationResult
 
 
 # ---------------------------------------------------------------------------
@@ -68,12 +86,7 @@ def _make_core_design_params():
 
 
 def _make_sample_size_result():
-    ssr = Mock()
-    ssr.per_arm = 3000
-    ssr.total = 6000
-    ssr.days_required = 2
-    ssr.power_achieved = 0.82
-    return ssr
+    return SampleSize(per_arm=3000, total=6000, days_required=2, power_achieved=0.82)
 
 
 def _make_sim_result():
@@ -122,10 +135,43 @@ class TestSimulationPipelineResult:
         assert result.warnings == []
         assert result.scenario_dto is None
 
-    def test_none_lists_initialized(self):
-        result = SimulationPipelineResult(success=True, errors=None, warnings=None)
-        assert result.errors == []
-        assert result.warnings == []
+    def test_uses_slots(self):
+        result = SimulationPipelineResult(success=False)
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.unexpected = True
+
+    def test_default_lists_not_shared(self):
+        first = SimulationPipelineResult(success=False)
+        second = SimulationPipelineResult(success=False)
+        first.errors.append("boom")
+        first.warnings.append("careful")
+        assert second.errors == []
+        assert second.warnings == []
+
+
+class TestPipelineResultsBatch:
+    def test_columns_from_results(self):
+        ok = SimulationPipelineResult(success=True)
+        ok.analysis_result = _make_analysis_result()
+        ok.simulation_result = _make_sim_result()
+        ok.sample_size = {"per_arm": 3000, "total": 6000, "days_required": 2, "power_achieved": 0.82}
+        failed = SimulationPipelineResult(success=False, errors=["LLM failed"])
+
+        batch = PipelineResultsBatch.from_results([ok, failed])
+
+        assert batch.success_mask.tolist() == [True, False]
+        assert batch.p_values[0] == pytest.approx(0.03)
+        assert batch.control_rates[0] == pytest.approx(0.025)
+        assert batch.treatment_rates[0] == pytest.approx(0.03)
+        assert batch.lifts[0] == pytest.approx(0.2)
+        assert batch.sample_sizes[0] == 6000
+        assert np.isnan([batch.p_values[1], batch.lifts[1], batch.sample_sizes[1]]).all()
+
+    def test_empty_batch(self):
+        batch = PipelineResultsBatch.from_results([])
+        assert batch.p_values.shape == (0,)
+        assert batch.success_mask.dtype == bool
 
 
 class TestLLMIntegrationError:
@@ -167,6 +213,82 @@ class TestRunCompletePipeline:
         assert result.scenario_dto is scenario_dto
         assert result.design_params is core_dp
         assert result.analysis_result is analysis
+        assert result.sample_size == {
+            "per_arm": 3000, "total": 6000, "days_required": 2, "power_achieved": 0.82
+        }
+
+    @pytest.mark.asyncio
+    async def test_simulation_runs_off_event_loop(self, integration):
+        """Simulation and analysis run on the simulation worker thread."""
+        scenario_dto = _make_scenario_dto()
+        integration.generator.generate_scenario = AsyncMock(
+            return_value=_make_generation_result(success=True, scenario_dto=scenario_dto)
+        )
+        scenario_dto.design_params.to_design_params = Mock(return_value=_make_core_design_params())
+        threads = []
+
+        def fake_simulate(design_params, seed):
+            threads.append(threading.current_thread())
+            return _make_sim_result()
+
+        with patch("llm.integration.compute_sample_size", return_value=_make_sample_size_result()):
+            with patch("llm.integration.simulate_trial", side_effect=fake_simulate):
+                with patch("llm.integration.analyze_results", return_value=_make_analysis_result()):
+                    result = await integration.run_complete_pipeline()
+
+        assert result.success is True
+        assert threads[0] is not threading.current_thread()
+        assert threads[0].name.startswith("pipeline-simulation")
+
+    @pytest.mark.asyncio
+    async def test_simulation_uses_injected_executor(self, integration):
+        scenario_dto = _make_scenario_dto()
+        integration.generator.generate_scenario = AsyncMock(
+            return_value=_make_generation_result(success=True, scenario_dto=scenario_dto)
+        )
+        scenario_dto.design_params.to_design_params = Mock(return_value=_make_core_design_params())
+        threads = []
+
+        def fake_simulate(design_params, seed):
+            threads.append(threading.current_thread().name)
+            return _make_sim_result()
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="injected") as pool:
+            integration.executor = pool
+            with patch("llm.integration.compute_sample_size", return_value=_make_sample_size_result()):
+                with patch("llm.integration.simulate_trial", side_effect=fake_simulate):
+                    with patch("llm.integration.analyze_results", return_value=_make_analysis_result()):
+                        result = await integration.run_complete_pipeline()
+
+        assert result.success is True
+        assert threads[0].startswith("injected")
+
+    @pytest.mark.asyncio
+    async def test_sample_size_overlaps_simulation(self, integration):
+        """The simulation is already running while the sample size is computed."""
+        scenario_dto = _make_scenario_dto()
+        integration.generator.generate_scenario = AsyncMock(
+            return_value=_make_generation_result(success=True, scenario_dto=scenario_dto)
+        )
+        scenario_dto.design_params.to_design_params = Mock(return_value=_make_core_design_params())
+        simulation_started = threading.Event()
+        overlapped = []
+
+        def fake_simulate(design_params, seed):
+            simulation_started.set()
+            return _make_sim_result()
+
+        def fake_sample_size(design_params):
+            overlapped.append(simulation_started.wait(timeout=5))
+            return _make_sample_size_result()
+
+        with patch("llm.integration.compute_sample_size", side_effect=fake_sample_size):
+            with patch("llm.integration.simulate_trial", side_effect=fake_simulate):
+                with patch("llm.integration.analyze_results", return_value=_make_analysis_result()):
+                    result = await integration.run_complete_pipeline()
+
+        assert result.success is True
+        assert overlapped == [True]
 
     @pytest.mark.asyncio
     async def test_pipeline_fails_on_generation_failure(self, integration):
@@ -195,6 +317,422 @@ class TestRunCompletePipeline:
         assert result.success is False
         assert any("Pipeline error" in e for e in result.errors)
 
+    @pytest.mark.asyncio
+    async def test_pipeline_propagates_unexpected_errors(self, integration):
+        """Programming errors are not recorded as pipeline failures."""
+        scenario_dto = _make_scenario_dto()
+        integration.generator.generate_scenario = AsyncMock(
+            return_value=_make_generation_result(success=True, scenario_dto=scenario_dto)
+        )
+        scenario_dto.design_params.to_design_params = Mock(side_effect=TypeError("bug"))
+
+        with pytest.raises(TypeError):
+            await integration.run_complete_pipeline()
+
+    @pytest.mark.asyncio
+    async def test_pipeline_records_timeouts(self, integration):
+        integration.generator.generate_scenario = AsyncMock(side_effect=asyncio.TimeoutError())
+
+        result = await integration.run_complete_pipeline()
+
+        assert result.success is False
+        assert result.errors[0].startswith("Pipeline error in scenario step")
+
+
+class TestStreamPipeline:
+
+    @pytest.mark.asyncio
+    async def test_yields_each_step_in_order(self, integration):
+        scenario_dto = _make_scenario_dto()
+        integration.generator.generate_scenario = AsyncMock(
+            return_value=_make_generation_result(success=True, scenario_dto=scenario_dto)
+        )
+        scenario_dto.design_params.to_design_params = Mock(return_value=_make_core_design_params())
+        seen = []
+
+        with patch("llm.integration.compute_sample_size", return_value=_make_sample_size_result()):
+            with patch("llm.integration.simulate_trial", return_value=_make_sim_result()):
+                with patch("llm.integration.analyze_results", return_value=_make_analysis_result()):
+                    async for step, result in integration.stream_pipeline():
+                        seen.append((step, result.scenario_dto is scenario_dto, result.success))
+
+        assert tuple(step for step, _, _ in seen) == PIPELINE_STEPS
+        assert all(has_scenario for _, has_scenario, _ in seen)
+        assert [success for _, _, success in seen] == [False] * 5 + [True]
+
+    def _queued_simulation_integration(self, integration):
+        """Integration whose executor is busy, so the simulation stays queued."""
+        scenario_dto = _make_scenario_dto()
+        integration.generator.generate_scenario = AsyncMock(
+            return_value=_make_generation_result(success=True, scenario_dto=scenario_dto)
+        )
+        scenario_dto.design_params.to_design_params = Mock(return_value=_make_core_design_params())
+        blocker = threading.Event()
+        integration.executor = ThreadPoolExecutor(max_workers=1)
+        integration.executor.submit(blocker.wait)
+        return blocker
+
+    @pytest.mark.asyncio
+    async def test_early_exit_cancels_queued_simulation(self, integration):
+        blocker = self._queued_simulation_integration(integration)
+
+        with patch("llm.integration.compute_sample_size", return_value=_make_sample_size_result()):
+            with patch("llm.integration.simulate_trial") as simulate:
+                stream = integration.stream_pipeline()
+                async for step, _ in stream:
+                    if step == "sample_size":
+                        break
+                await stream.aclose()
+                await asyncio.sleep(0)  # cancellation reaches the executor via the loop
+                blocker.set()
+                integration.executor.shutdown(wait=True)
+
+        simulate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_cancels_queued_simulation(self, integration):
+        blocker = self._queued_simulation_integration(integration)
+
+        with patch("llm.integration.compute_sample_size", side_effect=TypeError("bad design")):
+            with patch("llm.integration.simulate_trial") as simulate:
+                with pytest.raises(TypeError):
+                    async for _ in integration.stream_pipeline():
+                        pass
+                await asyncio.sleep(0)
+                blocker.set()
+                integration.executor.shutdown(wait=True)
+
+        simulate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failure_is_last_step(self, integration):
+        integration.generator.generate_scenario = AsyncMock(
+            return_value=_make_generation_result(success=False, errors=["LLM failed"])
+        )
+
+        steps = [step async for step, _ in integration.stream_pipeline()]
+
+        assert steps == ["failed"]
+
+
+class TestResumePipeline:
+
+    @pytest.mark.asyncio
+    async def test_failed_step_is_named_and_resumable(self, integration):
+        scenario_dto = _make_scenario_dto()
+        integration.generator.generate_scenario = AsyncMock(
+            return_value=_make_generation_result(success=True, scenario_dto=scenario_dto)
+        )
+        scenario_dto.design_params.to_design_params = Mock(return_value=_make_core_design_params())
+
+        with patch("llm.integration.compute_sample_size", return_value=_make_sample_size_result()):
+            with patch("llm.integration.simulate_trial", side_effect=ValueError("bad sim")):
+                result = await integration.run_complete_pipeline()
+
+        assert result.success is False
+        assert result.errors == ["Pipeline error in simulation step: bad sim"]
+        assert result.scenario_dto is scenario_dto
+        assert result.sample_size["total"] == 6000
+
+        with patch("llm.integration.simulate_trial", return_value=_make_sim_result()):
+            with patch("llm.integration.analyze_results", return_value=_make_analysis_result()):
+                resumed = await integration.resume_pipeline(result, from_step="simulation")
+
+        assert resumed is result
+        assert result.success is True
+        assert result.errors == []
+        assert result.comparison is not None
+        integration.generator.generate_scenario.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_analysis_failure_is_named_and_resumes_without_resimulating(self, integration):
+        scenario_dto = _make_scenario_dto()
+        integration.generator.generate_scenario = AsyncMock(
+            return_value=_make_generation_result(success=True, scenario_dto=scenario_dto)
+        )
+        scenario_dto.design_params.to_design_params = Mock(return_value=_make_core_design_params())
+        sim_result = _make_sim_result()
+
+        with patch("llm.integration.compute_sample_size", return_value=_make_sample_size_result()):
+            with patch("llm.integration.simulate_trial", return_value=sim_result):
+                with patch("llm.integration.analyze_results", side_effect=ValueError("bad analysis")):
+                    result = await integration.run_complete_pipeline()
+
+        assert result.errors == ["Pipeline error in analysis step: bad analysis"]
+        assert result.simulation_result is sim_result
+
+        with patch("llm.integration.simulate_trial") as simulate:
+            with patch("llm.integration.analyze_results", return_value=_make_analysis_result()) as analyze:
+                await integration.resume_pipeline(result, from_step="analysis")
+
+        simulate.assert_not_called()
+        assert analyze.call_args.kwargs["sim_result"] is sim_result
+        assert result.success is True
+        assert result.simulation_result is sim_result
+
+    @pytest.mark.asyncio
+    async def test_rejects_unknown_step(self, integration):
+        result = SimulationPipelineResult(success=False, scenario_dto=_make_scenario_dto())
+        with pytest.raises(ValueError):
+            await integration.resume_pipeline(result, from_step="scenario")
+
+    @pytest.mark.asyncio
+    async def test_requires_generated_scenario(self, integration):
+        with pytest.raises(ValueError):
+            await integration.resume_pipeline(SimulationPipelineResult(success=False), "design")
+
+
+class TestGenerationCache:
+
+    def _cached_integration(self, size=2):
+        generator = AsyncMock()
+        generation = GenerationResult(
+            success=True, scenario_dto=_mock_scenario_dto().model_copy(deep=True)
+        )
+        generator.generate_scenario = AsyncMock(return_value=generation)
+        return LLMIntegration(generator, generation_cache_size=size), generation
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, integration):
+        integration.generator.generate_scenario = AsyncMock(
+            return_value=_make_generation_result(success=False, errors=["LLM failed"])
+        )
+        await integration._generate_scenario({"a": 1}, 3, 0.7)
+        await integration._generate_scenario({"a": 1}, 3, 0.7)
+        assert integration.generator.generate_scenario.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_repeat_request_hits_cache(self):
+        integ, generation = self._cached_integration()
+
+        first = await integ._generate_scenario({"a": 1, "b": 2}, 3, 0.7)
+        second = await integ._generate_scenario({"b": 2, "a": 1}, 3, 0.7)
+        await integ._generate_scenario({"a": 1, "b": 2}, 3, 0.9)
+
+        assert first.scenario_dto == second.scenario_dto == generation.scenario_dto
+        assert integ.generator.generate_scenario.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_are_independent_copies(self):
+        integ, generation = self._cached_integration()
+
+        first = await integ._generate_scenario(None, 3, 0.7)
+        first.scenario_dto.scenario.title = "Changed"
+        first.warnings.append("changed")
+        second = await integ._generate_scenario(None, 3, 0.7)
+
+        assert first is not second
+        assert second.scenario_dto.scenario.title == generation.scenario_dto.scenario.title
+        assert second.warnings == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_collapse(self):
+        integ, generation = self._cached_integration()
+
+        results = await asyncio.gather(
+            *[integ._generate_scenario(None, 3, 0.7) for _ in range(5)]
+        )
+
+        assert len({id(r.scenario_dto) for r in results}) == 5
+        assert all(r.scenario_dto == generation.scenario_dto for r in results)
+        integ.generator.generate_scenario.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_still_caches_result(self):
+        integ, generation = self._cached_integration()
+        release = asyncio.Event()
+
+        async def slow_generate(*args):
+            await release.wait()
+            return generation
+
+        integ.generator.generate_scenario = AsyncMock(side_effect=slow_generate)
+        owner = asyncio.ensure_future(integ._generate_scenario(None, 3, 0.7))
+        await asyncio.sleep(0)
+        owner.cancel()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await owner
+        await asyncio.sleep(0)
+
+        await integ._generate_scenario(None, 3, 0.7)
+
+        integ.generator.generate_scenario.assert_awaited_once()
+        assert integ._pending_generations == {}
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self):
+        integ, _ = self._cached_integration(size=1)
+
+        await integ._generate_scenario({"a": 1}, 3, 0.7)
+        await integ._generate_scenario({"a": 2}, 3, 0.7)
+        await integ._generate_scenario({"a": 1}, 3, 0.7)
+
+        assert integ.generator.generate_scenario.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_failures_not_cached(self):
+        generator = AsyncMock()
+        generator.generate_scenario = AsyncMock(
+            return_value=GenerationResult(success=False, errors=["LLM failed"])
+        )
+        integ = LLMIntegration(generator, generation_cache_size=4)
+
+        await integ._generate_scenario(None, 3, 0.7)
+        await integ._generate_scenario(None, 3, 0.7)
+
+        assert generator.generate_scenario.await_count == 2
+
+
+class TestRunPipelinesBatch:
+
+    @pytest.mark.asyncio
+    async def test_results_in_request_order(self, integration):
+        """Each request gets its own result, in the order submitted."""
+        integration.generator.generate_scenario = AsyncMock(
+            side_effect=lambda request, *args: _make_generation_result(
+                success=False, errors=[request["name"]]
+            )
+        )
+
+        results = await integration.run_pipelines_batch(
+            [{"name": "a"}, {"name": "b"}, {"name": "c"}], max_concurrent=2
+        )
+
+        assert [r.errors for r in results] == [["a"], ["b"], ["c"]]
+
+    @pytest.mark.asyncio
+    async def test_exception_becomes_failed_result(self, integration):
+        """An unexpected exception in one run does not abort the batch."""
+        integration.generator.generate_scenario = AsyncMock(
+            side_effect=[
+                RuntimeError("boom"),
+                _make_generation_result(success=False, errors=["LLM failed"]),
+            ]
+        )
+
+        results = await integration.run_pipelines_batch([None, None], max_concurrent=1)
+
+        assert results[0].success is False
+        assert results[0].errors == ["Pipeline error: boom"]
+        assert results[1].errors == ["LLM failed"]
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self, integration):
+        assert await integration.run_pipelines_batch([]) == []
+
+
+class TestSimulateAndAnalyze:
+
+    def test_repeated_design_is_not_memoized(self):
+        design_params = _make_core_design_params()
+        with patch("llm.integration.simulate_trial", side_effect=lambda *a, **k: _make_sim_result()) as sim:
+            with patch("llm.integration.analyze_results", return_value=_make_analysis_result()):
+                first = _simulate_and_analyze(design_params, 42)
+                second = _simulate_and_analyze(design_params, 42)
+
+        assert first[0] is not second[0]
+        assert sim.call_count == 2
+
+    def test_picklable_for_process_pools(self):
+        assert pickle.loads(pickle.dumps(_simulate_and_analyze)) is _simulate_and_analyze
+
+
+class TestRunMonteCarlo:
+
+    def test_p_value_per_seed(self, integration):
+        seeds = []
+
+        def fake_simulate(design_params, seed):
+            seeds.append(seed)
+            return _make_sim_result()
+
+        analyses = [Mock(p_value=p) for p in (0.01, 0.2, 0.04)]
+        with patch("llm.integration.simulate_trial", side_effect=fake_simulate):
+            with patch("llm.integration.analyze_results", side_effect=analyses):
+                p_values = integration.run_monte_carlo(
+                    _make_core_design_params(), n_sims=3, base_seed=10
+                )
+
+        assert seeds == [10, 11, 12]
+        assert p_values.shape == (3,)
+        assert p_values.tolist() == [0.01, 0.2, 0.04]
+
+    def test_runs_on_simulation_executor(self, integration):
+        threads = []
+
+        def fake_simulate(design_params, seed):
+            threads.append(threading.current_thread().name)
+            return _make_sim_result()
+
+        with patch("llm.integration.simulate_trial", side_effect=fake_simulate):
+            with patch("llm.integration.analyze_results", return_value=Mock(p_value=0.5)):
+                integration.run_monte_carlo(_make_core_design_params(), n_sims=2)
+
+        assert all(name.startswith("pipeline-simulation") for name in threads)
+
+
+class TestRunSweep:
+
+    def _designs(self):
+        from core.types import Allocation, DesignParams
+
+        return [
+            DesignParams(
+                baseline_conversion_rate=0.05,
+                target_lift_pct=lift,
+                alpha=0.05,
+                power=0.8,
+                allocation=Allocation(0.5, 0.5),
+                expected_daily_traffic=1000,
+            )
+            for lift in (0.1, 0.2, 0.4)
+        ]
+
+    def test_sample_size_columns_match_scalar(self, integration):
+        from core.design import compute_sample_size
+
+        designs = self._designs()
+        columns = integration.run_sweep(designs, simulate=False)
+
+        assert set(columns) == {"per_arm", "total", "days_required", "power_achieved"}
+        for i, design in enumerate(designs):
+            expected = compute_sample_size(design)
+            assert columns["per_arm"][i] == expected.per_arm
+            assert columns["total"][i] == expected.total
+            assert columns["days_required"][i] == expected.days_required
+            assert columns["power_achieved"][i] == expected.power_achieved
+        assert (np.diff(columns["per_arm"]) < 0).all()
+
+    def test_simulated_columns(self, integration):
+        seeds = []
+
+        def fake_simulate(design_params, seed):
+            seeds.append(seed)
+            return _make_sim_result()
+
+        with patch("llm.integration.simulate_trial", side_effect=fake_simulate):
+            with patch("llm.integration.analyze_results", return_value=_make_analysis_result()):
+                columns = integration.run_sweep(self._designs(), seed=7)
+
+        assert seeds == [7, 7, 7]
+        assert columns["p_values"].tolist() == [0.03] * 3
+        assert columns["lifts"] == pytest.approx([0.2] * 3)
+
+    def test_simulations_run_on_simulation_executor(self, integration):
+        threads = []
+
+        def fake_simulate(design_params, seed):
+            threads.append(threading.current_thread().name)
+            return _make_sim_result()
+
+        with patch("llm.integration.simulate_trial", side_effect=fake_simulate):
+            with patch("llm.integration.analyze_results", return_value=_make_analysis_result()):
+                integration.run_sweep(self._designs())
+
+        assert len(threads) == 3
+        assert all(name.startswith("pipeline-simulation") for name in threads)
+
 
 class TestConvertToCoreTypes:
     """Tests for DTO-to-core conversion (now delegates to DTO method)."""
@@ -233,13 +771,128 @@ class TestGetPipelineSummary:
         assert "scenario" in summary
         assert "design" in summary
         assert "analysis" in summary
+        assert summary["simulation"]["control_rate"] == pytest.approx(0.025)
+        assert summary["simulation"]["treatment_rate"] == pytest.approx(0.030)
+        assert summary["simulation"]["actual_lift"] == pytest.approx(0.2)
+
+    def test_summary_selected_fields(self, integration):
+        result = SimulationPipelineResult(success=True)
+        result.scenario_dto = _make_scenario_dto()
+        result.design_params = _make_core_design_params()
+        result.sample_size = {"per_arm": 3000, "total": 6000, "days_required": 2, "power_achieved": 0.82}
+        result.simulation_result = _make_sim_result()
+        result.analysis_result = _make_analysis_result()
+
+        full = integration.get_pipeline_summary(result)
+        summary = integration.get_pipeline_summary(result, fields=frozenset({"analysis"}))
+
+        assert set(full) == {"status"} | (SUMMARY_SECTIONS - {"comparison"})
+        assert set(summary) == {"status", "analysis"}
+        assert summary["analysis"] == full["analysis"]
+
+
+class TestCompareWithLLMExpectations:
+
+    def test_zero_control_conversions_give_nan_lift(self, integration):
+        sim = _make_sim_result()
+        sim.control_conversions = 0
+
+        comparison = integration._compare_with_llm_expectations(
+            _make_scenario_dto(), _make_analysis_result(), sim
+        )
+
+        assert comparison.actual.control == 0.0
+        assert comparison.actual.treatment == pytest.approx(0.03)
+        assert math.isnan(comparison.actual.lift)
+
+    def test_comparison_fields(self, integration):
+        comparison = integration._compare_with_llm_expectations(
+            _make_scenario_dto(), _make_analysis_result(), _make_sim_result()
+        )
+
+        assert isinstance(comparison, Comparison)
+        assert comparison.actual == RateTriple(0.025, 0.03, pytest.approx(0.2))
+        assert comparison.differences.control == pytest.approx(0.0)
+        assert comparison.differences.lift == pytest.approx(0.0)
+        assert comparison.significant is True
+        assert comparison.next_steps == "Monitor."
+        assert not hasattr(comparison, "__dict__")
+
+    def test_to_dict_nested_shape(self, integration):
+        comparison = integration._compare_with_llm_expectations(
+            _make_scenario_dto(), _make_analysis_result(), _make_sim_result()
+        )
+
+        data = comparison.to_dict()
+
+        assert set(data) == {"conversion_rates", "statistical_results", "llm_expectations"}
+        assert data["conversion_rates"]["actual"]["lift"] == pytest.approx(0.2)
+        assert data["conversion_rates"]["differences"]["control_diff"] == pytest.approx(0.0)
+        assert data["statistical_results"]["p_value"] == 0.03
+        assert data["llm_expectations"]["next_steps"] == "Monitor."
+
+
+class TestGetPipelineSummaryJson:
+
+    def _make_result(self):
+        result = SimulationPipelineResult(success=True)
+        result.scenario_dto = _make_scenario_dto()
+        result.design_params = _make_core_design_params()
+        result.sample_size = {"per_arm": 3000, "total": 6000, "days_required": 2, "power_achieved": 0.82}
+        result.simulation_result = _make_sim_result()
+        analysis = _make_analysis_result()
+        analysis.p_value = np.float64(0.03)
+        result.analysis_result = analysis
+        return result
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_round_trips_summary(self, integration, use_orjson):
+        import llm.integration as integration_module
+
+        if use_orjson and integration_module.orjson is None:
+            pytest.skip("orjson not installed")
+        result = self._make_result()
+        with patch.object(integration_module, "orjson",
+                          integration_module.orjson if use_orjson else None):
+            payload = integration.get_pipeline_summary_json(result)
+
+        decoded = json.loads(payload)
+        assert isinstance(payload, bytes)
+        assert decoded["status"] == "success"
+        assert decoded["analysis"]["significant"] is True
+        assert decoded["analysis"]["p_value"] == pytest.approx(0.03)
+        assert decoded["sample_size"]["total"] == 6000
 
 
 class TestCreateLLMIntegration:
     """Tests for the factory function."""
 
     def test_create_returns_integration(self):
-        with patch("llm.generator.create_scenario_generator") as mock_create:
+        with patch("llm.integration.create_scenario_generator") as mock_create:
             mock_create.return_value = Mock()
             integ = create_llm_integration(provider="mock")
             assert isinstance(integ, LLMIntegration)
+
+    def test_mock_provider_returns_mock_integration(self):
+        integ = create_llm_integration(provider="mock")
+        assert isinstance(integ, MockLLMIntegration)
+
+
+class TestMockLLMIntegration:
+
+    @pytest.mark.asyncio
+    async def test_pipeline_skips_llm(self):
+        generator = AsyncMock()
+        integ = MockLLMIntegration(generator)
+
+        with patch("llm.integration.compute_sample_size", return_value=_make_sample_size_result()):
+            with patch("llm.integration.simulate_trial", return_value=_make_sim_result()):
+                with patch("llm.integration.analyze_results", return_value=_make_analysis_result()):
+                    first = await integ.run_complete_pipeline()
+                    second = await integ.run_complete_pipeline()
+
+        generator.generate_scenario.assert_not_called()
+        assert first.success is True
+        assert first.scenario_dto.scenario.title == "Mock E-commerce Checkout Button Test"
+        assert first.scenario_dto == second.scenario_dto
+        assert first.scenario_dto is not second.scenario_dto
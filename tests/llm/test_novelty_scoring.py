@@ -335,7 +335,7 @@ class TestFeatureExtraction:
 
         features = scorer._extract_features(scenario)
 
-        assert features["traffic_tier"] == "early_stage"
+        assert features.traffic_tier == "early_stage"
 
     @pytest.mark.unit
     def test_traffic_tier_extraction_growth(self):
@@ -345,7 +345,7 @@ class TestFeatureExtraction:
 
         features = scorer._extract_features(scenario)
 
-        assert features["traffic_tier"] == "growth"
+        assert features.traffic_tier == "growth"
 
     @pytest.mark.unit
     def test_traffic_tier_extraction_scale(self):
@@ -355,7 +355,7 @@ class TestFeatureExtraction:
 
         features = scorer._extract_features(scenario)
 
-        assert features["traffic_tier"] == "scale"
+        assert features.traffic_tier == "scale"
 
     @pytest.mark.unit
     def test_traffic_tier_extraction_enterprise(self):
@@ -365,7 +365,7 @@ class TestFeatureExtraction:
 
         features = scorer._extract_features(scenario)
 
-        assert features["traffic_tier"] == "enterprise"
+        assert features.traffic_tier == "enterprise"
 
     @pytest.mark.unit
     def test_baseline_tier_extraction(self):
@@ -374,23 +374,23 @@ class TestFeatureExtraction:
 
         # Very low baseline
         scenario1 = create_mock_scenario(baseline=0.005)
-        assert scorer._extract_features(scenario1)["baseline_tier"] == "very_low"
+        assert scorer._extract_features(scenario1).baseline_tier == "very_low"
 
         # Low baseline
         scenario2 = create_mock_scenario(baseline=0.03)
-        assert scorer._extract_features(scenario2)["baseline_tier"] == "low"
+        assert scorer._extract_features(scenario2).baseline_tier == "low"
 
         # Medium baseline
         scenario3 = create_mock_scenario(baseline=0.10)
-        assert scorer._extract_features(scenario3)["baseline_tier"] == "medium"
+        assert scorer._extract_features(scenario3).baseline_tier == "medium"
 
         # High baseline
         scenario4 = create_mock_scenario(baseline=0.20)
-        assert scorer._extract_features(scenario4)["baseline_tier"] == "high"
+        assert scorer._extract_features(scenario4).baseline_tier == "high"
 
         # Very high baseline
         scenario5 = create_mock_scenario(baseline=0.40)
-        assert scorer._extract_features(scenario5)["baseline_tier"] == "very_high"
+        assert scorer._extract_features(scenario5).baseline_tier == "very_high"
 
     @pytest.mark.unit
     def test_effect_tier_extraction(self):
@@ -399,16 +399,16 @@ class TestFeatureExtraction:
 
         # Incremental
         scenario1 = create_mock_scenario(target_lift=0.03)
-        assert scorer._extract_features(scenario1)["effect_tier"] == "incremental"
+        assert scorer._extract_features(scenario1).effect_tier == "incremental"
 
         # Moderate
         scenario2 = create_mock_scenario(target_lift=0.10)
-        assert scorer._extract_features(scenario2)["effect_tier"] == "moderate"
+        assert scorer._extract_features(scenario2).effect_tier == "moderate"
 
         # Significant
         scenario3 = create_mock_scenario(target_lift=0.30)
-        assert scorer._extract_features(scenario3)["effect_tier"] == "significant"
+        assert scorer._extract_features(scenario3).effect_tier == "significant"
 
         # Transformational
         scenario4 = create_mock_scenario(target_lift=0.80)
-        assert scorer._extract_features(scenario4)["effect_tier"] == "transformational"
+        assert scorer._extract_features(scenario4).effect_tier == "transformational"
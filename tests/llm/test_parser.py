@@ -2,8 +2,10 @@
 
 import json
 import pytest
+from unittest.mock import patch
 
 from llm.parser import LLMOutputParser, ParsingResult
+from schemas.scenario import ScenarioResponseDTO
 
 
 @pytest.fixture
@@ -98,6 +100,18 @@ class TestExtractJson:
         result = parser._extract_json("")
         assert result is None
 
+    def test_malformed_candidate_records_decode_error(self, parser):
+        result = parser._extract_json('Result: {"key": value}')
+        assert result is None
+        assert parser.parsing_errors[-1].startswith("JSON parsing error")
+
+    def test_extracted_json_is_decoded_once(self, parser):
+        json_content = parser._extract_json('```json\n{"key": "value"}\n```')
+        with patch("llm.parser._JSON_DECODER") as decoder:
+            parsed = parser._parse_json(json_content)
+        assert parsed == {"key": "value"}
+        decoder.raw_decode.assert_not_called()
+
 
 class TestCleanJson:
     """Tests for JSON cleanup."""
@@ -152,6 +166,14 @@ class TestParseJson:
         assert result is None
         assert len(parser.parsing_errors) > 0
 
+    def test_parse_without_orjson(self, parser):
+        with patch("llm.parser.orjson", None):
+            assert parser._parse_json('{"key": "value"}') == {"key": "value"}
+            assert parser._parse_json('{invalid}') is None
+
+    def test_parse_ignores_trailing_text(self, parser):
+        assert parser._parse_json('{"key": 1} trailing') == {"key": 1}
+
     def test_parse_non_object(self, parser):
         """JSON arrays should be rejected (root must be object)."""
         result = parser._parse_json('[1, 2, 3]')
@@ -210,6 +232,17 @@ class TestValidateSchema:
         result = parser._validate_schema(data)
         assert result is None
 
+    def test_non_object_section_fails(self, parser):
+        data = dict(VALID_SCENARIO_JSON)
+        data["scenario"] = ["not", "an", "object"]
+        assert parser._validate_schema(data) is None
+        assert parser.validation_errors[0].startswith("Scenario validation error")
+
+    def test_constructed_response_revalidates(self, parser):
+        result = parser._validate_schema(VALID_SCENARIO_JSON)
+        revalidated = ScenarioResponseDTO.model_validate(result.model_dump())
+        assert revalidated == result
+
 
 class TestValidateBusinessLogic:
     """Tests for business logic validation."""
@@ -327,6 +360,13 @@ class TestCreateFallbackScenario:
         assert 0 < dp.baseline_conversion_rate < 1
         assert dp.expected_daily_traffic > 0
 
+    def test_fallback_returns_independent_copies(self, parser):
+        first = parser.create_fallback_scenario()
+        first.scenario.assumptions.append("mutated")
+        second = parser.create_fallback_scenario()
+        assert second is not first
+        assert "mutated" not in second.scenario.assumptions
+
 
 class TestGetParsingSuggestions:
     """Tests for parsing error suggestions."""
@@ -30,3 +30,22 @@ class TestDesignParamsDTO:
                 expected_daily_traffic=5000
             )
 
+
+    @pytest.mark.unit
+    def test_to_design_params_reuses_core_params(self, standard_allocation_dto):
+        def make():
+            return DesignParamsDTO(
+                baseline_conversion_rate=0.025,
+                mde_absolute=0.005,
+                target_lift_pct=0.20,
+                alpha=0.05,
+                power=0.80,
+                allocation=standard_allocation_dto,
+                expected_daily_traffic=5000
+            )
+
+        first = make().to_design_params()
+        assert make().to_design_params() is first
+        assert first.baseline_conversion_rate == 0.025
+        assert first.allocation.control == standard_allocation_dto.control
+        assert first.expected_daily_traffic == 5000
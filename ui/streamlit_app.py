@@ -151,6 +151,11 @@ def initialize_session_state():
     if 'interpretation_answers' not in st.session_state:
         st.session_state.interpretation_answers = {}
 
+@st.cache_resource
+def get_guardrails():
+    """Create the shared guardrails once per process, warmed up at startup."""
+    return LLMGuardrails.warmup()
+
 def generate_scenario():
     """Generate a new A/B test scenario."""
     logger.info("🚀 Starting scenario generation...")
@@ -184,7 +189,7 @@ def generate_scenario():
             logger.info("✅ Parsing successful, validating with guardrails...")
             
             # Validate with guardrails
-            guardrails = LLMGuardrails()
+            guardrails = get_guardrails()
             validation_result = guardrails.validate_scenario(parse_result.scenario_dto)
             
             if not validation_result.is_valid:
@@ -1086,6 +1091,7 @@ def score_design_answers(user_answers, scenario_data, sample_size_result):
 def main():
     """Main Streamlit app."""
     initialize_session_state()
+    get_guardrails()
     
     # Sidebar
     with st.sidebar: